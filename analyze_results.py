@@ -1,7 +1,12 @@
+import json
 import os
 import re
+import sys
 from pathlib import Path
 
+# pareado.resumo_pareado (python/src) resume os arquivos pareados
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'python' / 'src'))
+
 def parse_log_file(filename):
 
     if not os.path.exists(filename):
@@ -19,6 +24,9 @@ def parse_log_file(filename):
     avg_iter_match = re.search(r'Iterações médias: ([\d.]+)', content)
     total_iter_match = re.search(r'Iterações totais: (\d+)', content)
     
+    # Pico de memória por execução (presente apenas em logs gerados com --memoria)
+    memories = [r['memory_kb'] for r in parse_runs(content) if r['memory_kb'] is not None]
+    
     return {
         'language': lang_match.group(1) if lang_match else 'N/A',
         'size': size_match.group(1) if size_match else 'N/A',
@@ -28,9 +36,81 @@ def parse_log_file(filename):
         'avg_time': float(avg_time_match.group(1)) if avg_time_match else 0.0,
         'total_time': float(total_time_match.group(1)) if total_time_match else 0.0,
         'avg_iterations': float(avg_iter_match.group(1)) if avg_iter_match else 0.0,
-        'total_iterations': int(total_iter_match.group(1)) if total_iter_match else 0
+        'total_iterations': int(total_iter_match.group(1)) if total_iter_match else 0,
+        'avg_memory_kb': sum(memories) / len(memories) if memories else None,
+        'max_memory_kb': max(memories) if memories else None
     }
 
+def parse_runs(content):
+    """Extrai as medidas de cada execução ('Execução N:' ...) do conteúdo de um log."""
+    runs = []
+    for block in re.split(r'\n(?=Execução \d+:)', content)[1:]:
+        run_match = re.match(r'Execução (\d+):', block)
+        time_match = re.search(r'Tempo: ([\d.]+) segundos', block)
+        iter_match = re.search(r'Iterações: (\d+)', block)
+        empty_match = re.search(r'Células vazias: (\d+)', block)
+        solved_match = re.search(r'Resolvido: (\w+)', block)
+        # Python: pico do tracemalloc na resolução; C: pico de RSS do processo
+        memory_match = re.search(r'(?:Memória de pico \(tracemalloc\)|RSS de pico): ([\d.]+) KB', block)
+        if not (run_match and time_match and iter_match):
+            continue
+        runs.append({
+            'run': int(run_match.group(1)),
+            'time': float(time_match.group(1)),
+            'iterations': int(iter_match.group(1)),
+            'solved': solved_match is not None and solved_match.group(1) == 'Sim',
+            'empty': int(empty_match.group(1)) if empty_match else 0,
+            'memory_kb': float(memory_match.group(1)) if memory_match else None
+        })
+    return runs
+
+def parse_pareado_file(filename):
+    """
+    Resume um logs/pareado_{size}_{case}.jsonl (driver.py pareado) com
+    pareado.resumo_pareado(), o mesmo resumo impresso pelo driver.
+    """
+    if not os.path.exists(filename):
+        return None
+    
+    from pareado import resumo_pareado
+    with open(filename) as f:
+        registros = [json.loads(linha) for linha in f if linha.strip()]
+    resumo = resumo_pareado(registros)
+    return resumo if resumo['pares'] else None
+
+# Nome do tamanho (main.SIZE_MAP) -> dimensão, como aparece em 'Tamanho: NxN' nos logs
+SIZE_DIMENSIONS = {'small': 4, '6x6': 6, 'medium': 9, '12x12': 12, 'large': 16}
+
+def results_from_archive(path, configs):
+    """
+    Os mesmos dados de parse_log_file() para cada configuração, lidos do
+    índice de logs/resultados.npz (arquivo_resultados.py), sem descomprimir
+    nenhuma coluna.
+    """
+    from arquivo_resultados import ArquivoResultados
+    
+    results = []
+    with ArquivoResultados(path) as archive:
+        for lang, size, case in configs:
+            rows = archive.agregados(linguagem=lang, tamanho=size, caso=case, motor='padrao')
+            if not rows:
+                continue
+            r = rows[0]
+            results.append({
+                'language': 'C' if lang == 'c' else 'Python',
+                'size': str(SIZE_DIMENSIONS[size]),
+                'case': case,
+                'successful': r['resolvidas'],
+                'total_runs': r['execucoes'],
+                'avg_time': r['tempo_medio'],
+                'total_time': r['tempo_total'],
+                'avg_iterations': r['iteracoes_medias'],
+                'total_iterations': r['iteracoes_totais'],
+                'avg_memory_kb': r['memoria_media_kb'],
+                'max_memory_kb': r['memoria_max_kb']
+            })
+    return results
+
 def main():
     logs_dir = Path('logs')
     
@@ -39,27 +119,28 @@ def main():
         print("Execute 'make run-all' para gerar os logs primeiro.")
         return
     
-    configs = [
-        ('c', 'small', 'best'),
-        ('c', 'small', 'worst'),
-        ('c', 'medium', 'best'),
-        ('c', 'medium', 'worst'),
-        ('c', 'large', 'best'),
-        ('c', 'large', 'worst'),
-        ('python', 'small', 'best'),
-        ('python', 'small', 'worst'),
-        ('python', 'medium', 'best'),
-        ('python', 'medium', 'worst'),
-        ('python', 'large', 'best'),
-        ('python', 'large', 'worst'),
-    ]
+    # Do menor para o maior tamanho (6x6 e 12x12 só aparecem se tiverem logs)
+    sizes = tuple(SIZE_DIMENSIONS)
+    configs = [(lang, size, case) for lang in ('c', 'python') for size in sizes
+               for case in ('best', 'worst')]
     
-    results = []
-    for lang, size, case in configs:
-        filename = logs_dir / f"{lang}_{size}_{case}.log"
-        data = parse_log_file(filename)
-        if data:
-            results.append(data)
+    # O arquivo colunar evita reler os logs com expressões regulares, desde que
+    # nenhum log seja mais novo que ele (senão os logs continuam sendo a fonte)
+    from arquivo_resultados import arquivo_atualizado
+    archive = logs_dir / 'resultados.npz'
+    if arquivo_atualizado(archive, logs_dir):
+        print(f"📦 Lendo resultados de {archive}")
+        results = results_from_archive(archive, configs)
+    else:
+        if archive.exists():
+            print(f"⚠ {archive} é mais antigo que os logs; lendo os logs "
+                  "(atualize com: python3 arquivo_resultados.py compactar)")
+        results = []
+        for lang, size, case in configs:
+            filename = logs_dir / f"{lang}_{size}_{case}.log"
+            data = parse_log_file(filename)
+            if data:
+                results.append(data)
     
     if not results:
         print("❌ Nenhum log encontrado!")
@@ -116,6 +197,59 @@ def main():
                     speedup
                 ))
     
+    paired = []
+    for size in sizes:
+        for case in ('best', 'worst'):
+            data = parse_pareado_file(logs_dir / f"pareado_{size}_{case}.jsonl")
+            if data:
+                paired.append((f"{size.capitalize()} {case.capitalize()}", data))
+    
+    if paired:
+        print("\n" + "="*100)
+        print("⚖️  C vs PYTHON PAREADO (driver.py pareado)")
+        print("="*100)
+        print("  Mesmos puzzles, em paralelo e com o mesmo relógio (tempo de CPU da thread)\n")
+        
+        print("{:<15} {:<9} {:<15} {:<17} {:<17} {:<18} {:<10}".format(
+            "Configuração", "Puzzles", "C total (s)", "Python total (s)", "Speedup (total)",
+            "Speedup (mediano)", "Iter. iguais"
+        ))
+        print("-"*100)
+        
+        for key, data in paired:
+            print("{:<15} {:<9} {:<15.6f} {:<17.6f} {:<17} {:<18} {:<10}".format(
+                key,
+                data['pares'],
+                data['tempo_c'],
+                data['tempo_python'],
+                f"{data['total']:.2f}x",
+                f"{data['mediano']:.2f}x",
+                f"{data['iteracoes_iguais']}/{data['pares']}"
+            ))
+    
+    with_memory = [r for r in results if r['avg_memory_kb'] is not None]
+    if with_memory:
+        print("\n" + "="*100)
+        print("💾 MEMÓRIA DE PICO (logs gerados com --memoria)")
+        print("="*100)
+        print("  Python: pico de alocações do tracemalloc durante cada resolução")
+        print("  C:      pico de RSS do processo (inclui o próprio executável)\n")
+        
+        print("{:<10} {:<8} {:<8} {:<18} {:<18} {:<18}".format(
+            "Linguagem", "Tamanho", "Caso", "Pico médio (KB)", "Pico máximo (KB)", "Tempo Médio (s)"
+        ))
+        print("-"*100)
+        
+        for r in with_memory:
+            print("{:<10} {:<8} {:<8} {:<18.1f} {:<18.1f} {:<18.6f}".format(
+                r['language'],
+                r['size'] + 'x' + r['size'],
+                r['case'],
+                r['avg_memory_kb'],
+                r['max_memory_kb'],
+                r['avg_time']
+            ))
+    
     print("\n" + "="*100)
     print("🔬 ANÁLISE DE COMPLEXIDADE")
     print("="*100)
@@ -133,7 +267,7 @@ def main():
             size_groups[size] = {}
         size_groups[size][case] = r
     
-    for size, cases in sorted(size_groups.items()):
+    for size, cases in sorted(size_groups.items(), key=lambda item: int(item[0])):
         if 'best' in cases and 'worst' in cases:
             best = cases['best']
             worst = cases['worst']
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Arquivo colunar comprimido dos resultados por execução.
+
+Compacta os logs de logs/ num único arquivo no layout .npz do NumPy (um zip
+com um membro .npy comprimido por coluna), escrito e lido só com a biblioteca
+padrão; np.load() também abre o arquivo. As execuções ficam agrupadas por
+configuração (linguagem, tamanho, caso, motor), e cada grupo tem as próprias
+colunas:
+
+    {grupo}/execucao.npy    int32
+    {grupo}/vazias.npy      int32
+    {grupo}/tempo.npy       float64
+    {grupo}/iteracoes.npy   int64
+    {grupo}/resolvido.npy   bool
+    {grupo}/memoria_kb.npy  float64 (NaN sem --memoria)
+    indice.json             grupos e seus agregados
+
+O índice guarda, para cada grupo, contagens, somas, mínimos e máximos; os
+agregados de uma consulta saem só dele, sem descomprimir nenhuma coluna.
+colunas() descomprime apenas as colunas pedidas dos grupos que passam no
+filtro. analyze_results.py e plot/plot_results.py leem do arquivo quando ele
+está atualizado (não é mais antigo que nenhum log).
+
+Uso:
+    python3 arquivo_resultados.py compactar [--logs logs] [--saida logs/resultados.npz]
+    python3 arquivo_resultados.py consultar [--linguagem c] [--tamanho medium] [--caso worst]
+                                            [--motor padrao] [--arquivo logs/resultados.npz]
+"""
+
+import argparse
+import array
+import ast
+import json
+import math
+import struct
+import sys
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from analyze_results import parse_runs
+
+PROJECT_ROOT = Path(__file__).parent
+ARQUIVO_PADRAO = PROJECT_ROOT / 'logs' / 'resultados.npz'
+VERSAO = 1
+
+# Coluna -> (dtype do .npy, typecode de array.array)
+COLUNAS = {
+    'execucao': ('<i4', 'i'),
+    'vazias': ('<i4', 'i'),
+    'tempo': ('<f8', 'd'),
+    'iteracoes': ('<i8', 'q'),
+    'resolvido': ('|b1', 'B'),
+    'memoria_kb': ('<f8', 'd'),
+}
+TYPECODES = dict(COLUNAS.values())
+
+class Grupo(NamedTuple):
+    """Uma configuração no arquivo, com os agregados do índice"""
+    nome: str
+    linguagem: str
+    tamanho: str
+    caso: str
+    motor: str
+    agregados: Dict[str, Any]
+
+# ---------------------------------------------------------------------------
+# Formato .npy
+# ---------------------------------------------------------------------------
+
+def _npy(dtype: str, valores: array.array) -> bytes:
+    """Serializa um vetor 1-D no formato .npy (versão 1.0, little-endian)."""
+    if sys.byteorder == 'big' and valores.itemsize > 1:
+        valores = array.array(valores.typecode, valores)
+        valores.byteswap()
+    cabecalho = f"{{'descr': '{dtype}', 'fortran_order': False, 'shape': ({len(valores)},), }}"
+    # O cabeçalho termina em '\n' e alinha os dados em 64 bytes
+    tamanho = len(cabecalho) + 1
+    cabecalho += ' ' * (-(10 + tamanho) % 64) + '\n'
+    return (b'\x93NUMPY\x01\x00' + struct.pack('<H', len(cabecalho))
+            + cabecalho.encode('latin1') + valores.tobytes())
+
+def _ler_npy(dados: bytes) -> array.array:
+    if dados[:6] != b'\x93NUMPY':
+        raise ValueError("membro não está no formato .npy")
+    if dados[6] == 1:
+        (tamanho,), inicio = struct.unpack('<H', dados[8:10]), 10
+    else:
+        (tamanho,), inicio = struct.unpack('<I', dados[8:12]), 12
+    cabecalho = ast.literal_eval(dados[inicio:inicio + tamanho].decode('latin1'))
+    valores = array.array(TYPECODES[cabecalho['descr']])
+    valores.frombytes(dados[inicio + tamanho:])
+    if sys.byteorder == 'big' and valores.itemsize > 1:
+        valores.byteswap()
+    return valores
+
+# ---------------------------------------------------------------------------
+# Escrita
+# ---------------------------------------------------------------------------
+
+def _config_do_nome(path: Path) -> Optional[Sequence[str]]:
+    """(linguagem, tamanho, caso, motor) a partir de {lang}_{size}_{case}[_{motor}].log"""
+    partes = path.stem.split('_', 3)
+    if len(partes) < 3:
+        return None
+    return partes[0], partes[1], partes[2], partes[3] if len(partes) > 3 else 'padrao'
+
+def _agregados(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Agregados do índice: tempo e iterações das execuções resolvidas, memória de todas."""
+    resolvidas = [r for r in runs if r['solved']]
+    tempos = [r['time'] for r in resolvidas]
+    memorias = [r['memory_kb'] for r in runs if r['memory_kb'] is not None]
+    return {
+        'execucoes': len(runs),
+        'resolvidas': len(resolvidas),
+        'tempo_soma': sum(tempos),
+        'tempo_soma_quadrados': sum(t * t for t in tempos),
+        'tempo_min': min(tempos, default=0.0),
+        'tempo_max': max(tempos, default=0.0),
+        'iteracoes_soma': sum(r['iterations'] for r in resolvidas),
+        'iteracoes_max': max((r['iterations'] for r in resolvidas), default=0),
+        'memoria_execucoes': len(memorias),
+        'memoria_soma': sum(memorias),
+        'memoria_max': max(memorias, default=0.0),
+    }
+
+def compactar(logs_dir: Path, saida: Path) -> int:
+    """Grava todos os logs de 'logs_dir' em 'saida'; retorna o número de configurações."""
+    grupos = []
+    temporario = saida.with_name(saida.name + '.tmp')
+    with zipfile.ZipFile(temporario, 'w', zipfile.ZIP_DEFLATED) as arquivo:
+        for path in sorted(Path(logs_dir).glob('*.log')):
+            config = _config_do_nome(path)
+            if config is None:
+                continue
+            runs = parse_runs(path.read_text())
+            if not runs:
+                continue
+            nome = '_'.join(config)
+            colunas = {
+                'execucao': [r['run'] for r in runs],
+                'vazias': [r['empty'] for r in runs],
+                'tempo': [r['time'] for r in runs],
+                'iteracoes': [r['iterations'] for r in runs],
+                'resolvido': [int(r['solved']) for r in runs],
+                'memoria_kb': [math.nan if r['memory_kb'] is None else r['memory_kb'] for r in runs],
+            }
+            for coluna, valores in colunas.items():
+                dtype, typecode = COLUNAS[coluna]
+                arquivo.writestr(f"{nome}/{coluna}.npy", _npy(dtype, array.array(typecode, valores)))
+            linguagem, tamanho, caso, motor = config
+            grupos.append({'nome': nome, 'linguagem': linguagem, 'tamanho': tamanho, 'caso': caso,
+                           'motor': motor, 'agregados': _agregados(runs)})
+        arquivo.writestr('indice.json', json.dumps({'versao': VERSAO, 'grupos': grupos}))
+    temporario.replace(saida)
+    return len(grupos)
+
+def arquivo_atualizado(arquivo: Path, logs_dir: Path) -> bool:
+    """True se 'arquivo' existe e não é mais antigo que nenhum log de 'logs_dir'."""
+    if not arquivo.exists():
+        return False
+    mtime = arquivo.stat().st_mtime_ns
+    return all(log.stat().st_mtime_ns <= mtime for log in Path(logs_dir).glob('*.log'))
+
+# ---------------------------------------------------------------------------
+# Consulta
+# ---------------------------------------------------------------------------
+
+class ArquivoResultados:
+    """Leitura seletiva de um arquivo gravado por compactar()."""
+
+    def __init__(self, path: Path = ARQUIVO_PADRAO):
+        self._zip = zipfile.ZipFile(path)
+        indice = json.loads(self._zip.read('indice.json'))
+        if indice.get('versao') != VERSAO:
+            raise ValueError(f"versão do arquivo não suportada: {indice.get('versao')}")
+        self._grupos = [Grupo(**g) for g in indice['grupos']]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self) -> None:
+        self._zip.close()
+
+    def grupos(self, linguagem: Optional[str] = None, tamanho: Optional[str] = None,
+               caso: Optional[str] = None, motor: Optional[str] = None) -> List[Grupo]:
+        """Configurações que passam no filtro (None aceita qualquer valor)."""
+        return [g for g in self._grupos
+                if linguagem in (None, g.linguagem) and tamanho in (None, g.tamanho)
+                and caso in (None, g.caso) and motor in (None, g.motor)]
+
+    def agregados(self, **filtro) -> List[Dict[str, Any]]:
+        """
+        Médias, desvio-padrão e extremos de cada configuração do filtro,
+        calculados só a partir do índice (nenhuma coluna é descomprimida).
+        """
+        linhas = []
+        for g in self.grupos(**filtro):
+            a = g.agregados
+            n = a['resolvidas']
+            media = a['tempo_soma'] / n if n else 0.0
+            variancia = (a['tempo_soma_quadrados'] - n * media * media) / (n - 1) if n > 1 else 0.0
+            linhas.append({
+                'linguagem': g.linguagem, 'tamanho': g.tamanho, 'caso': g.caso, 'motor': g.motor,
+                'execucoes': a['execucoes'],
+                'resolvidas': n,
+                'tempo_medio': media,
+                'tempo_total': a['tempo_soma'],
+                'tempo_desvio': math.sqrt(max(variancia, 0.0)),
+                'tempo_min': a['tempo_min'],
+                'tempo_max': a['tempo_max'],
+                'iteracoes_medias': a['iteracoes_soma'] / n if n else 0.0,
+                'iteracoes_totais': a['iteracoes_soma'],
+                'memoria_media_kb': (a['memoria_soma'] / a['memoria_execucoes']
+                                     if a['memoria_execucoes'] else None),
+                'memoria_max_kb': a['memoria_max'] if a['memoria_execucoes'] else None,
+            })
+        return linhas
+
+    def colunas(self, nomes: Sequence[str], **filtro) -> Dict[str, List[Any]]:
+        """
+        Valores por execução das colunas 'nomes' nas configurações do filtro,
+        mais linguagem/tamanho/caso/motor de cada linha. Só os membros dessas
+        colunas e configurações são descomprimidos.
+        """
+        resultado: Dict[str, List[Any]] = {campo: [] for campo in
+                                           ('linguagem', 'tamanho', 'caso', 'motor', *nomes)}
+        for g in self.grupos(**filtro):
+            n = g.agregados['execucoes']
+            for campo in ('linguagem', 'tamanho', 'caso', 'motor'):
+                resultado[campo].extend([getattr(g, campo)] * n)
+            for coluna in nomes:
+                valores = _ler_npy(self._zip.read(f"{g.nome}/{coluna}.npy"))
+                resultado[coluna].extend(valores.tolist())
+        return resultado
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def cmd_compactar(args) -> int:
+    logs_dir = Path(args.logs)
+    saida = Path(args.saida) if args.saida else logs_dir / ARQUIVO_PADRAO.name
+    total = compactar(logs_dir, saida)
+    tamanho_logs = sum(p.stat().st_size for p in logs_dir.glob('*.log'))
+    print(f"✓ {total} configurações compactadas em {saida} "
+          f"({saida.stat().st_size / 1024:.1f} KB; logs: {tamanho_logs / 1024:.1f} KB)")
+    return 0
+
+def cmd_consultar(args) -> int:
+    with ArquivoResultados(Path(args.arquivo)) as arquivo:
+        linhas = arquivo.agregados(linguagem=args.linguagem, tamanho=args.tamanho,
+                                   caso=args.caso, motor=args.motor)
+    if not linhas:
+        print("Nenhuma configuração no filtro")
+        return 1
+    print("{:<8} {:<8} {:<6} {:<8} {:>11} {:>14} {:>14} {:>14}".format(
+        "Ling.", "Tamanho", "Caso", "Motor", "Resolvidas", "Tempo médio", "Desvio", "Iter. médias"))
+    for l in linhas:
+        print("{:<8} {:<8} {:<6} {:<8} {:>11} {:>14.6f} {:>14.6f} {:>14.2f}".format(
+            l['linguagem'], l['tamanho'], l['caso'], l['motor'],
+            f"{l['resolvidas']}/{l['execucoes']}", l['tempo_medio'], l['tempo_desvio'],
+            l['iteracoes_medias']))
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Arquivo colunar comprimido dos resultados.")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    comp = sub.add_parser('compactar', help="grava os logs num arquivo colunar (.npz)")
+    comp.add_argument('--logs', default=str(PROJECT_ROOT / 'logs'))
+    comp.add_argument('--saida', default=None, help="padrão: <logs>/resultados.npz")
+    comp.set_defaults(funcao=cmd_compactar)
+
+    cons = sub.add_parser('consultar', help="agregados por configuração, só a partir do índice")
+    cons.add_argument('--arquivo', default=str(ARQUIVO_PADRAO))
+    cons.add_argument('--linguagem', choices=('c', 'python'), default=None)
+    cons.add_argument('--tamanho', default=None, help="small, 6x6, medium, 12x12, large")
+    cons.add_argument('--caso', choices=('best', 'worst'), default=None)
+    cons.add_argument('--motor', default=None, help="'padrao' ou um motor de main.py --engine")
+    cons.set_defaults(funcao=cmd_consultar)
+
+    args = parser.parse_args()
+    sys.exit(args.funcao(args))
+
+if __name__ == "__main__":
+    main()
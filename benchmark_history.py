@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Histórico de benchmarks entre revisões.
+
+Registra cada rodada de benchmark (revisão do git, informações da máquina,
+configuração e as medidas de cada execução extraídas dos logs de main.py e
+main.c) num banco SQLite local, e compara duas revisões com o teste de
+Mann-Whitney U sobre os tempos e as iterações de cada execução, apontando
+regressões e melhorias estatisticamente significativas.
+
+Uso:
+    python3 benchmark_history.py registrar [--rev REV] [--descricao TEXTO]
+    python3 benchmark_history.py listar
+    python3 benchmark_history.py comparar <rev_antiga> <rev_nova> [--alfa 0.05]
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from analyze_results import parse_runs
+
+PROJECT_ROOT = Path(__file__).parent
+DB_PADRAO = PROJECT_ROOT / 'benchmark_history.db'
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS rodadas (
+    id INTEGER PRIMARY KEY,
+    revisao TEXT NOT NULL,
+    data TEXT NOT NULL,
+    maquina TEXT NOT NULL,
+    descricao TEXT
+);
+CREATE TABLE IF NOT EXISTS configuracoes (
+    id INTEGER PRIMARY KEY,
+    rodada_id INTEGER NOT NULL REFERENCES rodadas(id) ON DELETE CASCADE,
+    linguagem TEXT NOT NULL,
+    tamanho TEXT NOT NULL,
+    caso TEXT NOT NULL,
+    motor TEXT NOT NULL,
+    log TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medidas (
+    configuracao_id INTEGER NOT NULL REFERENCES configuracoes(id) ON DELETE CASCADE,
+    execucao INTEGER NOT NULL,
+    tempo REAL NOT NULL,
+    iteracoes INTEGER NOT NULL,
+    resolvido INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rodadas_revisao ON rodadas(revisao);
+CREATE INDEX IF NOT EXISTS idx_medidas_configuracao ON medidas(configuracao_id);
+"""
+
+def conectar(path):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(ESQUEMA)
+    return conn
+
+def revisao_atual():
+    """Hash do HEAD, com '+dirty' se houver alterações não commitadas em arquivos rastreados."""
+    try:
+        rev = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=PROJECT_ROOT,
+                             capture_output=True, text=True, check=True).stdout.strip()
+        sujo = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                              cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'desconhecida'
+    return rev + ('+dirty' if sujo else '')
+
+def info_maquina():
+    return {
+        'host': platform.node(),
+        'sistema': f"{platform.system()} {platform.release()}",
+        'arquitetura': platform.machine(),
+        'processador': platform.processor(),
+        'cpus': os.cpu_count(),
+        'python': platform.python_version(),
+    }
+
+def _config_do_nome(path):
+    """(linguagem, tamanho, caso, motor) a partir de {lang}_{size}_{case}[_{motor}].log"""
+    partes = path.stem.split('_', 3)
+    if len(partes) < 3:
+        return None
+    motor = partes[3] if len(partes) > 3 else 'padrao'
+    return partes[0], partes[1], partes[2], motor
+
+def registrar(conn, logs_dir, revisao, descricao=None):
+    """Grava uma rodada com todos os logs de 'logs_dir'; retorna (id da rodada, nº de configurações)."""
+    with conn:
+        cur = conn.execute(
+            "INSERT INTO rodadas (revisao, data, maquina, descricao) VALUES (?, ?, ?, ?)",
+            (revisao, datetime.now(timezone.utc).isoformat(timespec='seconds'),
+             json.dumps(info_maquina(), sort_keys=True), descricao))
+        rodada_id = cur.lastrowid
+
+        total = 0
+        for path in sorted(Path(logs_dir).glob('*.log')):
+            config = _config_do_nome(path)
+            if config is None:
+                continue
+            runs = parse_runs(path.read_text())
+            if not runs:
+                continue
+            cur = conn.execute(
+                "INSERT INTO configuracoes (rodada_id, linguagem, tamanho, caso, motor, log) "
+                "VALUES (?, ?, ?, ?, ?, ?)", (rodada_id, *config, path.name))
+            conn.executemany(
+                "INSERT INTO medidas (configuracao_id, execucao, tempo, iteracoes, resolvido) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(cur.lastrowid, r['run'], r['time'], r['iterations'], int(r['solved'])) for r in runs])
+            total += 1
+    return rodada_id, total
+
+def medidas_da_revisao(conn, revisao):
+    """
+    Medidas de todas as rodadas cuja revisão começa com 'revisao', agrupadas por configuração.
+
+    Rodadas repetidas da mesma revisão são somadas à amostra.
+    """
+    linhas = conn.execute(
+        "SELECT c.linguagem, c.tamanho, c.caso, c.motor, m.tempo, m.iteracoes "
+        "FROM rodadas r JOIN configuracoes c ON c.rodada_id = r.id "
+        "JOIN medidas m ON m.configuracao_id = c.id "
+        "WHERE r.revisao LIKE ? || '%' AND m.resolvido = 1", (revisao,))
+    grupos = {}
+    for lang, size, case, motor, tempo, iteracoes in linhas:
+        tempos, iters = grupos.setdefault((lang, size, case, motor), ([], []))
+        tempos.append(tempo)
+        iters.append(iteracoes)
+    return grupos
+
+def mann_whitney_u(a, b):
+    """
+    Teste de Mann-Whitney U bilateral (aproximação normal com correção de empates e de continuidade).
+
+    Retorna (U de 'a', valor-p).
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+
+    valores = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    n = n1 + n2
+    soma_postos_a = 0.0
+    correcao_empates = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and valores[j + 1][0] == valores[i][0]:
+            j += 1
+        posto = (i + j) / 2 + 1  # posto médio do grupo empatado
+        t = j - i + 1
+        correcao_empates += t ** 3 - t
+        soma_postos_a += posto * sum(1 for k in range(i, j + 1) if valores[k][1] == 0)
+        i = j + 1
+
+    u = soma_postos_a - n1 * (n1 + 1) / 2
+    media = n1 * n2 / 2
+    variancia = n1 * n2 / 12 * ((n + 1) - correcao_empates / (n * (n - 1)))
+    if variancia <= 0:
+        return u, 1.0  # todas as medidas iguais
+    desvio = u - media
+    z = (abs(desvio) - 0.5) / math.sqrt(variancia) if abs(desvio) > 0.5 else 0.0
+    return u, math.erfc(z / math.sqrt(2))
+
+def comparar(conn, rev_antiga, rev_nova, alfa=0.05, min_variacao=0.02):
+    """Imprime a comparação por configuração; retorna o número de regressões significativas."""
+    antigas = medidas_da_revisao(conn, rev_antiga)
+    novas = medidas_da_revisao(conn, rev_nova)
+    comuns = sorted(set(antigas) & set(novas))
+
+    if not comuns:
+        print(f"❌ Nenhuma configuração em comum entre '{rev_antiga}' e '{rev_nova}'")
+        return 0
+
+    print(f"\nComparando {rev_antiga} → {rev_nova} (Mann-Whitney U, α = {alfa})\n")
+    print("{:<32} {:<10} {:>14} {:>14} {:>9} {:>8}  {}".format(
+        "Configuração", "Métrica", "Mediana antes", "Mediana depois", "Δ%", "p", "Resultado"))
+    print("-" * 110)
+
+    regressoes = 0
+    for config in comuns:
+        nome = " ".join(config)
+        for indice, metrica in ((0, 'tempo'), (1, 'iterações')):
+            a, b = antigas[config][indice], novas[config][indice]
+            mediana_a, mediana_b = statistics.median(a), statistics.median(b)
+            variacao = (mediana_b - mediana_a) / mediana_a if mediana_a else 0.0
+            _, p = mann_whitney_u(a, b)
+
+            resultado = "="
+            if p < alfa and abs(variacao) >= min_variacao:
+                if variacao > 0:
+                    resultado = "✗ regressão"
+                    regressoes += 1
+                else:
+                    resultado = "✓ melhoria"
+
+            print("{:<32} {:<10} {:>14.6g} {:>14.6g} {:>+8.1f}% {:>8.4f}  {}".format(
+                nome, metrica, mediana_a, mediana_b, variacao * 100, p, resultado))
+
+    print(f"\n{regressoes} regressão(ões) significativa(s)")
+    return regressoes
+
+def listar(conn):
+    rodadas = conn.execute(
+        "SELECT r.id, r.revisao, r.data, r.maquina, r.descricao, COUNT(c.id) "
+        "FROM rodadas r LEFT JOIN configuracoes c ON c.rodada_id = r.id "
+        "GROUP BY r.id ORDER BY r.id").fetchall()
+    if not rodadas:
+        print("Nenhuma rodada registrada.")
+        return
+    for rodada_id, revisao, data, maquina, descricao, configs in rodadas:
+        host = json.loads(maquina).get('host', '?')
+        extra = f" - {descricao}" if descricao else ""
+        print(f"#{rodada_id:<4} {revisao[:12]:<18} {data}  {host:<20} {configs} configurações{extra}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Histórico de benchmarks e detecção de regressões.")
+    parser.add_argument('--db', default=str(DB_PADRAO), help="arquivo SQLite (padrão: benchmark_history.db)")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    reg = sub.add_parser('registrar', help="grava os logs atuais como uma rodada")
+    reg.add_argument('--logs', default=str(PROJECT_ROOT / 'logs'))
+    reg.add_argument('--rev', default=None, help="revisão (padrão: HEAD do git)")
+    reg.add_argument('--descricao', default=None)
+
+    sub.add_parser('listar', help="lista as rodadas registradas")
+
+    comp = sub.add_parser('comparar', help="compara duas revisões")
+    comp.add_argument('rev_antiga')
+    comp.add_argument('rev_nova')
+    comp.add_argument('--alfa', type=float, default=0.05, help="nível de significância (padrão: 0.05)")
+    comp.add_argument('--min-variacao', type=float, default=0.02,
+                      help="variação relativa mínima da mediana para apontar (padrão: 0.02)")
+
+    args = parser.parse_args()
+    conn = conectar(args.db)
+
+    if args.comando == 'registrar':
+        revisao = args.rev or revisao_atual()
+        rodada_id, total = registrar(conn, args.logs, revisao, args.descricao)
+        print(f"✓ Rodada #{rodada_id} ({revisao[:12]}): {total} configurações registradas em {args.db}")
+    elif args.comando == 'listar':
+        listar(conn)
+    else:
+        regressoes = comparar(conn, args.rev_antiga, args.rev_nova, args.alfa, args.min_variacao)
+        sys.exit(1 if regressoes else 0)
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,26 @@
 
 #include "sudoku.h"
 
-// LCG (Linear Congruential Generator)
-void lcg_seed(unsigned int seed);
-unsigned int lcg_next(void);
+// Estado de uma geração: LCG (Linear Congruential Generator) e contador de
+// tentativas do preenchimento. Cada generate_sudoku() usa o próprio estado,
+// então puzzles diferentes podem ser gerados em paralelo.
+typedef struct {
+    unsigned int lcg_state;
+    int fill_attempts;
+} GeneratorState;
+
+void lcg_seed(GeneratorState* state, unsigned int seed);
+unsigned int lcg_next(GeneratorState* state);
 
 // Geração de Sudoku
-bool fill_sudoku(Sudoku* sudoku, int row, int col);
+bool fill_sudoku(Sudoku* sudoku, int row, int col, GeneratorState* state);
 Sudoku* generate_sudoku(int size, int empty_cells, unsigned int seed);
 
+// Seed do puzzle 'index' (1..N) de uma configuração: depende só do índice,
+// então qualquer puzzle pode ser gerado sem gerar os anteriores
+unsigned int hash_string(const char* str);
+unsigned int puzzle_seed(const char* size_str, const char* case_str, int index, unsigned int base_seed);
+
 // Conversão para string
 char num_to_char(int num);
 void sudoku_to_string(Sudoku* sudoku, char* buffer, int buffer_size);
@@ -7,9 +7,11 @@
 typedef struct {
     int** grid;
     int size;      
-    int box_size;  
+    int box_rows;  // linhas de cada bloco (3 no 9x9, 2 no 6x6, 3 no 12x12)
+    int box_cols;  // colunas de cada bloco (3 no 9x9, 3 no 6x6, 4 no 12x12)
 } Sudoku;
 
+void box_dimensions(int size, int* box_rows, int* box_cols);
 Sudoku* sudoku_create(int size);
 void sudoku_destroy(Sudoku* sudoku);
 bool is_valid(Sudoku* sudoku, int row, int col, int num);
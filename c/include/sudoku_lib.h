@@ -0,0 +1,18 @@
+#ifndef SUDOKU_LIB_H
+#define SUDOKU_LIB_H
+
+#include "backtracking.h"
+
+// API exportada pela biblioteca compartilhada (libsudoku.so)
+// O grid é um buffer plano de size*size inteiros, em ordem de linhas,
+// resolvido no próprio buffer (sem cópias).
+SolveResult sudoku_solve_buffer(int* grid, int size);
+
+// Resolve 'count' puzzles contíguos de 'puzzles' (count*size*size inteiros).
+// As soluções vão para 'solutions' (mesmo formato) e os resultados para
+// 'results' (count structs). Com OpenMP, usa até 'num_threads' threads
+// (0 = padrão do OpenMP). Retorna o número de puzzles resolvidos.
+int sudoku_solve_batch(const int* puzzles, int* solutions, SolveResult* results,
+                       int count, int size, int num_threads);
+
+#endif
@@ -3,12 +3,21 @@
 #include <stdio.h>
 #include <time.h>
 
+// Tempo de CPU da thread que resolve, em segundos: a mesma medida do
+// time.thread_time() do Python, e correta também dentro das threads do lote
+// OpenMP (clock() somaria a CPU de todas as threads do processo)
+static double thread_cpu_seconds(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_THREAD_CPUTIME_ID, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec / 1e9;
+}
+
 SolveResult solve_sudoku_iterative(Sudoku* sudoku) {
     SolveResult result;
     result.iterations = 0;
     result.solved = false;
     
-    clock_t start = clock();
+    double start = thread_cpu_seconds();
 
     // 1. Encontrar todas as células para preencher
     Coordenada* lista_vazias = (Coordenada*)malloc(sizeof(Coordenada) * sudoku->size * sudoku->size);
@@ -17,8 +26,7 @@ SolveResult solve_sudoku_iterative(Sudoku* sudoku) {
     // Se não há células vazias, já está resolvido
     if (total_vazias == 0) {
         result.solved = true;
-        clock_t end = clock();
-        result.time_seconds = (double)(end - start) / CLOCKS_PER_SEC;
+        result.time_seconds = thread_cpu_seconds() - start;
         free(lista_vazias);
         return result;
     }
@@ -70,8 +78,7 @@ SolveResult solve_sudoku_iterative(Sudoku* sudoku) {
         }
     }
 
-    clock_t end = clock();
-    result.time_seconds = (double)(end - start) / CLOCKS_PER_SEC;
+    result.time_seconds = thread_cpu_seconds() - start;
     result.solved = (k == total_vazias);
 
     free(lista_vazias);
@@ -157,11 +164,11 @@ bool is_in_col(Sudoku* sudoku, int c, int num) {
 
 bool is_in_box(Sudoku* sudoku, int r, int c, int num) {
 
-    int box_start_row = r - r % sudoku->box_size;
-    int box_start_col = c - c % sudoku->box_size;
+    int box_start_row = r - r % sudoku->box_rows;
+    int box_start_col = c - c % sudoku->box_cols;
 
-    for (int i = 0; i < sudoku->box_size; i++) {
-        for (int j = 0; j < sudoku->box_size; j++) {
+    for (int i = 0; i < sudoku->box_rows; i++) {
+        for (int j = 0; j < sudoku->box_cols; j++) {
             if (sudoku->grid[box_start_row + i][box_start_col + j] == num) {
                 return true;
             }
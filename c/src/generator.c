@@ -3,37 +3,51 @@
 #include <stdlib.h>
 #include <string.h>
 
-// Estado global do LCG
-static unsigned int lcg_state = 0;
-
-void lcg_seed(unsigned int seed) {
-    lcg_state = seed & 0x7fffffff;
+void lcg_seed(GeneratorState* state, unsigned int seed) {
+    state->lcg_state = seed & 0x7fffffff;
 }
 
-unsigned int lcg_next(void) {
+unsigned int lcg_next(GeneratorState* state) {
     // LCG: (a * state + c) mod m
     // a = 1103515245, c = 12345, m = 2^31
-    lcg_state = (1103515245U * lcg_state + 12345U) & 0x7fffffff;
-    return lcg_state;
+    state->lcg_state = (1103515245U * state->lcg_state + 12345U) & 0x7fffffff;
+    return state->lcg_state;
+}
+
+// Hash simples (djb2) para gerar seed baseada em string
+unsigned int hash_string(const char* str) {
+    unsigned int hash = 5381;
+    int c;
+    while ((c = *str++)) {
+        hash = ((hash << 5) + hash) + c;
+    }
+    return hash;
+}
+
+unsigned int puzzle_seed(const char* size_str, const char* case_str, int index, unsigned int base_seed) {
+    // base_seed = 0 reproduz os arquivos de puzzle_seeds/; outras bases
+    // embaralham os bits em vez de deslocar o índice (base 1 não repete o
+    // puzzle i + 1 da base 0)
+    unsigned int seed = (unsigned int)index * 1000U + hash_string(size_str) + hash_string(case_str);
+    return seed ^ (base_seed * 2654435761U);
 }
 
 // Shuffle usando Fisher-Yates com LCG
-static void shuffle(int* array, int n) {
+static void shuffle(int* array, int n, GeneratorState* state) {
     for (int i = n - 1; i > 0; i--) {
-        int j = lcg_next() % (i + 1);
+        int j = lcg_next(state) % (i + 1);
         int temp = array[i];
         array[i] = array[j];
         array[j] = temp;
     }
 }
 
-// Contador global para limitar tentativas (evita travamentos)
-static int fill_attempts = 0;
+// Limite de chamadas de fill_sudoku por tentativa (evita travamentos)
 static const int MAX_FILL_ATTEMPTS = 1000000;  // Limite de tentativas
 
-bool fill_sudoku(Sudoku* sudoku, int row, int col) {
+bool fill_sudoku(Sudoku* sudoku, int row, int col, GeneratorState* state) {
     // Limite de segurança para evitar travamentos
-    if (fill_attempts++ > MAX_FILL_ATTEMPTS) {
+    if (state->fill_attempts++ > MAX_FILL_ATTEMPTS) {
         return false;
     }
     
@@ -49,13 +63,13 @@ bool fill_sudoku(Sudoku* sudoku, int row, int col) {
     for (int i = 0; i < sudoku->size; i++) {
         numbers[i] = i + 1;
     }
-    shuffle(numbers, sudoku->size);
+    shuffle(numbers, sudoku->size, state);
     
     for (int i = 0; i < sudoku->size; i++) {
         int num = numbers[i];
         if (is_valid(sudoku, row, col, num)) {
             sudoku->grid[row][col] = num;
-            if (fill_sudoku(sudoku, next_row, next_col)) {
+            if (fill_sudoku(sudoku, next_row, next_col, state)) {
                 free(numbers);
                 return true;
             }
@@ -69,14 +83,15 @@ bool fill_sudoku(Sudoku* sudoku, int row, int col) {
 
 Sudoku* generate_sudoku(int size, int empty_cells, unsigned int seed) {
     Sudoku* sudoku = sudoku_create(size);
+    GeneratorState state;
     
     // Tenta preencher o Sudoku com uma solução válida
     // Se falhar, tenta com seed diferente (incrementa)
     int attempts = 0;
     unsigned int current_seed = seed;
     while (attempts < 20) {  // Aumentado para 20 tentativas
-        fill_attempts = 0;  // Reset contador
-        lcg_seed(current_seed);
+        state.fill_attempts = 0;  // Reset contador
+        lcg_seed(&state, current_seed);
         // Limpa o Sudoku
         for (int i = 0; i < size; i++) {
             for (int j = 0; j < size; j++) {
@@ -84,7 +99,7 @@ Sudoku* generate_sudoku(int size, int empty_cells, unsigned int seed) {
             }
         }
         
-        if (fill_sudoku(sudoku, 0, 0)) {
+        if (fill_sudoku(sudoku, 0, 0, &state)) {
             break;  // Sucesso!
         }
         
@@ -105,7 +120,7 @@ Sudoku* generate_sudoku(int size, int empty_cells, unsigned int seed) {
     for (int i = 0; i < total_cells; i++) {
         positions[i] = i;
     }
-    shuffle(positions, total_cells);
+    shuffle(positions, total_cells, &state);
     
     int cells_to_remove = (empty_cells < total_cells) ? empty_cells : total_cells;
     for (int i = 0; i < cells_to_remove; i++) {
@@ -136,9 +151,9 @@ void sudoku_to_string(Sudoku* sudoku, char* buffer, int buffer_size) {
     int pos = 0;
     
     for (int i = 0; i < sudoku->size; i++) {
-        if (i % sudoku->box_size == 0 && i != 0) {
+        if (i % sudoku->box_rows == 0 && i != 0) {
             // Linha separadora
-            for (int k = 0; k < sudoku->size * 2 + sudoku->box_size - 1; k++) {
+            for (int k = 0; k < sudoku->size * 2 + sudoku->size / sudoku->box_cols - 1; k++) {
                 if (pos < buffer_size - 1) {
                     buffer[pos++] = '-';
                 }
@@ -149,7 +164,7 @@ void sudoku_to_string(Sudoku* sudoku, char* buffer, int buffer_size) {
         }
         
         for (int j = 0; j < sudoku->size; j++) {
-            if (j % sudoku->box_size == 0 && j != 0) {
+            if (j % sudoku->box_cols == 0 && j != 0) {
                 if (pos < buffer_size - 2) {
                     buffer[pos++] = ' ';
                     buffer[pos++] = '|';
@@ -157,7 +172,7 @@ void sudoku_to_string(Sudoku* sudoku, char* buffer, int buffer_size) {
                 }
             }
             
-            if (j > 0 && !(j % sudoku->box_size == 0)) {
+            if (j > 0 && !(j % sudoku->box_cols == 0)) {
                 if (pos < buffer_size - 1) {
                     buffer[pos++] = ' ';
                 }
@@ -3,15 +3,44 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <sys/resource.h>
+
+// Pico de memória residente (RSS) do processo em KB, desde o início da execução
+static long peak_rss_kb(void) {
+    struct rusage usage;
+    if (getrusage(RUSAGE_SELF, &usage) != 0) {
+        return -1;
+    }
+#ifdef __APPLE__
+    return usage.ru_maxrss / 1024;  // macOS reporta em bytes
+#else
+    return usage.ru_maxrss;         // Linux reporta em KB
+#endif
+}
 
 int main(int argc, char* argv[]) {
 
-    if (argc != 3 && argc != 4) {
-        printf("Uso: %s <size> <case> [puzzle_file]\n", argv[0]);
-        printf("  size: small, medium, large\n");
+    // Argumentos opcionais: [puzzle_file] e --memoria, em qualquer ordem
+    const char* puzzle_arg = NULL;
+    int measure_memory = 0;
+    int args_ok = argc >= 3 && argc <= 5;
+    for (int i = 3; args_ok && i < argc; i++) {
+        if (strcmp(argv[i], "--memoria") == 0) {
+            measure_memory = 1;
+        } else if (!puzzle_arg) {
+            puzzle_arg = argv[i];
+        } else {
+            args_ok = 0;
+        }
+    }
+    
+    if (!args_ok) {
+        printf("Uso: %s <size> <case> [puzzle_file] [--memoria]\n", argv[0]);
+        printf("  size: small, 6x6, medium, 12x12, large\n");
         printf("  case: best, worst\n");
         printf("  puzzle_file: (opcional) arquivo com puzzles pré-gerados\n");
         printf("               Se não fornecido, usa puzzle_seeds/{size}_{case}.txt\n");
+        printf("  --memoria: (opcional) registra o pico de RSS do processo após cada execução\n");
         return 1;
     }
     
@@ -24,14 +53,20 @@ int main(int argc, char* argv[]) {
     if (strcmp(size_str, "small") == 0) {
         size = 4;
         empty_cells = (strcmp(case_str, "best") == 0) ? 5 : 8;  // best=30%, worst=50%
+    } else if (strcmp(size_str, "6x6") == 0) {
+        size = 6;  // blocos 2x3
+        empty_cells = (strcmp(case_str, "best") == 0) ? 11 : 18; // best=30%, worst=50%
     } else if (strcmp(size_str, "medium") == 0) {
         size = 9;
         empty_cells = (strcmp(case_str, "best") == 0) ? 24 : 40; // best=30%, worst=50%
+    } else if (strcmp(size_str, "12x12") == 0) {
+        size = 12;  // blocos 3x4
+        empty_cells = (strcmp(case_str, "best") == 0) ? 43 : 72; // best=30%, worst=50%
     } else if (strcmp(size_str, "large") == 0) {
         size = 16;
         empty_cells = (strcmp(case_str, "best") == 0) ? 77 : 128; // best=30%, worst=50%
     } else {
-        printf("Tamanho inválido. Use: small, medium ou large\n");
+        printf("Tamanho inválido. Use: small, 6x6, medium, 12x12 ou large\n");
         return 1;
     }
     
@@ -54,13 +89,14 @@ int main(int argc, char* argv[]) {
     double total_time = 0.0;
     long long total_iterations = 0;
     int successful_solves = 0;
+    long max_rss_kb = 0;
     
     printf("Executando 30 testes para %s %s em C...\n", size_str, case_str);
     
     // Determinar arquivo de puzzles
     char puzzle_filename[256];
-    if (argc == 4) {
-        strncpy(puzzle_filename, argv[3], sizeof(puzzle_filename) - 1);
+    if (puzzle_arg) {
+        strncpy(puzzle_filename, puzzle_arg, sizeof(puzzle_filename) - 1);
         puzzle_filename[sizeof(puzzle_filename) - 1] = '\0';
     } else {
         snprintf(puzzle_filename, sizeof(puzzle_filename), "../../puzzle_seeds/%s_%s.txt", size_str, case_str);
@@ -96,7 +132,16 @@ int main(int argc, char* argv[]) {
         fprintf(log_file, "  Células vazias: %d\n", actual_empty);
         fprintf(log_file, "  Tempo: %.6f segundos\n", result.time_seconds);
         fprintf(log_file, "  Iterações: %lld\n", result.iterations);
-        fprintf(log_file, "  Resolvido: %s\n\n", result.solved ? "Sim" : "Não");
+        fprintf(log_file, "  Resolvido: %s\n", result.solved ? "Sim" : "Não");
+        if (measure_memory) {
+            // ru_maxrss é o pico do processo: só cresce entre execuções
+            long rss_kb = peak_rss_kb();
+            if (rss_kb > max_rss_kb) {
+                max_rss_kb = rss_kb;
+            }
+            fprintf(log_file, "  RSS de pico: %ld KB\n", rss_kb);
+        }
+        fprintf(log_file, "\n");
         
         if (result.solved) {
             total_time += result.time_seconds;
@@ -124,6 +169,9 @@ int main(int argc, char* argv[]) {
         fprintf(log_file, "Tempo total: %.6f segundos\n", total_time);
         fprintf(log_file, "Iterações médias: %.2f\n", avg_iterations);
         fprintf(log_file, "Iterações totais: %lld\n", total_iterations);
+        if (measure_memory) {
+            fprintf(log_file, "Memória de pico máxima: %ld KB\n", max_rss_kb);
+        }
         
         printf("\n✓ Análise concluída!\n");
         printf("  Tempo médio: %.6f segundos\n", avg_time);
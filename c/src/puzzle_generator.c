@@ -6,27 +6,29 @@
 #include <sys/stat.h>
 #include <sys/types.h>
 
-// Hash simples para gerar seed baseada em string
-unsigned int hash_string(const char* str) {
-    unsigned int hash = 5381;
-    int c;
-    while ((c = *str++)) {
-        hash = ((hash << 5) + hash) + c;
-    }
-    return hash;
-}
-
-void generate_puzzles_for_config(const char* size_str, const char* case_str, int num_puzzles) {
+// Gera os puzzles first..last (de 1..num_puzzles) de uma configuração. Cada
+// puzzle depende só do próprio índice (puzzle_seed), então fatias diferentes
+// podem ser geradas em processos ou máquinas diferentes e concatenadas.
+void generate_puzzles_for_config(const char* size_str, const char* case_str, int num_puzzles,
+                                 int first, int last, unsigned int base_seed) {
     int size, best_empty, worst_empty;
     
     if (strcmp(size_str, "small") == 0) {
         size = 4;
         best_empty = 5;   // 30% - mais fácil (menos células vazias)
         worst_empty = 8;  // 50% - mais difícil (mais células vazias)
+    } else if (strcmp(size_str, "6x6") == 0) {
+        size = 6;          // blocos 2x3
+        best_empty = 11;   // 30% - mais fácil (menos células vazias)
+        worst_empty = 18;  // 50% - mais difícil (mais células vazias)
     } else if (strcmp(size_str, "medium") == 0) {
         size = 9;
         best_empty = 24;  // 30% - mais fácil (menos células vazias)
         worst_empty = 40; // 50% - mais difícil (mais células vazias)
+    } else if (strcmp(size_str, "12x12") == 0) {
+        size = 12;         // blocos 3x4
+        best_empty = 43;   // 30% - mais fácil (menos células vazias)
+        worst_empty = 72;  // 50% - mais difícil (mais células vazias)
     } else if (strcmp(size_str, "large") == 0) {
         size = 16;
         best_empty = 77;   // 30% - mais fácil (menos células vazias)
@@ -42,7 +44,15 @@ void generate_puzzles_for_config(const char* size_str, const char* case_str, int
     mkdir("../../puzzle_seeds", 0755);
     
     char filename[256];
-    snprintf(filename, sizeof(filename), "../../puzzle_seeds/%s_%s.txt", size_str, case_str);
+    if (first == 1 && last == num_puzzles && base_seed == 0) {
+        snprintf(filename, sizeof(filename), "../../puzzle_seeds/%s_%s.txt", size_str, case_str);
+    } else if (base_seed == 0) {
+        snprintf(filename, sizeof(filename), "../../puzzle_seeds/%s_%s_%d-%d.txt",
+                 size_str, case_str, first, last);
+    } else {
+        snprintf(filename, sizeof(filename), "../../puzzle_seeds/%s_%s_s%u_%d-%d.txt",
+                 size_str, case_str, base_seed, first, last);
+    }
     
     FILE* file = fopen(filename, "w");
     if (!file) {
@@ -50,12 +60,12 @@ void generate_puzzles_for_config(const char* size_str, const char* case_str, int
         exit(1);
     }
     
-    printf("Gerando %d puzzles para %s %s...\n", num_puzzles, size_str, case_str);
+    printf("Gerando puzzles %d-%d de %d para %s %s...\n", first, last, num_puzzles, size_str, case_str);
     
     char buffer[8192];
-    for (int i = 1; i <= num_puzzles; i++) {
+    for (int i = first; i <= last; i++) {
         // Gera seed baseada no índice
-        unsigned int seed = i * 1000 + hash_string(size_str) + hash_string(case_str);
+        unsigned int seed = puzzle_seed(size_str, case_str, i, base_seed);
         
         Sudoku* sudoku = generate_sudoku(size, empty_cells, seed);
         
@@ -74,13 +84,13 @@ void generate_puzzles_for_config(const char* size_str, const char* case_str, int
         
         sudoku_destroy(sudoku);
         
-        if (i % 10 == 0) {
-            printf("  Gerados %d/%d puzzles...\n", i, num_puzzles);
+        if ((i - first + 1) % 10 == 0) {
+            printf("  Gerados %d/%d puzzles...\n", i - first + 1, last - first + 1);
         }
     }
     
     fclose(file);
-    printf("✓ %d puzzles salvos em: %s\n", num_puzzles, filename);
+    printf("✓ %d puzzles salvos em: %s\n", last - first + 1, filename);
 }
 
 int main(int argc, char* argv[]) {
@@ -94,27 +104,42 @@ int main(int argc, char* argv[]) {
         const char* configs[][2] = {
             {"small", "best"},
             {"small", "worst"},
+            {"6x6", "best"},
+            {"6x6", "worst"},
             {"medium", "best"},
             {"medium", "worst"},
+            {"12x12", "best"},
+            {"12x12", "worst"},
             {"large", "best"},
             {"large", "worst"}
         };
         
-        for (int i = 0; i < 6; i++) {
-            generate_puzzles_for_config(configs[i][0], configs[i][1], 30);
+        for (int i = 0; i < (int)(sizeof(configs) / sizeof(configs[0])); i++) {
+            generate_puzzles_for_config(configs[i][0], configs[i][1], 30, 1, 30, 0);
             printf("\n");
         }
         
         printf("============================================================\n");
         printf("✓ Todos os puzzles foram gerados com sucesso!\n");
         printf("============================================================\n");
-    } else if (argc == 3) {
-        // Gera para uma configuração específica
-        generate_puzzles_for_config(argv[1], argv[2], 30);
+    } else if (argc >= 3 && argc <= 7 && argc != 5) {
+        // Gera para uma configuração específica (opcionalmente só uma fatia)
+        int num_puzzles = (argc > 3) ? atoi(argv[3]) : 30;
+        int first = (argc > 4) ? atoi(argv[4]) : 1;
+        int last = (argc > 5) ? atoi(argv[5]) : num_puzzles;
+        unsigned int base_seed = (argc > 6) ? (unsigned int)strtoul(argv[6], NULL, 10) : 0;
+        if (num_puzzles < 1 || first < 1 || last > num_puzzles || first > last) {
+            fprintf(stderr, "Fatia inválida: %d-%d de %d\n", first, last, num_puzzles);
+            exit(1);
+        }
+        generate_puzzles_for_config(argv[1], argv[2], num_puzzles, first, last, base_seed);
     } else {
-        fprintf(stderr, "Uso: %s [size case]\n", argv[0]);
-        fprintf(stderr, "  size: small, medium, large\n");
+        fprintf(stderr, "Uso: %s [size case [total [primeiro ultimo [semente]]]]\n", argv[0]);
+        fprintf(stderr, "  size: small, 6x6, medium, 12x12, large\n");
         fprintf(stderr, "  case: best, worst\n");
+        fprintf(stderr, "  total: puzzles da configuração (padrão: 30)\n");
+        fprintf(stderr, "  primeiro ultimo: gera só os puzzles primeiro..ultimo (a partir de 1)\n");
+        fprintf(stderr, "  semente: base das seeds (padrão: 0, a dos arquivos de puzzle_seeds/)\n");
         fprintf(stderr, "  Se nenhum argumento for fornecido, gera todos os puzzles\n");
         exit(1);
     }
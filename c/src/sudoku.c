@@ -1,13 +1,25 @@
 #include "../include/sudoku.h"
 #include <stdlib.h>
 #include <stdio.h>
-#include <math.h>
 #include <string.h>
 
+// Blocos box_rows x box_cols: box_rows é o maior divisor de size que não
+// passa da raiz quadrada (9 -> 3x3, 6 -> 2x3, 12 -> 3x4)
+void box_dimensions(int size, int* box_rows, int* box_cols) {
+    int rows = 1;
+    for (int d = 1; d * d <= size; d++) {
+        if (size % d == 0) {
+            rows = d;
+        }
+    }
+    *box_rows = rows;
+    *box_cols = size / rows;
+}
+
 Sudoku* sudoku_create(int size) {
     Sudoku* sudoku = (Sudoku*)malloc(sizeof(Sudoku));
     sudoku->size = size;
-    sudoku->box_size = (int)sqrt(size);
+    box_dimensions(size, &sudoku->box_rows, &sudoku->box_cols);
     
     sudoku->grid = (int**)malloc(size * sizeof(int*));
     for (int i = 0; i < size; i++) {
@@ -43,11 +55,11 @@ bool is_valid(Sudoku* sudoku, int row, int col, int num) {
     }
     
     // Verifica caixa
-    int box_start_row = row - row % sudoku->box_size;
-    int box_start_col = col - col % sudoku->box_size;
+    int box_start_row = row - row % sudoku->box_rows;
+    int box_start_col = col - col % sudoku->box_cols;
     
-    for (int i = 0; i < sudoku->box_size; i++) {
-        for (int j = 0; j < sudoku->box_size; j++) {
+    for (int i = 0; i < sudoku->box_rows; i++) {
+        for (int j = 0; j < sudoku->box_cols; j++) {
             if (sudoku->grid[box_start_row + i][box_start_col + j] == num) {
                 return false;
             }
@@ -85,15 +97,15 @@ static int char_to_num(char c) {
 
 void sudoku_print(Sudoku* sudoku) {
     for (int i = 0; i < sudoku->size; i++) {
-        if (i % sudoku->box_size == 0 && i != 0) {
-            for (int k = 0; k < sudoku->size * 2 + sudoku->box_size - 1; k++) {
+        if (i % sudoku->box_rows == 0 && i != 0) {
+            for (int k = 0; k < sudoku->size * 2 + sudoku->size / sudoku->box_cols - 1; k++) {
                 printf("-");
             }
             printf("\n");
         }
         
         for (int j = 0; j < sudoku->size; j++) {
-            if (j % sudoku->box_size == 0 && j != 0) {
+            if (j % sudoku->box_cols == 0 && j != 0) {
                 printf("| ");
             }
             printf("%c ", num_to_char(sudoku->grid[i][j]));
@@ -0,0 +1,63 @@
+#include "../include/sudoku_lib.h"
+#include <stdlib.h>
+#include <string.h>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+// Monta um Sudoku cujas linhas apontam diretamente para o buffer plano
+static bool sudoku_wrap_buffer(Sudoku* sudoku, int* grid, int size) {
+    sudoku->size = size;
+    box_dimensions(size, &sudoku->box_rows, &sudoku->box_cols);
+    sudoku->grid = (int**)malloc(size * sizeof(int*));
+    if (!sudoku->grid) {
+        return false;
+    }
+    for (int i = 0; i < size; i++) {
+        sudoku->grid[i] = grid + i * size;
+    }
+    return true;
+}
+
+SolveResult sudoku_solve_buffer(int* grid, int size) {
+    Sudoku sudoku;
+    if (!sudoku_wrap_buffer(&sudoku, grid, size)) {
+        SolveResult result = {0.0, 0, false};
+        return result;
+    }
+
+    SolveResult result = solve_sudoku_iterative(&sudoku);
+
+    // Apenas os ponteiros de linha pertencem a esta função; o buffer é do chamador
+    free(sudoku.grid);
+    return result;
+}
+
+int sudoku_solve_batch(const int* puzzles, int* solutions, SolveResult* results,
+                       int count, int size, int num_threads) {
+    const int cells = size * size;
+    int solved = 0;
+
+    // Cada puzzle é copiado para seu espaço em 'solutions' e resolvido lá
+    memcpy(solutions, puzzles, (size_t)count * cells * sizeof(int));
+
+#ifdef _OPENMP
+    if (num_threads > 0) {
+        omp_set_num_threads(num_threads);
+    }
+    // Tempos de puzzles diferentes variam muito: distribuição dinâmica
+    // (cada tempo é a CPU da thread que resolveu o puzzle, sem as outras)
+    #pragma omp parallel for schedule(dynamic) reduction(+:solved)
+#else
+    (void)num_threads;
+#endif
+    for (int i = 0; i < count; i++) {
+        results[i] = sudoku_solve_buffer(solutions + (size_t)i * cells, size);
+        if (results[i].solved) {
+            solved++;
+        }
+    }
+
+    return solved;
+}
@@ -0,0 +1,124 @@
+"""
+Cache colunar dos resultados extraídos dos logs.
+
+Guarda, num único arquivo JSON organizado por colunas (uma lista por campo,
+uma posição por log), os dados que parse_log_file() extrai de cada log, junto
+com o mtime, o tamanho e o SHA-1 do arquivo de origem. Numa nova execução só
+os logs cujo mtime/tamanho mudou têm o conteúdo conferido, e só os que mudaram
+de fato (SHA-1 diferente) são lidos de novo com as expressões regulares.
+
+O cache também guarda a impressão digital dos dados usados por cada figura,
+para que plot_results.py regenere apenas as figuras cuja entrada mudou.
+Usa somente a biblioteca padrão.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+VERSAO = 1
+
+Colunas = Dict[str, List[Any]]
+
+def sha1_arquivo(path: Path) -> str:
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 16), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+def impressao_digital(valores: Iterable[Any]) -> str:
+    """SHA-1 da representação JSON de uma sequência de valores."""
+    h = hashlib.sha1()
+    for valor in valores:
+        h.update(json.dumps(valor, sort_keys=True, default=str).encode())
+        h.update(b'\n')
+    return h.hexdigest()
+
+class CacheResultados:
+    """Cache persistente de resultados por log e de impressões digitais por figura."""
+
+    def __init__(self, path: Optional[Path]):
+        """'path' None mantém o cache só em memória (nada é lido ou gravado)."""
+        self.path = Path(path) if path is not None else None
+        self._colunas: Colunas = {}
+        self._figuras: Dict[str, str] = {}
+        self._carregar()
+
+    def _carregar(self) -> None:
+        if self.path is None:
+            return
+        try:
+            with open(self.path) as f:
+                dados = json.load(f)
+        except (OSError, ValueError):
+            return
+        if dados.get('versao') != VERSAO:
+            return  # formato antigo: reconstrói do zero
+        self._colunas = dados.get('colunas', {})
+        self._figuras = dados.get('figuras', {})
+
+    def salvar(self) -> None:
+        """Grava o cache de forma atômica (arquivo temporário + rename)."""
+        if self.path is None:
+            return
+        temporario = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(temporario, 'w') as f:
+            json.dump({'versao': VERSAO, 'colunas': self._colunas, 'figuras': self._figuras}, f)
+        os.replace(temporario, self.path)
+
+    def atualizar(self, logs_dir: Path, parse: Callable[[Path], Optional[Dict[str, Any]]],
+                  padrao: str = '*.log') -> Tuple[Colunas, Set[str]]:
+        """
+        Sincroniza o cache com os logs de 'logs_dir'.
+
+        Retorna as colunas de todos os logs e o conjunto de nomes de logs
+        novos, alterados ou removidos desde a última execução.
+        """
+        antigas = self._colunas
+        posicoes = {nome: i for i, nome in enumerate(antigas.get('arquivo', []))}
+
+        def linha_antiga(i: int) -> Dict[str, Any]:
+            return {campo: valores[i] for campo, valores in antigas.items()}
+
+        linhas: List[Dict[str, Any]] = []
+        alterados: Set[str] = set()
+
+        for path in sorted(Path(logs_dir).glob(padrao)):
+            nome = path.name
+            info = path.stat()
+            i = posicoes.pop(nome, None)
+
+            if i is not None and antigas['mtime_ns'][i] == info.st_mtime_ns \
+                    and antigas['tamanho'][i] == info.st_size:
+                linhas.append(linha_antiga(i))
+                continue
+
+            sha1 = sha1_arquivo(path)
+            if i is not None and antigas['sha1'][i] == sha1:
+                # Reescrito com o mesmo conteúdo: não precisa reler
+                linha = linha_antiga(i)
+            else:
+                dados = parse(path)
+                if dados is None:
+                    continue
+                linha = dict(dados, arquivo=nome, sha1=sha1)
+                alterados.add(nome)
+            linha['mtime_ns'] = info.st_mtime_ns
+            linha['tamanho'] = info.st_size
+            linhas.append(linha)
+
+        # Logs que sumiram também mudam a entrada das figuras
+        alterados.update(posicoes)
+
+        campos = sorted(set().union(*linhas)) if linhas else []
+        self._colunas = {campo: [linha.get(campo) for linha in linhas] for campo in campos}
+        return self._colunas, alterados
+
+    def figura_atualizada(self, nome: str, impressao: str, saida: Path) -> bool:
+        """True se a figura já existe e foi gerada a partir dos mesmos dados."""
+        return self._figuras.get(nome) == impressao and Path(saida).exists()
+
+    def registrar_figura(self, nome: str, impressao: str) -> None:
+        self._figuras[nome] = impressao
@@ -2,16 +2,29 @@
 """
 Script para gerar gráficos de performance do algoritmo de backtracking iterativo para Sudoku.
 Compara performance entre C e Python, diferentes tamanhos e casos (best/worst).
+
+Os dados extraídos dos logs ficam em cache (plot/.cache_resultados.json): só os
+logs alterados são relidos, e só as figuras cujos dados mudaram são regeneradas
+(use --forcar para regenerar todas). Se logs/resultados.npz (arquivo_resultados.py)
+estiver atualizado, os dados vêm dele, sem ler os logs.
 """
 
+import argparse
 import os
 import re
+import statistics
 import sys
 from pathlib import Path
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-from matplotlib.ticker import FuncFormatter
+
+from cache_resultados import CacheResultados, impressao_digital, sha1_arquivo
+
+# arquivo_resultados.py fica na raiz do projeto
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from arquivo_resultados import ArquivoResultados, arquivo_atualizado
+
+# pandas, matplotlib e numpy são importados sob demanda por _importar_dependencias():
+# quem só precisa de parse_log_file() (driver, analyze_results) não paga esse custo.
+pd = plt = np = FuncFormatter = None
 
 def format_time(value):
     """Formata valores de tempo de forma legível."""
@@ -42,16 +55,29 @@ def format_time_ms_only(value):
     else:
         return f"{ms_value:.2f}ms"
 
-# Configuração de estilo
-try:
-    plt.style.use('seaborn-v0_8-darkgrid')
-except OSError:
+def _importar_dependencias():
+    """Importa as bibliotecas de plotagem e aplica a configuração de estilo."""
+    global pd, plt, np, FuncFormatter
+    if plt is not None:
+        return
+    
+    import pandas as pd
+    import matplotlib
+    matplotlib.use('Agg')  # apenas arquivos PNG, sem janela
+    import matplotlib.pyplot as plt
+    import numpy as np
+    from matplotlib.ticker import FuncFormatter
+    
+    # Configuração de estilo
     try:
-        plt.style.use('seaborn-darkgrid')
+        plt.style.use('seaborn-v0_8-darkgrid')
     except OSError:
-        plt.style.use('default')
-plt.rcParams['figure.figsize'] = (14, 8)
-plt.rcParams['font.size'] = 10
+        try:
+            plt.style.use('seaborn-darkgrid')
+        except OSError:
+            plt.style.use('default')
+    plt.rcParams['figure.figsize'] = (14, 8)
+    plt.rcParams['font.size'] = 10
 
 def parse_log_file(filename):
     """Extrai dados estatísticos de um arquivo de log, incluindo todos os tempos individuais."""
@@ -76,8 +102,8 @@ def parse_log_file(filename):
     individual_times = [float(t) for t in individual_times if t]
     
     # Calcular média e desvio-padrão dos tempos individuais
-    mean_time = np.mean(individual_times) if individual_times else 0.0
-    std_time = np.std(individual_times, ddof=1) if len(individual_times) > 1 else 0.0
+    mean_time = statistics.mean(individual_times) if individual_times else 0.0
+    std_time = statistics.stdev(individual_times) if len(individual_times) > 1 else 0.0
     
     # Extrair todas as iterações individuais
     # Padrão mais flexível que aceita diferentes formatos de espaçamento
@@ -86,8 +112,13 @@ def parse_log_file(filename):
     individual_iters = [int(i) for i in individual_iters if i]
     
     # Calcular média e desvio-padrão das iterações individuais
-    mean_iter = np.mean(individual_iters) if individual_iters else 0.0
-    std_iter = np.std(individual_iters, ddof=1) if len(individual_iters) > 1 else 0.0
+    mean_iter = statistics.mean(individual_iters) if individual_iters else 0.0
+    std_iter = statistics.stdev(individual_iters) if len(individual_iters) > 1 else 0.0
+    
+    # Pico de memória por execução (apenas logs gerados com --memoria):
+    # Python registra o pico do tracemalloc, C o pico de RSS do processo
+    memory_pattern = r'(?:Memória de pico \(tracemalloc\)|RSS de pico): ([\d.]+) KB'
+    individual_memory = [float(m) for m in re.findall(memory_pattern, content)]
     
     return {
         'language': lang_match.group(1) if lang_match else 'N/A',
@@ -101,65 +132,139 @@ def parse_log_file(filename):
         'avg_iterations': float(avg_iter_match.group(1)) if avg_iter_match else mean_iter,
         'std_iterations': std_iter,
         'individual_times': individual_times,
-        'individual_iterations': individual_iters
+        'individual_iterations': individual_iters,
+        'avg_memory_kb': statistics.mean(individual_memory) if individual_memory else None,
+        'max_memory_kb': max(individual_memory) if individual_memory else None
     }
 
-def load_data(logs_dir):
-    """Carrega todos os dados dos logs e retorna um DataFrame."""
-    configs = [
-        ('c', 'small', 'best'),
-        ('c', 'small', 'worst'),
-        ('c', 'medium', 'best'),
-        ('c', 'medium', 'worst'),
-        ('c', 'large', 'best'),
-        ('c', 'large', 'worst'),
-        ('python', 'small', 'best'),
-        ('python', 'small', 'worst'),
-        ('python', 'medium', 'best'),
-        ('python', 'medium', 'worst'),
-        ('python', 'large', 'best'),
-        ('python', 'large', 'worst'),
-    ]
+# Linguagens comparadas nos gráficos (com o motor padrão de cada uma)
+LANGS = ('c', 'python')
+
+# Tamanhos (nomes de main.SIZE_MAP), rótulos e cores; 6x6 e 12x12 (blocos 2x3 e 3x4)
+# são os pontos intermediários da curva de complexidade
+SIZE_NAMES = {'small': 4, '6x6': 6, 'medium': 9, '12x12': 12, 'large': 16}
+SIZE_LABELS = {4: 'Small (4×4)', 6: '6×6 (2×3)', 9: 'Medium (9×9)', 12: '12×12 (3×4)',
+               16: 'Large (16×16)'}
+COLORS_C = {4: '#2E86AB', 6: '#24729A', 9: '#1B5E7A', 12: '#144D6A', 16: '#0D3B5A'}
+COLORS_PY = {4: '#A23B72', 6: '#8E3363', 9: '#7A2B54', 12: '#662445', 16: '#521C36'}
+CACHE_NOME = '.cache_resultados.json'
+
+def _parse_log_com_nome(path):
+    """parse_log_file() mais lang, size_str e motor tirados do nome: {lang}_{size}_{case}[_{motor}].log"""
+    partes = path.stem.split('_', 3)
+    if len(partes) < 3:
+        return None
+    data = parse_log_file(path)
+    if data:
+        data['lang'] = partes[0]
+        data['size_str'] = partes[1]
+        data['motor'] = partes[3] if len(partes) > 3 else ''
+    return data
+
+def colunas_do_arquivo(path):
+    """
+    As colunas de parse_log_file() (mais lang, size_str e motor) para o motor
+    padrão de cada linguagem, lidas de um arquivo de arquivo_resultados.py.
+    Médias vêm do índice; só as colunas de tempo e iterações desses grupos
+    são descomprimidas (desvios e tempos individuais).
+    """
+    linhas = []
+    with ArquivoResultados(path) as arquivo:
+        for lang in LANGS:
+            for ag in arquivo.agregados(linguagem=lang, motor='padrao'):
+                execucoes = arquivo.colunas(('tempo', 'iteracoes'), linguagem=lang, tamanho=ag['tamanho'],
+                                            caso=ag['caso'], motor='padrao')
+                tempos, iteracoes = execucoes['tempo'], execucoes['iteracoes']
+                linhas.append({
+                    'arquivo': f"{lang}_{ag['tamanho']}_{ag['caso']}.log",
+                    'language': 'C' if lang == 'c' else 'Python',
+                    'size': SIZE_NAMES.get(ag['tamanho'], 0),
+                    'case': ag['caso'],
+                    'successful': ag['resolvidas'],
+                    'total_runs': ag['execucoes'],
+                    'avg_time': ag['tempo_medio'],
+                    'total_time': ag['tempo_total'],
+                    'std_time': statistics.stdev(tempos) if len(tempos) > 1 else 0.0,
+                    'avg_iterations': ag['iteracoes_medias'],
+                    'std_iterations': statistics.stdev(iteracoes) if len(iteracoes) > 1 else 0.0,
+                    'individual_times': tempos,
+                    'individual_iterations': iteracoes,
+                    'avg_memory_kb': ag['memoria_media_kb'],
+                    'max_memory_kb': ag['memoria_max_kb'],
+                    'lang': lang,
+                    'size_str': ag['tamanho'],
+                    'motor': '',
+                })
+    campos = sorted(set().union(*linhas)) if linhas else []
+    return {campo: [linha[campo] for linha in linhas] for campo in campos}
+
+def load_data(logs_dir, cache=None):
+    """
+    Carrega os dados de todos os logs e retorna um DataFrame indexado por (lang, size, case).
+
+    Lê de logs/resultados.npz quando ele não é mais antigo que nenhum log; senão,
+    dos logs, e com 'cache' apenas os alterados desde a última execução são relidos.
+    """
+    if cache is None:
+        cache = CacheResultados(None)
+    arquivo = Path(logs_dir) / 'resultados.npz'
+    if arquivo_atualizado(arquivo, logs_dir):
+        colunas = colunas_do_arquivo(arquivo)
+        if colunas:
+            print(f"✓ {len(colunas['arquivo'])} configurações lidas de {arquivo}")
+    else:
+        colunas, alterados = cache.atualizar(logs_dir, _parse_log_com_nome)
+        if colunas:
+            total_logs = len(colunas['arquivo'])
+            relidos = len(alterados.intersection(colunas['arquivo']))
+            print(f"✓ {total_logs} logs encontrados ({relidos} relidos, "
+                  f"{total_logs - relidos} vindos do cache)")
+    
+    if not colunas:
+        return None
     
-    results = []
-    for lang, size, case in configs:
-        filename = logs_dir / f"{lang}_{size}_{case}.log"
-        data = parse_log_file(filename)
-        if data:
-            data['lang'] = lang
-            data['size_str'] = size
-            results.append(data)
+    # Um único DataFrame para todas as figuras, apenas com o motor padrão de cada linguagem
+    df = pd.DataFrame(colunas)
+    df = df[(df['motor'] == '') & df['lang'].isin(LANGS)].copy()
     
-    if not results:
+    if df.empty:
         return None
     
-    df = pd.DataFrame(results)
-    
     # Adicionar colunas calculadas para facilitar plotagem
-    if not df.empty:
-        df['avg_time_ms'] = df['avg_time'] * 1000  # Converter para milissegundos
-        df['std_time_ms'] = df['std_time'] * 1000
-        df['total_time_ms'] = df['total_time'] * 1000
+    df['avg_time_ms'] = df['avg_time'] * 1000  # Converter para milissegundos
+    df['std_time_ms'] = df['std_time'] * 1000
+    df['total_time_ms'] = df['total_time'] * 1000
     
-    return df
+    # Índice ordenado para selecionar(): busca binária em vez de varrer as colunas
+    return df.set_index(['lang', 'size', 'case'], drop=False).sort_index()
+
+def selecionar(df, lang, size, case):
+    """Linhas de uma configuração (lang, size, case), pelo índice criado em load_data()."""
+    try:
+        pos = df.index.get_loc((lang, size, case))
+    except KeyError:
+        return df.iloc[0:0]
+    if isinstance(pos, (int, np.integer)):
+        pos = slice(pos, pos + 1)
+    return df.iloc[pos]
 
 def plot_time_comparison(df, output_dir):
     """Gráfico 1: Comparação de tempo entre C e Python por tamanho e caso."""
     fig, axes = plt.subplots(1, 2, figsize=(16, 6))
     
     sizes = sorted(df['size'].unique())
-    size_labels = {4: 'Small (4×4)', 9: 'Medium (9×9)', 16: 'Large (16×16)'}
+    size_labels = SIZE_LABELS
     
     # Gráfico 1: Best Case
     ax1 = axes[0]
     x = np.arange(len(sizes))
     width = 0.35
     
-    c_best = [df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'best')]['avg_time'].values[0] 
-              if len(df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'best')]) > 0 else 0 
+    c_best = [selecionar(df, 'c', s, 'best')['avg_time'].values[0] 
+              if len(selecionar(df, 'c', s, 'best')) > 0 else 0 
               for s in sizes]
-    py_best = [df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'best')]['avg_time'].values[0] 
-               if len(df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'best')]) > 0 else 0 
+    py_best = [selecionar(df, 'python', s, 'best')['avg_time'].values[0] 
+               if len(selecionar(df, 'python', s, 'best')) > 0 else 0 
                for s in sizes]
     
     bars1 = ax1.bar(x - width/2, c_best, width, label='C', color='#2E86AB', alpha=0.8)
@@ -199,11 +304,11 @@ def plot_time_comparison(df, output_dir):
     # Gráfico 2: Worst Case
     ax2 = axes[1]
     
-    c_worst = [df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'worst')]['avg_time'].values[0] 
-               if len(df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'worst')]) > 0 else 0 
+    c_worst = [selecionar(df, 'c', s, 'worst')['avg_time'].values[0] 
+               if len(selecionar(df, 'c', s, 'worst')) > 0 else 0 
                for s in sizes]
-    py_worst = [df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'worst')]['avg_time'].values[0] 
-                if len(df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'worst')]) > 0 else 0 
+    py_worst = [selecionar(df, 'python', s, 'worst')['avg_time'].values[0] 
+                if len(selecionar(df, 'python', s, 'worst')) > 0 else 0 
                 for s in sizes]
     
     bars3 = ax2.bar(x - width/2, c_worst, width, label='C', color='#2E86AB', alpha=0.8)
@@ -250,9 +355,9 @@ def plot_time_vs_iterations(df, output_dir):
     fig, axes = plt.subplots(1, 2, figsize=(18, 7))
     
     sizes = sorted(df['size'].unique())
-    size_labels = {4: 'Small (4×4)', 9: 'Medium (9×9)', 16: 'Large (16×16)'}
-    colors_c = {4: '#2E86AB', 9: '#1B5E7A', 16: '#0D3B5A'}
-    colors_py = {4: '#A23B72', 9: '#7A2B54', 16: '#521C36'}
+    size_labels = SIZE_LABELS
+    colors_c = COLORS_C
+    colors_py = COLORS_PY
     
     def format_time_label(value):
         """Formata tempo para label"""
@@ -278,8 +383,8 @@ def plot_time_vs_iterations(df, output_dir):
     ax1 = axes[0]
     
     for s in sizes:
-        c_data = df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'best')]
-        py_data = df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'best')]
+        c_data = selecionar(df, 'c', s, 'best')
+        py_data = selecionar(df, 'python', s, 'best')
         
         if len(c_data) > 0 and len(py_data) > 0:
             c_iter = c_data['avg_iterations'].values[0]
@@ -337,8 +442,8 @@ def plot_time_vs_iterations(df, output_dir):
     ax2 = axes[1]
     
     for s in sizes:
-        c_data = df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'worst')]
-        py_data = df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'worst')]
+        c_data = selecionar(df, 'c', s, 'worst')
+        py_data = selecionar(df, 'python', s, 'worst')
         
         if len(c_data) > 0 and len(py_data) > 0:
             c_iter = c_data['avg_iterations'].values[0]
@@ -407,7 +512,7 @@ def plot_summary(df, output_dir):
     fig, ax = plt.subplots(figsize=(12, 7))
     
     sizes = sorted(df['size'].unique())
-    size_labels = {4: '4×4', 9: '9×9', 16: '16×16'}
+    size_labels = {s: f'{s}×{s}' for s in sizes}
     
     # Preparar dados para best case
     c_best_times = []
@@ -416,10 +521,10 @@ def plot_summary(df, output_dir):
     py_worst_times = []
     
     for s in sizes:
-        c_best = df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'best')]
-        py_best = df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'best')]
-        c_worst = df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'worst')]
-        py_worst = df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'worst')]
+        c_best = selecionar(df, 'c', s, 'best')
+        py_best = selecionar(df, 'python', s, 'best')
+        c_worst = selecionar(df, 'c', s, 'worst')
+        py_worst = selecionar(df, 'python', s, 'worst')
         
         c_best_times.append(c_best['avg_time'].values[0] * 1000 if len(c_best) > 0 else 0)  # Converter para ms
         py_best_times.append(py_best['avg_time'].values[0] * 1000 if len(py_best) > 0 else 0)
@@ -517,24 +622,24 @@ def plot_best_vs_worst(df, output_dir):
     fig, axes = plt.subplots(1, 2, figsize=(16, 6))
     
     sizes = sorted(df['size'].unique())
-    size_labels = {4: 'Small (4×4)', 9: 'Medium (9×9)', 16: 'Large (16×16)'}
+    size_labels = SIZE_LABELS
     
     # Tempo - separado por linguagem (porque os tempos são diferentes)
     ax1 = axes[0]
     x = np.arange(len(sizes))
     width = 0.2
     
-    c_best = [df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'best')]['avg_time'].values[0] 
-              if len(df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'best')]) > 0 else 0 
+    c_best = [selecionar(df, 'c', s, 'best')['avg_time'].values[0] 
+              if len(selecionar(df, 'c', s, 'best')) > 0 else 0 
               for s in sizes]
-    c_worst = [df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'worst')]['avg_time'].values[0] 
-               if len(df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'worst')]) > 0 else 0 
+    c_worst = [selecionar(df, 'c', s, 'worst')['avg_time'].values[0] 
+               if len(selecionar(df, 'c', s, 'worst')) > 0 else 0 
                for s in sizes]
-    py_best = [df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'best')]['avg_time'].values[0] 
-               if len(df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'best')]) > 0 else 0 
+    py_best = [selecionar(df, 'python', s, 'best')['avg_time'].values[0] 
+               if len(selecionar(df, 'python', s, 'best')) > 0 else 0 
                for s in sizes]
-    py_worst = [df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'worst')]['avg_time'].values[0] 
-                if len(df[(df['lang'] == 'python') & (df['size'] == s) & (df['case'] == 'worst')]) > 0 else 0 
+    py_worst = [selecionar(df, 'python', s, 'worst')['avg_time'].values[0] 
+                if len(selecionar(df, 'python', s, 'worst')) > 0 else 0 
                 for s in sizes]
     
     bars1_time = ax1.bar(x - 1.5*width, c_best, width, label='C - Best', color='#2E86AB', alpha=0.8)
@@ -566,11 +671,11 @@ def plot_best_vs_worst(df, output_dir):
     width_iter = 0.35  # Barras mais largas já que são apenas 2 por tamanho
     
     # Usar apenas dados de C (ou Python, tanto faz, são iguais)
-    best_iter = [df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'best')]['avg_iterations'].values[0] 
-                 if len(df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'best')]) > 0 else 0 
+    best_iter = [selecionar(df, 'c', s, 'best')['avg_iterations'].values[0] 
+                 if len(selecionar(df, 'c', s, 'best')) > 0 else 0 
                  for s in sizes]
-    worst_iter = [df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'worst')]['avg_iterations'].values[0] 
-                  if len(df[(df['lang'] == 'c') & (df['size'] == s) & (df['case'] == 'worst')]) > 0 else 0 
+    worst_iter = [selecionar(df, 'c', s, 'worst')['avg_iterations'].values[0] 
+                  if len(selecionar(df, 'c', s, 'worst')) > 0 else 0 
                   for s in sizes]
     
     bars1_iter = ax2.bar(x - width_iter/2, best_iter, width_iter, label='Best Case', color='#2E86AB', alpha=0.8)
@@ -624,13 +729,10 @@ def generate_statistics_report(df, output_dir):
             f.write(f"LINGUAGEM: {lang_name.upper()}\n")
             f.write(f"{'='*80}\n\n")
             
-            for size_str in ['small', 'medium', 'large']:
-                size_map = {'small': 4, 'medium': 9, 'large': 16}
-                size = size_map[size_str]
-                
+            for size_str, size in SIZE_NAMES.items():
                 for case in ['best', 'worst']:
                     case_name = 'Best Case' if case == 'best' else 'Worst Case'
-                    row = df[(df['lang'] == lang) & (df['size_str'] == size_str) & (df['case'] == case)]
+                    row = selecionar(df, lang, size, case)
                     
                     if not row.empty:
                         r = row.iloc[0]
@@ -669,7 +771,7 @@ def plot_standard_deviation(df, output_dir):
     fig, axes = plt.subplots(1, 2, figsize=(16, 6))
     
     sizes = sorted(df['size'].unique())
-    size_labels = {4: 'Small (4×4)', 9: 'Medium (9×9)', 16: 'Large (16×16)'}
+    size_labels = SIZE_LABELS
     
     # Gráfico 1: Best Case
     ax1 = axes[0]
@@ -680,8 +782,8 @@ def plot_standard_deviation(df, output_dir):
     py_best_std = []
     
     for s in sizes:
-        c_data = df[(df['size'] == s) & (df['case'] == 'best') & (df['lang'] == 'c')]
-        py_data = df[(df['size'] == s) & (df['case'] == 'best') & (df['lang'] == 'python')]
+        c_data = selecionar(df, 'c', s, 'best')
+        py_data = selecionar(df, 'python', s, 'best')
         
         c_std = c_data['std_time_ms'].values[0] if not c_data.empty else 0
         py_std = py_data['std_time_ms'].values[0] if not py_data.empty else 0
@@ -729,8 +831,8 @@ def plot_standard_deviation(df, output_dir):
     py_worst_std = []
     
     for s in sizes:
-        c_data = df[(df['size'] == s) & (df['case'] == 'worst') & (df['lang'] == 'c')]
-        py_data = df[(df['size'] == s) & (df['case'] == 'worst') & (df['lang'] == 'python')]
+        c_data = selecionar(df, 'c', s, 'worst')
+        py_data = selecionar(df, 'python', s, 'worst')
         
         c_std = c_data['std_time_ms'].values[0] if not c_data.empty else 0
         py_std = py_data['std_time_ms'].values[0] if not py_data.empty else 0
@@ -776,7 +878,103 @@ def plot_standard_deviation(df, output_dir):
     plt.close()
     print("✓ Gráfico 5 salvo: 5_desvio_padrao.png")
 
-def main():
+def plot_memory(df, output_dir):
+    """Gráfico 6: Pico de memória por configuração, ao lado do tempo médio."""
+    if 'avg_memory_kb' not in df or df['avg_memory_kb'].isna().all():
+        print("• Gráfico 6 ignorado: nenhum log com medidas de memória (use --memoria)")
+        return False
+    
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+    
+    sizes = sorted(df['size'].unique())
+    size_labels = SIZE_LABELS
+    x = np.arange(len(sizes))
+    width = 0.35
+    
+    # As duas linguagens medem coisas diferentes, então cada uma tem o próprio eixo:
+    # Python = pico de alocações do tracemalloc; C = pico de RSS do processo
+    paineis = [
+        (axes[0], 'python', 'Python - Pico de Alocações (tracemalloc)', '#A23B72'),
+        (axes[1], 'c', 'C - Pico de RSS do Processo', '#2E86AB'),
+    ]
+    
+    for ax, lang, title, color in paineis:
+        memoria = {}
+        tempo = {}
+        for case in ['best', 'worst']:
+            memoria[case] = []
+            tempo[case] = []
+            for s in sizes:
+                data = selecionar(df, lang, s, case)
+                valor = data['avg_memory_kb'].values[0] if len(data) > 0 else None
+                # NaN (e não 0) onde falta medida: sem barra e sem ponto no eixo log
+                memoria[case].append(valor if pd.notna(valor) else np.nan)
+                tempo[case].append(data['avg_time_ms'].values[0] if len(data) > 0 else np.nan)
+        
+        bars1 = ax.bar(x - width/2, memoria['best'], width, label='Memória - Best Case',
+                       color=color, alpha=0.5, edgecolor='black', linewidth=1.5)
+        bars2 = ax.bar(x + width/2, memoria['worst'], width, label='Memória - Worst Case',
+                       color=color, alpha=0.9, edgecolor='black', linewidth=1.5)
+        
+        for bars in [bars1, bars2]:
+            for bar in bars:
+                height = bar.get_height()
+                if height > 0:
+                    ax.text(bar.get_x() + bar.get_width()/2., height, f'{height:.1f} KB',
+                            ha='center', va='bottom', fontsize=8)
+        
+        ax.set_xlabel('Tamanho do Sudoku', fontweight='bold')
+        ax.set_ylabel('Pico de Memória Médio (KB)', fontweight='bold')
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_xticks(x)
+        ax.set_xticklabels([size_labels.get(s, f'{s}×{s}') for s in sizes])
+        ax.set_xlim(-0.5, len(sizes) - 0.5)
+        if np.isnan(memoria['best'] + memoria['worst']).all():
+            ax.set_ylim(0, 1)
+            ax.text(0.5, 0.5, 'Sem medidas de memória', transform=ax.transAxes,
+                    ha='center', va='center', fontsize=12, color='gray')
+        
+        # Tempo médio no eixo secundário, para comparar custo de memória e de tempo
+        ax_tempo = ax.twinx()
+        ax_tempo.plot(x, tempo['best'], marker='s', linestyle='--', color='#06A77D',
+                      linewidth=2, label='Tempo - Best Case')
+        ax_tempo.plot(x, tempo['worst'], marker='o', linestyle='--', color='#F18F01',
+                      linewidth=2, label='Tempo - Worst Case')
+        ax_tempo.set_ylabel('Tempo Médio (ms)', fontweight='bold')
+        ax_tempo.set_yscale('log')
+        
+        linhas, rotulos = ax.get_legend_handles_labels()
+        linhas_tempo, rotulos_tempo = ax_tempo.get_legend_handles_labels()
+        ax.legend(linhas + linhas_tempo, rotulos + rotulos_tempo, loc='upper left', fontsize=9)
+        ax.grid(True, alpha=0.3, axis='y')
+    
+    plt.tight_layout()
+    plt.savefig(output_dir / '6_memoria.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    print("✓ Gráfico 6 salvo: 6_memoria.png")
+
+# Saídas geradas e as colunas de que cada uma depende (além de lang/size/case)
+FIGURAS = [
+    ('estatisticas_detalhadas.txt', generate_statistics_report,
+     ('successful', 'total_runs', 'total_time', 'avg_time', 'std_time',
+      'avg_iterations', 'std_iterations', 'individual_times')),
+    ('1_tempo_comparacao.png', plot_time_comparison, ('avg_time',)),
+    ('2_tempo_vs_iteracoes.png', plot_time_vs_iterations,
+     ('avg_time', 'avg_iterations')),
+    ('3_best_vs_worst.png', plot_best_vs_worst, ('avg_time', 'avg_iterations')),
+    ('4_resumo_desempenho.png', plot_summary, ('avg_time',)),
+    ('5_desvio_padrao.png', plot_standard_deviation, ('std_time',)),
+    ('6_memoria.png', plot_memory, ('avg_time', 'avg_memory_kb')),
+]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera os gráficos de performance a partir dos logs.")
+    parser.add_argument('--forcar', action='store_true',
+                        help="regenera todas as figuras, mesmo sem mudança nos dados")
+    args = parser.parse_args(argv)
+    
+    _importar_dependencias()
+    
     # Diretórios
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
@@ -794,8 +992,9 @@ def main():
     print(f"\n📁 Lendo logs de: {logs_dir}")
     print(f"📁 Salvando gráficos em: {output_dir}\n")
     
-    # Carregar dados
-    df = load_data(logs_dir)
+    # Carregar dados (relendo apenas os logs alterados)
+    cache = CacheResultados(output_dir / CACHE_NOME)
+    df = load_data(logs_dir, cache)
     
     if df is None or len(df) == 0:
         print("❌ Nenhum dado encontrado nos logs!")
@@ -804,16 +1003,22 @@ def main():
     
     print(f"✓ {len(df)} configurações carregadas\n")
     
-    # Gerar relatório de estatísticas
-    generate_statistics_report(df, output_dir)
-    
-    # Gerar gráficos
+    # Gerar apenas as saídas cujos dados (ou o código deste script) mudaram
     print("Gerando gráficos...\n")
-    plot_time_comparison(df, output_dir)
-    plot_time_vs_iterations(df, output_dir)
-    plot_best_vs_worst(df, output_dir)
-    plot_summary(df, output_dir)
-    plot_standard_deviation(df, output_dir)
+    codigo = sha1_arquivo(Path(__file__))
+    regeneradas = 0
+    for nome, gerar, colunas in FIGURAS:
+        linhas = df[['lang', 'size', 'case', *colunas]].values.tolist()
+        impressao = impressao_digital([codigo, *linhas])
+        if not args.forcar and cache.figura_atualizada(nome, impressao, output_dir / nome):
+            print(f"• {nome}: dados sem mudança, mantido")
+            continue
+        if gerar(df, output_dir) is False:  # nada a gerar (ex.: sem logs com --memoria)
+            continue
+        cache.registrar_figura(nome, impressao)
+        regeneradas += 1
+    cache.salvar()
+    print(f"\n✓ {regeneradas}/{len(FIGURAS)} saídas regeneradas")
     
     print("\n" + "="*80)
     print("✅ Todos os gráficos foram gerados com sucesso!")
@@ -824,7 +1029,8 @@ def main():
     print("  2. 2_tempo_vs_iteracoes.png - Tempo vs Iterações (Eficiência)")
     print("  3. 3_best_vs_worst.png - Comparação Best vs Worst Case")
     print("  4. 4_resumo_desempenho.png - Análise de desempenho (resumo)")
-    print("  5. 5_desvio_padrao.png - Desvio-padrão dos tempos (Variabilidade)\n")
+    print("  5. 5_desvio_padrao.png - Desvio-padrão dos tempos (Variabilidade)")
+    print("  6. 6_memoria.png - Pico de memória ao lado do tempo (logs com --memoria)\n")
 
 if __name__ == "__main__":
     main()
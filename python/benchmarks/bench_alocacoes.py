@@ -0,0 +1,180 @@
+"""
+Micro-benchmark de alocações do núcleo de solve_sudoku_iterativo.
+
+Compara o núcleo atual (buffers pré-alocados) com o núcleo anterior, que
+recriava sublistas, lambdas e ranges a cada passo, reconstruído aqui a partir
+dos auxiliares de backtracking.py. Os dois percorrem a mesma árvore de busca,
+então o número de iterações deve ser idêntico.
+
+O CPython não expõe um contador de chamadas ao alocador, então as alocações
+são medidas com o tracemalloc de duas formas:
+
+- pico transitório: pico acima da memória viva antes da resolução;
+- bytes por iteração: com sys.settrace no frame do núcleo, soma a cada
+  'iterations += 1' quanto o pico passou da memória atual desde a iteração
+  anterior (objetos criados e descartados dentro do passo) e zera o pico.
+  O custo do próprio rastreamento é calibrado num laço vazio e descontado.
+  O frame rastreado é o do laço que de fato roda (_solve_iterativo_bits no
+  4x4 e 9x9 clássicos); se a sonda não disparar uma vez por iteração, o
+  benchmark para com erro em vez de relatar 0 bytes.
+
+Uso:
+    python3 bench_alocacoes.py [--size large] [--case worst] [--puzzles 10]
+"""
+import argparse
+import gc
+import inspect
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
+
+from sudoku import load_puzzles_from_file
+from backtracking import (SolveResult, TAMANHOS_BITS, solve_sudoku_iterativo, _find_all_empty_cells,
+                          _sort_empty_cells_by_mrv, _find_next_valid_number, _solve_iterativo_bits)
+
+PUZZLE_SEEDS = SRC_DIR.parent.parent / 'puzzle_seeds'
+SIZES = {'small': 4, '6x6': 6, 'medium': 9, '12x12': 12, 'large': 16}
+
+def solve_referencia(sudoku):
+    """Núcleo anterior: sublista + lambda por avanço e range por verificação."""
+    start_time = time.time()
+    iterations = 0
+    lista_vazias = _find_all_empty_cells(sudoku)
+    total_vazias = len(lista_vazias)
+    _sort_empty_cells_by_mrv(sudoku, lista_vazias, 0, total_vazias)
+
+    k = 0
+    last_k = -1
+    while -1 < k < total_vazias:
+        iterations += 1
+        if k > last_k and k < total_vazias - 1:
+            _sort_empty_cells_by_mrv(sudoku, lista_vazias, k, total_vazias)
+        last_k = k
+        cell = lista_vazias[k]
+        r, c = cell.row, cell.col
+        num_valido = _find_next_valid_number(sudoku, r, c, sudoku.grid[r][c] + 1)
+        if num_valido <= sudoku.size:
+            sudoku.grid[r][c] = num_valido
+            k += 1
+        else:
+            sudoku.grid[r][c] = 0
+            k -= 1
+
+    end_time = time.time()
+    return SolveResult(time_seconds=end_time - start_time, iterations=iterations,
+                       solved=k == total_vazias)
+
+def _laco_vazio(n):
+    """Calibração: o mesmo contador de solve_*, sem trabalho no passo."""
+    iterations = 0
+    while iterations < n:
+        iterations += 1
+    return iterations
+
+def nucleo_rastreado(solve, sudoku):
+    """Função cujo laço roda em solve(sudoku), seguindo o despacho de solve_sudoku_iterativo."""
+    if (solve is solve_sudoku_iterativo and sudoku.geometria.classica
+            and sudoku.size in TAMANHOS_BITS):
+        return _solve_iterativo_bits
+    return solve
+
+def bytes_por_iteracao(solve, *args, nucleo=None):
+    """
+    Média dos bytes alocados e descartados dentro de cada iteração de 'solve'
+    e quantas vezes a sonda disparou. 'nucleo' é a função que contém o laço
+    (padrão: a própria 'solve').
+    """
+    nucleo = nucleo or solve
+    codigo = nucleo.__code__
+    linhas, inicio = inspect.getsourcelines(nucleo)
+    alvo = next(inicio + i for i, linha in enumerate(linhas) if linha.strip() == 'iterations += 1')
+    soma = [0, 0]  # bytes, iterações
+
+    def rastrear_linha(frame, event, arg):
+        if event == 'line' and frame.f_lineno == alvo:
+            atual, pico = tracemalloc.get_traced_memory()
+            soma[0] += pico - atual
+            soma[1] += 1
+            tracemalloc.reset_peak()
+        return rastrear_linha
+
+    def rastrear_chamada(frame, event, arg):
+        return rastrear_linha if frame.f_code is codigo else None
+
+    gc.collect()
+    tracemalloc.start()
+    sys.settrace(rastrear_chamada)
+    try:
+        solve(*args)
+    finally:
+        sys.settrace(None)
+        tracemalloc.stop()
+    return soma[0] / max(soma[1], 1), soma[1]
+
+def medir(solve, puzzles, custo_rastreio):
+    """Retorna (iterações totais, segundos totais, maior pico transitório, bytes/iteração)."""
+    total_iteracoes = 0
+    total_tempo = 0.0
+    maior_pico = 0
+    bytes_iteracao = []
+
+    for original in puzzles:
+        # Tempo sem tracemalloc (ele deixa a execução bem mais lenta)
+        result = solve(original.copy())
+        total_iteracoes += result.iterations
+        total_tempo += result.time_seconds
+
+        sudoku = original.copy()
+        gc.collect()
+        tracemalloc.start()
+        antes, _ = tracemalloc.get_traced_memory()
+        solve(sudoku)
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        maior_pico = max(maior_pico, pico - antes)
+
+        nucleo = nucleo_rastreado(solve, original)
+        media, disparos = bytes_por_iteracao(solve, original.copy(), nucleo=nucleo)
+        if disparos != result.iterations:
+            raise RuntimeError(f"sonda de {nucleo.__name__} disparou {disparos} vezes "
+                               f"em {result.iterations} iterações")
+        bytes_iteracao.append(max(media - custo_rastreio, 0.0))
+
+    return total_iteracoes, total_tempo, maior_pico, sum(bytes_iteracao) / len(bytes_iteracao)
+
+def main():
+    parser = argparse.ArgumentParser(description="Alocações do núcleo do solver: atual vs. anterior.")
+    parser.add_argument('--size', choices=sorted(SIZES), default='large')
+    parser.add_argument('--case', choices=['best', 'worst'], default='worst')
+    parser.add_argument('--puzzles', type=int, default=10, help="quantos puzzles do arquivo usar")
+    args = parser.parse_args()
+
+    path = PUZZLE_SEEDS / f"{args.size}_{args.case}.txt"
+    puzzles = load_puzzles_from_file(str(path), SIZES[args.size])[:args.puzzles]
+    print(f"{len(puzzles)} puzzles de {path.name}\n")
+
+    custo_rastreio, _ = bytes_por_iteracao(_laco_vazio, 10000)
+    print(f"Custo do rastreamento descontado: {custo_rastreio:.1f} B/iteração\n")
+
+    print("{:<12} {:>12} {:>16} {:>22} {:>16}".format(
+        "Núcleo", "Iterações", "µs/iteração", "Pico transitório (B)", "B/iteração"))
+    print("-" * 82)
+
+    resultados = {}
+    for nome, solve in (('anterior', solve_referencia), ('atual', solve_sudoku_iterativo)):
+        iteracoes, tempo, pico, por_iteracao = medir(solve, puzzles, custo_rastreio)
+        resultados[nome] = iteracoes
+        print("{:<12} {:>12} {:>16.2f} {:>22} {:>16.1f}".format(
+            nome, iteracoes, tempo / iteracoes * 1e6, pico, por_iteracao))
+
+    if resultados['anterior'] != resultados['atual']:
+        print("\n✗ Número de iterações diferente entre os núcleos!")
+        sys.exit(1)
+    print("\n✓ Mesmas iterações nos dois núcleos")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+Suíte de benchmarks do solver Python (micro e macro).
+
+Micro-benchmarks medem as operações básicas isoladas (_is_safe,
+_count_possible_values, _sort_empty_cells_by_mrv, Sudoku.parse_from_string,
+count_empty_cells); macro-benchmarks resolvem o corpus fixo de
+corpus/{size}_{case}.txt (10 puzzles por tamanho e densidade, versionado no
+repositório) com um dos motores de main.ENGINES. Com o motor python, os
+macro/variante[...] resolvem os puzzles 9x9 de corpus/variante_{x,jigsaw,killer}.json
+(veja src/variantes.py).
+
+Como no pytest-benchmark, cada benchmark é calibrado para que uma rodada dure
+pelo menos --min-tempo (repetindo a chamada 'loops' vezes) e é medido em
+várias rodadas; o resultado é o tempo por chamada (mínimo, mediana, média,
+desvio padrão e IQR). O resultado completo pode ser gravado em JSON e
+comparado com uma baseline salva: benchmarks cujo tempo (mínimo por padrão,
+a estatística menos sensível a ruído para código determinístico; ou a
+mediana) piorou mais que --limite são apontados como regressão (código de
+saída 1). Nos macro, o total de iterações também é comparado, já que uma
+mudança nele indica que a busca mudou e não só a velocidade.
+
+Uso:
+    python3 bench_suite.py [--filtro TEXTO] [--engine python] [--json saida.json]
+    python3 bench_suite.py --salvar-baseline            # grava baseline.json
+    python3 bench_suite.py --comparar [baseline.json] [--limite 0.10] [--estatistica min]
+"""
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / 'src'
+PROJECT_ROOT = BENCH_DIR.parent.parent
+sys.path.insert(0, str(SRC_DIR))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from sudoku import Sudoku, load_puzzles_from_file
+from backtracking import (_is_safe, _count_possible_values, _sort_empty_cells_by_mrv,
+                          _find_all_empty_cells, solve_sudoku_iterativo)
+from main import ENGINES, SIZE_MAP, carregar_funcao
+from variantes import TIPOS, carregar_variantes
+from benchmark_history import info_maquina, revisao_atual
+
+CORPUS_DIR = BENCH_DIR / 'corpus'
+BASELINE_PADRAO = BENCH_DIR / 'baseline.json'
+VERSAO = 1
+
+class Benchmark(NamedTuple):
+    """Um benchmark: 'preparar' roda fora da medição e devolve a função medida."""
+    nome: str
+    grupo: str                                   # 'micro' ou 'macro'
+    preparar: Callable[[], Callable[[], Any]]
+    extra: Optional[Callable[[], Dict[str, Any]]] = None  # dados registrados além do tempo
+
+def carregar_corpus(size_str: str, case_str: str) -> List[Sudoku]:
+    size = SIZE_MAP[size_str][0]
+    return load_puzzles_from_file(str(CORPUS_DIR / f"{size_str}_{case_str}.txt"), size)
+
+# ---------------------------------------------------------------------------
+# Micro-benchmarks
+# ---------------------------------------------------------------------------
+
+def _micro_is_safe(size_str):
+    def preparar():
+        sudoku = carregar_corpus(size_str, 'worst')[0]
+        size = sudoku.size
+        consultas = [(r, c, num) for r in range(size) for c in range(size)
+                     for num in range(1, size + 1)]
+        def medir():
+            for r, c, num in consultas:
+                _is_safe(sudoku, r, c, num)
+        return medir
+    return preparar
+
+def _micro_count_possible_values(size_str):
+    def preparar():
+        sudoku = carregar_corpus(size_str, 'worst')[0]
+        vazias = _find_all_empty_cells(sudoku)
+        def medir():
+            for cell in vazias:
+                _count_possible_values(sudoku, cell.row, cell.col)
+        return medir
+    return preparar
+
+def _micro_sort_mrv(size_str):
+    def preparar():
+        sudoku = carregar_corpus(size_str, 'worst')[0]
+        original = _find_all_empty_cells(sudoku)
+        total = len(original)
+        def medir():
+            _sort_empty_cells_by_mrv(sudoku, original[:], 0, total)
+        return medir
+    return preparar
+
+def _micro_parse(size_str):
+    def preparar():
+        texto = carregar_corpus(size_str, 'worst')[0].to_string()
+        size = SIZE_MAP[size_str][0]
+        def medir():
+            Sudoku.parse_from_string(texto, size)
+        return medir
+    return preparar
+
+def _micro_count_empty(size_str):
+    def preparar():
+        sudoku = carregar_corpus(size_str, 'worst')[0]
+        return sudoku.count_empty_cells
+    return preparar
+
+MICRO = [
+    ('_is_safe', _micro_is_safe),
+    ('_count_possible_values', _micro_count_possible_values),
+    ('_sort_empty_cells_by_mrv', _micro_sort_mrv),
+    ('parse_from_string', _micro_parse),
+    ('count_empty_cells', _micro_count_empty),
+]
+
+# ---------------------------------------------------------------------------
+# Macro-benchmarks
+# ---------------------------------------------------------------------------
+
+def _macro_resolver(size_str, case_str, engine):
+    def preparar():
+        solve = carregar_funcao(ENGINES[engine])
+        puzzles = carregar_corpus(size_str, case_str)
+        def medir():
+            for sudoku in puzzles:
+                solve(sudoku.copy())
+        return medir
+
+    def extra():
+        solve = carregar_funcao(ENGINES[engine])
+        puzzles = carregar_corpus(size_str, case_str)
+        resultados = [solve(sudoku.copy()) for sudoku in puzzles]
+        return {
+            'puzzles': len(puzzles),
+            'celulas_vazias_media': sum(p.count_empty_cells() for p in puzzles) / len(puzzles),
+            'iteracoes': sum(r.iterations for r in resultados),
+            'resolvidos': sum(1 for r in resultados if r.solved),
+        }
+    return preparar, extra
+
+def _macro_variante(tipo):
+    def preparar():
+        puzzles = carregar_variantes(str(CORPUS_DIR / f"variante_{tipo}.json"))
+        def medir():
+            for sudoku in puzzles:
+                solve_sudoku_iterativo(sudoku.copy())
+        return medir
+
+    def extra():
+        puzzles = carregar_variantes(str(CORPUS_DIR / f"variante_{tipo}.json"))
+        resultados = [solve_sudoku_iterativo(sudoku.copy()) for sudoku in puzzles]
+        return {
+            'puzzles': len(puzzles),
+            'celulas_vazias_media': sum(p.count_empty_cells() for p in puzzles) / len(puzzles),
+            'iteracoes': sum(r.iterations for r in resultados),
+            'resolvidos': sum(1 for r in resultados if r.solved),
+        }
+    return preparar, extra
+
+def montar_benchmarks(engine: str) -> List[Benchmark]:
+    benchmarks = []
+    for nome, fabrica in MICRO:
+        for size_str in SIZE_MAP:
+            benchmarks.append(Benchmark(f"micro/{nome}[{size_str}]", 'micro', fabrica(size_str)))
+    for size_str in SIZE_MAP:
+        for case_str in ('best', 'worst'):
+            preparar, extra = _macro_resolver(size_str, case_str, engine)
+            benchmarks.append(Benchmark(f"macro/{engine}[{size_str}-{case_str}]", 'macro',
+                                        preparar, extra))
+    if engine == 'python':  # os outros motores só conhecem as regras clássicas
+        for tipo in TIPOS:
+            preparar, extra = _macro_variante(tipo)
+            benchmarks.append(Benchmark(f"macro/variante[{tipo}]", 'macro', preparar, extra))
+    return benchmarks
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def calibrar(funcao: Callable[[], Any], min_tempo: float) -> int:
+    """Número de chamadas por rodada para que a rodada dure pelo menos 'min_tempo'."""
+    loops = 1
+    while True:
+        inicio = time.perf_counter()
+        for _ in range(loops):
+            funcao()
+        duracao = time.perf_counter() - inicio
+        if duracao >= min_tempo:
+            return loops
+        # Estima direto a partir da última medida, com folga, em vez de só dobrar
+        loops = max(loops * 2, int(loops * min_tempo / max(duracao, 1e-9) * 1.2))
+
+def medir_benchmark(bench: Benchmark, rodadas: int, min_tempo: float) -> Dict[str, Any]:
+    funcao = bench.preparar()
+    loops = calibrar(funcao, min_tempo)
+
+    tempos = []
+    gc_ativo = gc.isenabled()
+    gc.disable()  # coletas no meio da rodada só somam ruído
+    try:
+        for _ in range(rodadas):
+            inicio = time.perf_counter()
+            for _ in range(loops):
+                funcao()
+            tempos.append((time.perf_counter() - inicio) / loops)
+    finally:
+        if gc_ativo:
+            gc.enable()
+
+    quartis = statistics.quantiles(tempos, n=4) if len(tempos) > 1 else [tempos[0]] * 3
+    resultado = {
+        'nome': bench.nome,
+        'grupo': bench.grupo,
+        'rodadas': rodadas,
+        'loops': loops,
+        'min': min(tempos),
+        'max': max(tempos),
+        'media': statistics.fmean(tempos),
+        'mediana': statistics.median(tempos),
+        'desvio': statistics.stdev(tempos) if len(tempos) > 1 else 0.0,
+        'iqr': quartis[2] - quartis[0],
+        'tempos': tempos,
+    }
+    if bench.extra is not None:
+        resultado['extra'] = bench.extra()
+    return resultado
+
+def formatar_tempo(segundos: float) -> str:
+    for unidade, fator in (('s', 1), ('ms', 1e3), ('µs', 1e6)):
+        if segundos * fator >= 1:
+            return f"{segundos * fator:.3f} {unidade}"
+    return f"{segundos * 1e9:.1f} ns"
+
+def imprimir_resultados(resultados: List[Dict[str, Any]]) -> None:
+    print("\n{:<46} {:>12} {:>12} {:>12} {:>8} {:>8}".format(
+        "Benchmark", "Mínimo", "Mediana", "Desvio", "Rodadas", "Loops"))
+    print("-" * 104)
+    for r in resultados:
+        print("{:<46} {:>12} {:>12} {:>12} {:>8} {:>8}".format(
+            r['nome'], formatar_tempo(r['min']), formatar_tempo(r['mediana']),
+            formatar_tempo(r['desvio']), r['rodadas'], r['loops']))
+
+# ---------------------------------------------------------------------------
+# Baseline
+# ---------------------------------------------------------------------------
+
+def comparar_com_baseline(resultados: List[Dict[str, Any]], baseline: Dict[str, Any],
+                          limite: float, estatistica: str = 'min') -> int:
+    """Imprime a variação de 'estatistica' contra a baseline; retorna o número de regressões."""
+    anteriores = {r['nome']: r for r in baseline.get('benchmarks', [])}
+    print(f"\nComparando com a baseline da revisão {baseline.get('revisao', '?')[:12]} "
+          f"({baseline.get('data', '?')}), {estatistica}, limite de {limite:.0%}\n")
+    print("{:<46} {:>12} {:>12} {:>9}  {}".format("Benchmark", "Antes", "Depois", "Δ%", "Resultado"))
+    print("-" * 104)
+
+    regressoes = 0
+    for r in resultados:
+        antes = anteriores.get(r['nome'])
+        if antes is None:
+            print("{:<46} {:>12} {:>12} {:>9}  {}".format(
+                r['nome'], "-", formatar_tempo(r[estatistica]), "-", "novo"))
+            continue
+
+        variacao = (r[estatistica] - antes[estatistica]) / antes[estatistica]
+        resultado = "="
+        if variacao > limite:
+            resultado = "✗ regressão"
+            regressoes += 1
+        elif variacao < -limite:
+            resultado = "✓ melhoria"
+
+        iters_antes = antes.get('extra', {}).get('iteracoes')
+        iters_depois = r.get('extra', {}).get('iteracoes')
+        if iters_antes is not None and iters_depois is not None and iters_antes != iters_depois:
+            resultado += f" (iterações {iters_antes} → {iters_depois})"
+
+        print("{:<46} {:>12} {:>12} {:>+8.1f}%  {}".format(
+            r['nome'], formatar_tempo(antes[estatistica]), formatar_tempo(r[estatistica]),
+            variacao * 100, resultado))
+
+    print(f"\n{regressoes} regressão(ões) acima de {limite:.0%}")
+    return regressoes
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Micro e macro benchmarks do solver Python.")
+    parser.add_argument('--filtro', default=None, help="só benchmarks cujo nome contém o texto")
+    parser.add_argument('--grupo', choices=['micro', 'macro'], default=None)
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='python',
+                        help="motor dos macro-benchmarks (padrão: python)")
+    parser.add_argument('--rodadas', type=int, default=7, help="rodadas por benchmark (padrão: 7)")
+    parser.add_argument('--min-tempo', type=float, default=0.05,
+                        help="duração mínima de uma rodada em segundos (padrão: 0.05)")
+    parser.add_argument('--json', default=None, help="grava os resultados neste arquivo JSON")
+    parser.add_argument('--salvar-baseline', action='store_true',
+                        help=f"grava os resultados como baseline ({BASELINE_PADRAO.name})")
+    parser.add_argument('--comparar', nargs='?', const=str(BASELINE_PADRAO), default=None,
+                        help="compara com uma baseline (padrão: baseline.json)")
+    parser.add_argument('--limite', type=float, default=0.10,
+                        help="piora relativa considerada regressão (padrão: 0.10)")
+    parser.add_argument('--estatistica', choices=['min', 'mediana'], default='min',
+                        help="estatística comparada com a baseline (padrão: min)")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.comparar:
+        try:
+            with open(args.comparar) as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"❌ Não foi possível ler a baseline {args.comparar}: {e}")
+            return 1
+
+    benchmarks = [b for b in montar_benchmarks(args.engine)
+                  if (args.grupo is None or b.grupo == args.grupo)
+                  and (args.filtro is None or args.filtro in b.nome)]
+    if not benchmarks:
+        print("❌ Nenhum benchmark selecionado")
+        return 1
+
+    resultados = []
+    for bench in benchmarks:
+        print(f"  {bench.nome}...", flush=True)
+        resultados.append(medir_benchmark(bench, args.rodadas, args.min_tempo))
+    imprimir_resultados(resultados)
+
+    saida = {
+        'versao': VERSAO,
+        'revisao': revisao_atual(),
+        'data': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'maquina': info_maquina(),
+        'engine': args.engine,
+        'benchmarks': resultados,
+    }
+    destinos = ([args.json] if args.json else []) + ([str(BASELINE_PADRAO)] if args.salvar_baseline else [])
+    for destino in destinos:
+        with open(destino, 'w') as f:
+            json.dump(saida, f, indent=2, ensure_ascii=False)
+        print(f"\n✓ Resultados salvos em {destino}")
+
+    if baseline is not None and comparar_com_baseline(resultados, baseline, args.limite, args.estatistica):
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
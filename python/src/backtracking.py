@@ -5,6 +5,8 @@ Módulo de backtracking iterativo para resolver Sudoku
 import time
 from typing import NamedTuple, List, Tuple
 from sudoku import Sudoku
+from trail import Trilha
+from metricas import MASCARA_AMOSTRA, amostrar_progresso
 
 class Coordenada(NamedTuple):
     """Estrutura para armazenar as coordenadas de uma célula"""
@@ -13,28 +15,63 @@ class Coordenada(NamedTuple):
 
 class SolveResult(NamedTuple):
     """Resultado da resolução do Sudoku"""
+    # Tempo de CPU da thread que resolveu (time.thread_time), a mesma medida do
+    # kernel C (CLOCK_THREAD_CPUTIME_ID); o solver paralelo mede tempo de parede
     time_seconds: float
     iterations: int
     solved: bool
+    nogoods_aprendidos: int = 0  # Conflitos guardados (motor nogoods)
+    podas_nogood: int = 0        # Valores descartados por um nogood já aprendido
 
 def solve_sudoku_iterativo(sudoku: Sudoku) -> SolveResult:
     """
     Resolve o Sudoku usando backtracking iterativo com lista de células vazias.
+
+    O núcleo trabalha sobre buffers alocados uma única vez por resolução (grid
+    plano, ordem das células, chaves e baldes da ordenação MRV, marcas de
+    valores usados), sem sublistas, lambdas ou ranges por passo. A busca é a
+    mesma de _sort_empty_cells_by_mrv/_find_next_valid_number, com as mesmas
+    iterações; o grid do Sudoku é atualizado ao final.
+
+    A ordenação MRV inicial acontece na primeira iteração (k = 0): ordenar
+    antes do laço e de novo em k = 0, pela mesma chave e com ordenação
+    estável, produziria a mesma ordem.
+
+    Só depende dos vizinhos da geometria, então resolve também X-Sudoku e
+    jigsaw sem custo extra; Killer (gaiolas com soma) vai para
+    _solve_iterativo_gaiolas, e este núcleo continua sem nenhum teste a mais.
     """
-    start_time = time.time()
+    if sudoku.geometria.gaiolas:
+        return _solve_iterativo_gaiolas(sudoku)
+    if sudoku.geometria.classica and sudoku.size in TAMANHOS_BITS:
+        return _solve_iterativo_bits(sudoku)
+
+    start_time = time.thread_time()
     iterations = 0
 
-    # 1. Encontrar todas as células para preencher
-    lista_vazias = _find_all_empty_cells(sudoku)
-    total_vazias = len(lista_vazias)
+    size = sudoku.size
+    grid = sudoku.grid
+    vizinhos = sudoku.geometria.peer_indices
+
+    # 1. Encontrar todas as células para preencher (mesma ordem de _find_all_empty_cells)
+    celulas = [num for row in grid for num in row]
+    ordem = [i for i, num in enumerate(celulas) if num == 0]
+    total_vazias = len(ordem)
 
     if total_vazias == 0:
-        end_time = time.time()
+        end_time = time.thread_time()
         return SolveResult(time_seconds=end_time - start_time, iterations=0, solved=True)
 
-    # 2. Ordenar células vazias por MRV (Minimum Remaining Values)
-    # Células com menos valores possíveis são processadas primeiro
-    _sort_empty_cells_by_mrv(sudoku, lista_vazias, 0, total_vazias)
+    # Buffers de trabalho reutilizados em todas as iterações
+    chaves = [0] * total_vazias      # valores possíveis de cada posição de 'ordem'
+    auxiliar = [0] * total_vazias    # destino da ordenação por contagem
+    baldes = [0] * (size + 1)
+    usado = [False] * (size + 1)     # valores presentes entre os vizinhos
+    usado[0] = True                  # vazio nunca conta como valor
+    faixa_baldes = range(size + 1)
+    restantes = [range(k, total_vazias) for k in range(total_vazias)]
+
+    mascara_amostra = MASCARA_AMOSTRA
 
     k = 0  # Índice da célula vazia atual
     last_k = -1  # Último valor de k para detectar quando avançamos
@@ -42,32 +79,423 @@ def solve_sudoku_iterativo(sudoku: Sudoku) -> SolveResult:
     while -1 < k < total_vazias:
         iterations += 1
         
-        # Print de progresso a cada 10 milhões de iterações (para puzzles grandes)
-        if iterations % 10000000 == 0:
-            print(f"  ... {iterations} iterações e contando...")
+        # Amostra de progresso para as métricas ao vivo (e print a cada 10 milhões de iterações)
+        if iterations & mascara_amostra == 0:
+            amostrar_progresso(iterations, k)
         
         # Reordenar células restantes por MRV apenas quando avançamos (não quando recuamos)
-        # Isso evita reordenações desnecessárias durante backtracking
+        # Isso evita reordenações desnecessárias durante backtracking. A ordenação é
+        # estável e por contagem (como _sort_empty_cells_by_mrv, sem criar listas)
         if k > last_k and k < total_vazias - 1:
-            _sort_empty_cells_by_mrv(sudoku, lista_vazias, k, total_vazias)
+            faixa = restantes[k]
+            for v in faixa_baldes:
+                baldes[v] = 0
+            for i in faixa:
+                peers = vizinhos[ordem[i]]
+                distintos = 0
+                for p in peers:
+                    v = celulas[p]
+                    if not usado[v]:
+                        usado[v] = True
+                        distintos += 1
+                for p in peers:
+                    usado[celulas[p]] = False
+                usado[0] = True
+                n = size - distintos
+                chaves[i] = n
+                baldes[n] += 1
+
+            pos = k
+            for v in faixa_baldes:
+                quantidade = baldes[v]
+                baldes[v] = pos
+                pos += quantidade
+            for i in faixa:
+                n = chaves[i]
+                auxiliar[baldes[n]] = ordem[i]
+                baldes[n] += 1
+            for i in faixa:
+                ordem[i] = auxiliar[i]
         
         last_k = k
         
+        cel = ordem[k]
+        peers = vizinhos[cel]
+
+        # Próximo valor válido: marca os valores dos vizinhos e procura o primeiro livre
+        for p in peers:
+            usado[celulas[p]] = True
+        num = celulas[cel] + 1
+        while num <= size and usado[num]:
+            num += 1
+        for p in peers:
+            usado[celulas[p]] = False
+        usado[0] = True
+
+        if num <= size:
+            celulas[cel] = num
+            k += 1
+        else:
+            celulas[cel] = 0
+            k -= 1
+
+    for r in range(size):
+        grid[r][:] = celulas[r * size:(r + 1) * size]
+
+    end_time = time.thread_time()
+    solved = k == total_vazias
+    return SolveResult(time_seconds=end_time - start_time, iterations=iterations, solved=solved)
+
+# Tamanhos clássicos com núcleo de máscaras de bits (_solve_iterativo_bits)
+TAMANHOS_BITS = (4, 9)
+
+class TabelasBits(NamedTuple):
+    """Tabelas pré-computadas do núcleo de bits para um tamanho (bit v = valor v)"""
+    linha: Tuple[int, ...]     # linha, coluna e bloco de cada célula do grid plano
+    coluna: Tuple[int, ...]
+    bloco: Tuple[int, ...]
+    livres: Tuple[int, ...]    # máscara de valores usados -> quantidade de valores livres
+    menor: Tuple[int, ...]     # máscara -> menor valor presente (0 se vazia)
+    acima: Tuple[int, ...]     # valor atual -> máscara dos valores maiores que ele
+
+_TABELAS_BITS = {}
+
+def _tabelas_bits(sudoku: Sudoku) -> TabelasBits:
+    """Tabelas do núcleo de bits, montadas uma vez por tamanho."""
+    size = sudoku.size
+    tabelas = _TABELAS_BITS.get(size)
+    if tabelas is None:
+        geometria = sudoku.geometria
+        todos = ((1 << size) - 1) << 1
+        tabelas = TabelasBits(
+            linha=tuple(r for r in range(size) for _ in range(size)),
+            coluna=tuple(c for _ in range(size) for c in range(size)),
+            bloco=tuple(b for row in geometria.box_id for b in row),
+            livres=tuple(size - bin(m & todos).count('1') for m in range(2 << size)),
+            menor=tuple((m & -m).bit_length() - 1 if m else 0 for m in range(2 << size)),
+            acima=tuple(todos & ~((2 << v) - 1) for v in range(size + 1)),
+        )
+        _TABELAS_BITS[size] = tabelas
+    return tabelas
+
+def _solve_iterativo_bits(sudoku: Sudoku) -> SolveResult:
+    """
+    solve_sudoku_iterativo para 4x4 e 9x9 clássicos, com máscaras de bits.
+
+    Nos tabuleiros clássicos os vizinhos de uma célula são exatamente sua
+    linha, coluna e bloco, então os valores presentes entre eles são o OU de
+    três máscaras (uma por unidade) mantidas a cada atribuição. A quantidade
+    de valores livres (chave MRV) e o próximo valor válido saem de tabelas
+    indexadas pela máscara (2^(size+1) entradas: 1024 no 9x9), sem percorrer
+    os 20 vizinhos. Ordem das células, valores tentados e iterações são os
+    mesmos do núcleo genérico.
+    """
+    start_time = time.thread_time()
+    iterations = 0
+
+    size = sudoku.size
+    grid = sudoku.grid
+    linha, coluna, bloco, livres, menor, acima = _tabelas_bits(sudoku)
+
+    celulas = [num for row in grid for num in row]
+    ordem = [i for i, num in enumerate(celulas) if num == 0]
+    total_vazias = len(ordem)
+
+    if total_vazias == 0:
+        end_time = time.thread_time()
+        return SolveResult(time_seconds=end_time - start_time, iterations=0, solved=True)
+
+    # Valores presentes em cada linha, coluna e bloco
+    linhas = [0] * size
+    colunas = [0] * size
+    blocos = [0] * size
+    for i, num in enumerate(celulas):
+        if num:
+            bit = 1 << num
+            linhas[linha[i]] |= bit
+            colunas[coluna[i]] |= bit
+            blocos[bloco[i]] |= bit
+
+    chaves = [0] * total_vazias
+    auxiliar = [0] * total_vazias
+    baldes = [0] * (size + 1)
+    faixa_baldes = range(size + 1)
+    restantes = [range(k, total_vazias) for k in range(total_vazias)]
+
+    mascara_amostra = MASCARA_AMOSTRA
+
+    k = 0
+    last_k = -1
+
+    while -1 < k < total_vazias:
+        iterations += 1
+
+        if iterations & mascara_amostra == 0:
+            amostrar_progresso(iterations, k)
+
+        # Mesma ordenação por contagem do núcleo genérico; as células de
+        # ordem[k:] estão vazias, então as máscaras têm só os vizinhos
+        if k > last_k and k < total_vazias - 1:
+            faixa = restantes[k]
+            for v in faixa_baldes:
+                baldes[v] = 0
+            for i in faixa:
+                cel = ordem[i]
+                n = livres[linhas[linha[cel]] | colunas[coluna[cel]] | blocos[bloco[cel]]]
+                chaves[i] = n
+                baldes[n] += 1
+
+            pos = k
+            for v in faixa_baldes:
+                quantidade = baldes[v]
+                baldes[v] = pos
+                pos += quantidade
+            for i in faixa:
+                n = chaves[i]
+                auxiliar[baldes[n]] = ordem[i]
+                baldes[n] += 1
+            for i in faixa:
+                ordem[i] = auxiliar[i]
+
+        last_k = k
+
+        cel = ordem[k]
+        r = linha[cel]
+        c = coluna[cel]
+        b = bloco[cel]
+        atual = celulas[cel]
+        if atual:
+            # Retira o valor atual das máscaras antes de procurar o próximo
+            bit = ~(1 << atual)
+            linhas[r] &= bit
+            colunas[c] &= bit
+            blocos[b] &= bit
+
+        num = menor[acima[atual] & ~(linhas[r] | colunas[c] | blocos[b])]
+        if num:
+            celulas[cel] = num
+            bit = 1 << num
+            linhas[r] |= bit
+            colunas[c] |= bit
+            blocos[b] |= bit
+            k += 1
+        else:
+            celulas[cel] = 0
+            k -= 1
+
+    for r in range(size):
+        grid[r][:] = celulas[r * size:(r + 1) * size]
+
+    end_time = time.thread_time()
+    solved = k == total_vazias
+    return SolveResult(time_seconds=end_time - start_time, iterations=iterations, solved=solved)
+
+def _filtrar_por_soma(celulas: List[int], cel: int, candidatos: int, indices: Tuple[int, ...],
+                      soma: int, size: int) -> int:
+    """
+    Remove da máscara 'candidatos' de 'cel' os valores que tornam a soma da gaiola inviável.
+
+    Com v em 'cel', as células vazias restantes precisam de valores distintos
+    ainda livres na gaiola; a soma que falta tem de caber entre a soma dos
+    menores e a dos maiores desses valores.
+    """
+    soma_atual = 0
+    vazias = 0
+    usados = 0
+    for p in indices:
+        if p != cel:
+            num = celulas[p]
+            if num:
+                soma_atual += num
+                usados |= 1 << num
+            else:
+                vazias += 1
+
+    disponiveis = [num for num in range(1, size + 1) if not usados >> num & 1]
+    resultado = 0
+    restantes = candidatos
+    while restantes:
+        bit = restantes & -restantes
+        restantes ^= bit
+        num = bit.bit_length() - 1
+        falta = soma - soma_atual - num
+        if vazias == 0:
+            viavel = falta == 0
+        else:
+            outros = [d for d in disponiveis if d != num]
+            viavel = len(outros) >= vazias and sum(outros[:vazias]) <= falta <= sum(outros[-vazias:])
+        if viavel:
+            resultado |= bit
+    return resultado
+
+def _solve_iterativo_gaiolas(sudoku: Sudoku) -> SolveResult:
+    """
+    A busca de solve_sudoku_iterativo para geometrias com gaiolas (Killer Sudoku).
+
+    Mesma ordem (MRV estável refeito a cada avanço) e mesma escolha de valores
+    (o menor possível acima do atual), mas os valores possíveis de uma célula
+    de gaiola também precisam manter a soma da gaiola alcançável.
+    """
+    start_time = time.thread_time()
+    iterations = 0
+
+    geometria = sudoku.geometria
+    size = sudoku.size
+    grid = sudoku.grid
+    vizinhos = geometria.peer_indices
+    gaiola_de = geometria.gaiola_de
+    gaiola_indices = geometria.gaiola_indices
+    somas = [gaiola.soma for gaiola in geometria.gaiolas]
+    completo = ((1 << (size + 1)) - 1) ^ 1
+
+    celulas = [num for row in grid for num in row]
+    ordem = [i for i, num in enumerate(celulas) if num == 0]
+    total_vazias = len(ordem)
+
+    if total_vazias == 0:
+        end_time = time.thread_time()
+        return SolveResult(time_seconds=end_time - start_time, iterations=0, solved=True)
+
+    def possiveis(cel: int) -> int:
+        usados = 0
+        for p in vizinhos[cel]:
+            usados |= 1 << celulas[p]
+        livres = completo & ~usados
+        g = gaiola_de[cel]
+        if g >= 0 and livres:
+            livres = _filtrar_por_soma(celulas, cel, livres, gaiola_indices[g], somas[g], size)
+        return livres
+
+    def contar(cel: int) -> int:
+        return possiveis(cel).bit_count()
+
+    mascara_amostra = MASCARA_AMOSTRA
+
+    k = 0
+    last_k = -1
+
+    while -1 < k < total_vazias:
+        iterations += 1
+
+        if iterations & mascara_amostra == 0:
+            amostrar_progresso(iterations, k)
+
+        if k > last_k and k < total_vazias - 1:
+            ordem[k:] = sorted(ordem[k:], key=contar)
+
+        last_k = k
+
+        cel = ordem[k]
+        acima = celulas[cel] + 1
+        livres = possiveis(cel) >> acima << acima  # só valores maiores que o atual
+
+        if livres:
+            celulas[cel] = (livres & -livres).bit_length() - 1
+            k += 1
+        else:
+            celulas[cel] = 0
+            k -= 1
+
+    for r in range(size):
+        grid[r][:] = celulas[r * size:(r + 1) * size]
+
+    end_time = time.thread_time()
+    return SolveResult(time_seconds=end_time - start_time, iterations=iterations,
+                       solved=k == total_vazias)
+
+def solve_sudoku_trilha(sudoku: Sudoku) -> SolveResult:
+    """
+    Backtracking iterativo com estado incremental desfeito por uma trilha.
+
+    Mantém máscaras de bits dos valores usados em cada linha, coluna e bloco
+    (bit v = valor v). Cada atribuição altera o grid e as três máscaras pela
+    trilha; ao voltar a uma posição, apenas essas alterações são desfeitas.
+    A ordem de busca (MRV) é a mesma de solve_sudoku_iterativo, portanto as
+    iterações também são.
+    """
+    start_time = time.thread_time()
+    iterations = 0
+
+    lista_vazias = _find_all_empty_cells(sudoku)
+    total_vazias = len(lista_vazias)
+
+    if total_vazias == 0:
+        end_time = time.thread_time()
+        return SolveResult(time_seconds=end_time - start_time, iterations=0, solved=True)
+
+    size = sudoku.size
+    grid = sudoku.grid
+    box_id = sudoku.geometria.box_id
+    completo = ((1 << (size + 1)) - 1) ^ 1
+
+    # Máscaras iniciais a partir das pistas
+    usados_linha = [0] * size
+    usados_coluna = [0] * size
+    usados_bloco = [0] * size
+    for r in range(size):
+        for c in range(size):
+            num = grid[r][c]
+            if num:
+                bit = 1 << num
+                usados_linha[r] |= bit
+                usados_coluna[c] |= bit
+                usados_bloco[box_id[r][c]] |= bit
+
+    def livres(cell: Coordenada) -> int:
+        r, c = cell
+        return completo & ~(usados_linha[r] | usados_coluna[c] | usados_bloco[box_id[r][c]])
+
+    def contar(cell: Coordenada) -> int:
+        return livres(cell).bit_count()
+
+    trilha = Trilha()
+    atribuir = trilha.atribuir
+    marcas = [0] * total_vazias  # Ponto da trilha antes da atribuição de cada posição
+
+    lista_vazias.sort(key=contar)
+
+    mascara_amostra = MASCARA_AMOSTRA
+
+    k = 0
+    last_k = -1
+
+    while -1 < k < total_vazias:
+        iterations += 1
+
+        if iterations & mascara_amostra == 0:
+            amostrar_progresso(iterations, k)
+
+        if k > last_k and k < total_vazias - 1:
+            lista_vazias[k:] = sorted(lista_vazias[k:], key=contar)
+
+        last_k = k
+
         cell = lista_vazias[k]
         r, c = cell.row, cell.col
+        b = box_id[r][c]
 
-        num_inicio = sudoku.grid[r][c] + 1
-        
-        num_valido = _find_next_valid_number(sudoku, r, c, num_inicio)
+        atual = grid[r][c]
+        if atual:
+            # Revisitando a posição: desfaz exatamente a atribuição anterior dela
+            trilha.desfazer_ate(marcas[k])
+        else:
+            marcas[k] = trilha.marcar()
+
+        # Candidatos maiores que o valor atual
+        candidatos = livres(cell) & ~((2 << atual) - 1)
 
-        if num_valido <= sudoku.size:
-            sudoku.grid[r][c] = num_valido
+        if candidatos:
+            num = (candidatos & -candidatos).bit_length() - 1
+            bit = 1 << num
+            atribuir(grid[r], c, num)
+            atribuir(usados_linha, r, usados_linha[r] | bit)
+            atribuir(usados_coluna, c, usados_coluna[c] | bit)
+            atribuir(usados_bloco, b, usados_bloco[b] | bit)
             k += 1
         else:
-            sudoku.grid[r][c] = 0
             k -= 1
-            
-    end_time = time.time()
+
+    end_time = time.thread_time()
     solved = k == total_vazias
     return SolveResult(time_seconds=end_time - start_time, iterations=iterations, solved=solved)
 
@@ -103,31 +531,30 @@ def _find_next_valid_number(sudoku: Sudoku, r: int, c: int, num_inicio: int) ->
     return sudoku.size + 1
 
 def _is_safe(sudoku: Sudoku, r: int, c: int, num: int) -> bool:
-    """Verifica se é seguro colocar 'num' na célula [r][c]."""
-    return not _is_in_row(sudoku, r, num) and \
-           not _is_in_col(sudoku, c, num) and \
-           not _is_in_box(sudoku, r, c, num)
+    """Verifica se é seguro colocar 'num' na célula [r][c] (linha, coluna e bloco via vizinhos)."""
+    grid = sudoku.grid
+    for pr, pc in sudoku.geometria.peers[r][c]:
+        if grid[pr][pc] == num:
+            return False
+    return True
 
 def _is_in_row(sudoku: Sudoku, r: int, num: int) -> bool:
     """Verifica se 'num' já existe na linha 'r'."""
-    for c in range(sudoku.size):
-        if sudoku.grid[r][c] == num:
-            return True
-    return False
+    return num in sudoku.grid[r]
 
 def _is_in_col(sudoku: Sudoku, c: int, num: int) -> bool:
     """Verifica se 'num' já existe na coluna 'c'."""
-    for r in range(sudoku.size):
-        if sudoku.grid[r][c] == num:
+    grid = sudoku.grid
+    for r, _ in sudoku.geometria.col_cells[c]:
+        if grid[r][c] == num:
             return True
     return False
 
 def _is_in_box(sudoku: Sudoku, r: int, c: int, num: int) -> bool:
-    """Verifica se 'num' já existe no bloco (box_size x box_size)."""
-    box_start_row = r - r % sudoku.box_size
-    box_start_col = c - c % sudoku.box_size
-    for i in range(sudoku.box_size):
-        for j in range(sudoku.box_size):
-            if sudoku.grid[box_start_row + i][box_start_col + j] == num:
-                return True
+    """Verifica se 'num' já existe no bloco (box_rows x box_cols) da célula [r][c]."""
+    grid = sudoku.grid
+    geometria = sudoku.geometria
+    for br, bc in geometria.box_cells[geometria.box_id[r][c]]:
+        if grid[br][bc] == num:
+            return True
     return False
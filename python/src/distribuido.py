@@ -0,0 +1,305 @@
+"""
+Resolução distribuída: um coordenador divide um arquivo de puzzles em fatias
+e as entrega a trabalhadores (nesta ou em outras máquinas) por TCP.
+
+As fatias seguem a numeração dos cabeçalhos '=== Puzzle i/N ===' e levam o
+texto dos puzzles, então o trabalhador não precisa ter o arquivo. Protocolo:
+uma mensagem JSON por linha, nos dois sentidos.
+
+    trabalhador -> {"tipo": "ola", "nome": "host:pid"}
+    coordenador -> {"tipo": "fatia", "fatia": 2, "size": 9, "engine": "python",
+                    "puzzles": [[11, "texto"], [12, "texto"], ...]}
+    trabalhador -> {"tipo": "resultado", "fatia": 2, "resultados": [
+                       {"puzzle": 11, "vazias": 40, "tempo": 0.0004, "iteracoes": 58,
+                        "resolvido": true}, ...]}
+    coordenador -> próxima fatia, ou {"tipo": "fim"} quando todas terminaram
+
+Uma conexão que fecha, falha ou passa de 'prazo' segundos sem entregar a
+fatia conta como trabalhador morto: a fatia volta para a fila e vai para o
+próximo trabalhador livre; a conexão do trabalhador lento é fechada, e o
+que ele resolveu daquela fatia se perde.
+
+Cada resultado é gravado como uma linha JSON (com 'fatia' e 'trabalhador')
+em logs/distribuido_{size}_{case}.jsonl. Com 'locais' > 0 o coordenador
+inicia ele mesmo trabalhadores em processos locais, para testar numa só máquina.
+"""
+import json
+import multiprocessing as mp
+import os
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+class Fatia(NamedTuple):
+    """Puzzles consecutivos do arquivo, entregues juntos a um trabalhador"""
+    indice: int
+    puzzles: Tuple[Tuple[int, str], ...]  # (número do cabeçalho, texto do grid)
+
+def fatiar(puzzle_file: str, tamanho: int) -> List[Fatia]:
+    """Divide o arquivo em fatias de até 'tamanho' puzzles, pela numeração dos cabeçalhos."""
+    with open(puzzle_file) as f:
+        content = f.read()
+
+    puzzles = []
+    for numero, section in enumerate(content.split("=== Puzzle")[1:], 1):  # mesma leitura de load_puzzles_from_file
+        lines = section.strip().split('\n')
+        if len(lines) > 1:
+            cabecalho = lines[0].split('/')[0].strip()
+            puzzles.append((int(cabecalho) if cabecalho.isdigit() else numero, '\n'.join(lines[1:])))
+    return [Fatia(i, tuple(puzzles[inicio:inicio + tamanho]))
+            for i, inicio in enumerate(range(0, len(puzzles), tamanho))]
+
+def _enviar(arquivo, mensagem: Dict) -> None:
+    arquivo.write(json.dumps(mensagem) + '\n')
+    arquivo.flush()
+
+def _receber(arquivo) -> Optional[Dict]:
+    """Próxima mensagem, ou None se a conexão fechou."""
+    linha = arquivo.readline()
+    return json.loads(linha) if linha else None
+
+class _Estado:
+    """Fila de fatias do coordenador, compartilhada pelas threads de conexão."""
+
+    def __init__(self, fatias: List[Fatia]):
+        self.fatias = {f.indice: f for f in fatias}
+        self.pendentes = deque(self.fatias)
+        self.em_andamento: Dict[int, str] = {}  # fatia -> trabalhador
+        self.concluidas = set()
+        self.condicao = threading.Condition()
+
+    @property
+    def terminado(self) -> bool:
+        return len(self.concluidas) == len(self.fatias)
+
+    def proxima(self, trabalhador: str) -> Optional[Fatia]:
+        """Fatia para 'trabalhador'; espera enquanto outras podem voltar para a fila."""
+        with self.condicao:
+            while not self.pendentes and not self.terminado:
+                self.condicao.wait()
+            if self.terminado:
+                return None
+            indice = self.pendentes.popleft()
+            self.em_andamento[indice] = trabalhador
+            return self.fatias[indice]
+
+    def devolver(self, indice: int) -> None:
+        with self.condicao:
+            if self.em_andamento.pop(indice, None) is not None and indice not in self.concluidas:
+                self.pendentes.appendleft(indice)
+            self.condicao.notify_all()
+
+    def concluir(self, indice: int) -> bool:
+        """Marca a fatia como concluída; False se ela já tinha sido entregue."""
+        with self.condicao:
+            self.em_andamento.pop(indice, None)
+            if indice in self.concluidas:
+                return False
+            self.concluidas.add(indice)
+            self.condicao.notify_all()
+            return True
+
+class Coordenador:
+    """Servidor TCP que entrega as fatias e grava os resultados."""
+
+    def __init__(self, fatias: List[Fatia], size: int, engine: str, saida,
+                 rotulos: Dict[str, str], prazo: float):
+        self.estado = _Estado(fatias)
+        self.size = size
+        self.engine = engine
+        self.saida = saida
+        self.rotulos = rotulos
+        self.prazo = prazo
+        self.registros: List[Dict] = []
+        self.reatribuicoes = 0
+        self._trava_saida = threading.Lock()
+
+    def atender(self, conexao: socket.socket, endereco) -> None:
+        """Conversa com um trabalhador até o fim das fatias ou a morte da conexão."""
+        conexao.settimeout(self.prazo)
+        arquivo = conexao.makefile('rw', encoding='utf-8')
+        nome = f"{endereco[0]}:{endereco[1]}"
+        fatia = None
+        try:
+            ola = _receber(arquivo)
+            if ola is None or ola.get('tipo') != 'ola':
+                return
+            nome = ola.get('nome', nome)
+            print(f"  + trabalhador {nome}", flush=True)
+
+            while True:
+                fatia = self.estado.proxima(nome)
+                if fatia is None:
+                    _enviar(arquivo, {'tipo': 'fim'})
+                    return
+                _enviar(arquivo, {'tipo': 'fatia', 'fatia': fatia.indice, 'size': self.size,
+                                  'engine': self.engine, 'puzzles': fatia.puzzles})
+                resposta = _receber(arquivo)
+                if resposta is None or resposta.get('fatia') != fatia.indice:
+                    raise ConnectionError(resposta.get('erro') if resposta else "conexão fechada")
+                self._gravar(fatia, nome, resposta['resultados'])
+                fatia = None
+        except (OSError, ValueError, KeyError) as e:  # inclui socket.timeout
+            if fatia is not None:
+                self.reatribuicoes += 1
+                print(f"  ✗ trabalhador {nome} perdido ({type(e).__name__}: {e}); "
+                      f"fatia {fatia.indice} volta para a fila", flush=True)
+        finally:
+            if fatia is not None:
+                self.estado.devolver(fatia.indice)
+            try:
+                arquivo.close()
+                conexao.close()
+            except OSError:
+                pass
+
+    def _gravar(self, fatia: Fatia, nome: str, resultados: List[Dict]) -> None:
+        with self._trava_saida:
+            if not self.estado.concluir(fatia.indice):
+                return
+            for resultado in resultados:
+                registro = {**self.rotulos, **resultado, 'fatia': fatia.indice, 'trabalhador': nome}
+                self.registros.append(registro)
+                self.saida.write(json.dumps(registro) + '\n')
+            self.saida.flush()
+            print(f"  [{nome}] fatia {fatia.indice}: {len(resultados)} puzzles, "
+                  f"{sum(r['resolvido'] for r in resultados)} resolvidos "
+                  f"({len(self.estado.concluidas)}/{len(self.estado.fatias)} fatias)", flush=True)
+
+def executar_trabalhador(host: str, porta: int, nome: Optional[str] = None,
+                         tentativas_conexao: int = 30) -> int:
+    """
+    Conecta ao coordenador e resolve fatias até receber 'fim'.
+
+    Tenta conectar uma vez por segundo, até 'tentativas_conexao' vezes, para
+    que os trabalhadores possam ser iniciados antes do coordenador.
+    Retorna quantas fatias resolveu.
+    """
+    from main import ENGINES, carregar_funcao
+    from sudoku import Sudoku
+    from verifier import verify_solution
+
+    nome = nome or f"{socket.gethostname()}:{os.getpid()}"
+    for tentativa in range(tentativas_conexao):
+        try:
+            conexao = socket.create_connection((host, porta))
+            break
+        except OSError:
+            if tentativa == tentativas_conexao - 1:
+                raise
+            time.sleep(1.0)
+
+    motores = {}
+    feitas = 0
+    with conexao, conexao.makefile('rw', encoding='utf-8') as arquivo:
+        _enviar(arquivo, {'tipo': 'ola', 'nome': nome})
+        while True:
+            mensagem = _receber(arquivo)
+            if mensagem is None or mensagem['tipo'] == 'fim':
+                return feitas
+            engine = mensagem['engine']
+            if engine not in motores:
+                motores[engine] = carregar_funcao(ENGINES[engine])
+            solve = motores[engine]
+
+            resultados = []
+            for numero, texto in mensagem['puzzles']:
+                sudoku = Sudoku.parse_from_string(texto, mensagem['size'])
+                original = sudoku.copy()
+                result = solve(sudoku)
+                resultados.append({
+                    'puzzle': numero,
+                    'vazias': original.count_empty_cells(),
+                    'tempo': result.time_seconds,
+                    'iteracoes': result.iterations,
+                    'resolvido': result.solved and verify_solution(sudoku.grid, original.grid).valid,
+                })
+            _enviar(arquivo, {'tipo': 'resultado', 'fatia': mensagem['fatia'],
+                              'resultados': resultados})
+            feitas += 1
+
+def _trabalhador_local(host: str, porta: int, nome: str) -> None:
+    """Processo de um trabalhador local (--locais), com a saída descartada."""
+    with open(os.devnull, 'w') as nulo:
+        sys.stdout = nulo
+        executar_trabalhador(host, porta, nome)
+
+def executar_coordenador(size_str: str, case_str: str, puzzle_file: Optional[str] = None,
+                         host: str = '0.0.0.0', porta: int = 9200, tamanho_fatia: int = 5,
+                         engine: str = 'python', locais: int = 0, prazo: float = 600.0,
+                         saida: Optional[str] = None) -> bool:
+    """
+    Distribui o arquivo de puzzles e espera todas as fatias.
+
+    Retorna False se a configuração for inválida, o arquivo não existir, ou
+    os trabalhadores locais morrerem antes do fim. Sem trabalhadores locais,
+    espera conexões até todas as fatias serem entregues.
+    """
+    from main import ENGINES, SIZE_MAP
+
+    if size_str not in SIZE_MAP:
+        print(f"Tamanho inválido. Use: {', '.join(SIZE_MAP)}")
+        return False
+    if engine not in ENGINES:
+        print(f"Motor inválido. Use: {', '.join(ENGINES)}")
+        return False
+    if puzzle_file is None:
+        puzzle_file = f"../../puzzle_seeds/{size_str}_{case_str}.txt"
+    if not os.path.exists(puzzle_file):
+        print(f"Erro: Arquivo de puzzles não encontrado: {puzzle_file}")
+        print("Execute primeiro: make build-generator && ./c/bin/puzzle_generator")
+        return False
+    if saida is None:
+        saida = f"../../logs/distribuido_{size_str}_{case_str}.jsonl"
+    os.makedirs(os.path.dirname(saida) or '.', exist_ok=True)
+
+    fatias = fatiar(puzzle_file, tamanho_fatia)
+    servidor = socket.create_server((host, porta))
+    servidor.settimeout(0.2)
+    porta = servidor.getsockname()[1]  # porta 0 escolhe uma livre
+    print(f"Coordenador {size_str} {case_str}: {sum(len(f.puzzles) for f in fatias)} puzzles "
+          f"em {len(fatias)} fatias, ouvindo em {host}:{porta}", flush=True)
+
+    ctx = mp.get_context()
+    processos = [ctx.Process(target=_trabalhador_local,
+                             args=('127.0.0.1', porta, f"local-{i}"), daemon=True)
+                 for i in range(1, locais + 1)]
+    for p in processos:
+        p.start()
+
+    inicio = time.time()
+    ok = True
+    conexoes = []
+    with open(saida, 'w') as arquivo, servidor:
+        coordenador = Coordenador(fatias, SIZE_MAP[size_str][0], engine, arquivo,
+                                  {'tamanho': size_str, 'caso': case_str, 'motor': engine}, prazo)
+        while not coordenador.estado.terminado:
+            try:
+                conexao, endereco = servidor.accept()
+            except socket.timeout:
+                if (processos and not coordenador.estado.terminado
+                        and not any(p.is_alive() for p in processos)):
+                    print("  ✗ Todos os trabalhadores locais terminaram antes do fim")
+                    ok = False
+                    break
+                continue
+            conexoes.append(threading.Thread(target=coordenador.atender, args=(conexao, endereco),
+                                             daemon=True))
+            conexoes[-1].start()
+
+        # As conexões ainda abertas gravam a última fatia e avisam 'fim' aos seus trabalhadores
+        for t in conexoes:
+            t.join(timeout=1.0)
+    for p in processos:
+        p.join(timeout=5.0)
+
+    registros = coordenador.registros
+    print(f"\n  {len(registros)} puzzles, {sum(r['resolvido'] for r in registros)} resolvidos, "
+          f"em {time.time() - inicio:.2f}s de parede")
+    print(f"  Trabalhadores: {len({r['trabalhador'] for r in registros})}, "
+          f"fatias reatribuídas: {coordenador.reatribuicoes}")
+    print(f"  Resultados salvos em: {saida}")
+    return ok
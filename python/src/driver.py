@@ -0,0 +1,367 @@
+"""
+Driver de longa duração para a análise de complexidade.
+
+Executa todas as configurações num único processo Python, em vez de iniciar
+um interpretador novo por configuração: os módulos do solver são importados
+uma vez, e as bibliotecas pesadas (pandas, matplotlib, numpy, ctypes,
+multiprocessing) só são carregadas pelos subcomandos que precisam delas.
+
+Uso:
+    python3 driver.py run [--langs c python] [--sizes ...] [--cases ...] [--engine python] [--plot]
+                          [--metricas-porta 9100] [--status-arquivo status.prom]
+                          [--paralelo N [--sem-smt] [--max-por-numa M]] [--ruido-maximo 0.25] [--tentativas 3]
+    python3 driver.py pareado [--sizes ...] [--cases ...] [--inicio 0] [--quantidade 30] [--cpus 0 1]
+    python3 driver.py coordenador [--sizes ...] [--cases ...] [--porta 9200] [--fatia 5] [--locais N]
+    python3 driver.py trabalhador --host HOST [--porta 9200]
+    python3 driver.py plot
+    python3 driver.py startup [--repeticoes 10] [--alvo-ms 100]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = SRC_DIR.parent.parent
+C_BIN_DIR = PROJECT_ROOT / 'c' / 'bin'
+PLOT_DIR = PROJECT_ROOT / 'plot'
+
+SIZES = ('small', '6x6', 'medium', '12x12', 'large')  # as chaves de main.SIZE_MAP
+CASES = ('best', 'worst')
+LANGS = ('c', 'python')
+NOMES_LANG = {'c': 'C', 'python': 'Python'}
+
+# Módulos que o caminho de resolução padrão não deve importar
+MODULOS_PESADOS = ('numpy', 'pandas', 'matplotlib', 'ctypes', 'multiprocessing')
+
+def _caminho_log(lang, size, case, engine):
+    """Log gravado pela configuração (mesmos nomes de main.c e main.py)."""
+    sufixo = f"_{engine}" if lang == 'python' and engine != 'python' else ""
+    return PROJECT_ROOT / 'logs' / f"{lang}_{size}_{case}{sufixo}.log"
+
+def _executar_configuracao(lang, size, case, engine, saida=None):
+    """Executa uma configuração; as de Python rodam neste mesmo processo."""
+    if lang == 'c':
+        # O solver C é um binário próprio; não há interpretador a reaproveitar
+        return subprocess.run([str(C_BIN_DIR / 'sudoku_solver'), size, case],
+                              cwd=C_BIN_DIR, stdout=saida).returncode == 0
+    from main import executar_configuracao
+    return executar_configuracao(size, case, engine=engine)
+
+def _executar_estavel(lang, size, case, engine, ruido_maximo, tentativas, saida=None):
+    """
+    Executa a configuração duas vezes e mede o ruído comparando as medidas de
+    cada puzzle (escalonador.ruido_entre_logs). Enquanto ele passar de
+    ruido_maximo, executa de novo e compara com a execução anterior, até
+    'tentativas' execuções; fica o log do par menos ruidoso. Com uma única
+    tentativa não há com o que comparar.
+
+    Retorna (ok, ruído ou None, execuções feitas).
+    """
+    from escalonador import ruido_entre_logs
+    log = _caminho_log(lang, size, case, engine)
+    anterior = None
+    melhor = None  # (ruído, conteúdo do log)
+    for tentativa in range(1, tentativas + 1):
+        if not _executar_configuracao(lang, size, case, engine, saida):
+            return False, None, tentativa
+        conteudo = log.read_text()
+        if anterior is None:
+            anterior = conteudo
+            continue
+        ruido = ruido_entre_logs(anterior, conteudo)
+        if ruido is None:
+            return True, None, tentativa  # puzzles comparáveis insuficientes para medir
+        if melhor is None or ruido < melhor[0]:
+            melhor = (ruido, conteudo)
+        if ruido <= ruido_maximo:
+            break
+        print(f"  ⚠ Execução ruidosa: diferença média entre as medidas de cada puzzle "
+              f"{ruido:.2f} > {ruido_maximo:.2f}" + (" - repetindo" if tentativa < tentativas else ""))
+        anterior = conteudo
+    if melhor is None:
+        return True, None, tentativa
+    log.write_text(melhor[1])
+    return True, melhor[0], tentativa
+
+def _descrever(ok, ruido, execucoes):
+    if not ok:
+        return "✗ falhou"
+    medida = f"ruído {ruido:.2f}" if ruido is not None else "ruído indisponível"
+    return f"✓ {medida}" + (f" após {execucoes} execuções" if execucoes > 2 else "")
+
+def cmd_run(args):
+    """Executa as configurações pedidas, em sequência ou em núcleos dedicados (--paralelo)."""
+    configs = [(lang, size, case) for lang in args.langs for size in args.sizes for case in args.cases]
+    if args.paralelo:
+        falhas = _executar_em_paralelo(configs, args)
+    else:
+        falhas = _executar_em_sequencia(configs, args)
+
+    if args.plot:
+        falhas += cmd_plot(args)
+
+    return 1 if falhas else 0
+
+def _executar_em_sequencia(configs, args):
+    from metricas import PROGRESSO, iniciar_exportadores
+    falhas = 0
+    exportadores = iniciar_exportadores(args.metricas_porta, args.status_arquivo,
+                                        args.status_intervalo)
+    try:
+        for passo, (lang, size, case) in enumerate(configs, 1):
+            print(f"\n[{passo}/{len(configs)}] Executando: {NOMES_LANG[lang]} - "
+                  f"{size.capitalize()} - {case.capitalize()} Case")
+            PROGRESSO.definir_varredura(passo, len(configs))
+            if lang == 'c':
+                # As métricas mostram só a configuração do C, sem execuções nem iterações
+                PROGRESSO.iniciar_configuracao('c', size, case, 'c', 30)
+            ok, ruido, tentativas = _executar_estavel(lang, size, case, args.engine,
+                                                      args.ruido_maximo, args.tentativas)
+            if not ok:
+                falhas += 1
+                print(f"  ✗ Falha em {lang} {size} {case}")
+            elif tentativas > 2:
+                print(f"  {_descrever(ok, ruido, tentativas)}")
+    finally:
+        for exportador in exportadores:
+            exportador.parar()
+    return falhas
+
+def _worker_configuracao(passo, lang, size, case, engine, cpu, ruido_maximo, tentativas, fila):
+    """Processo de uma configuração no modo --paralelo: fixa o núcleo e descarta a saída."""
+    os.sched_setaffinity(0, {cpu})  # o binário C herda a afinidade
+    resultado = (False, None, 0)
+    with open(os.devnull, 'w') as nulo:
+        sys.stdout = nulo
+        try:
+            resultado = _executar_estavel(lang, size, case, engine, ruido_maximo, tentativas, nulo)
+        except Exception:
+            traceback.print_exc()  # stderr continua no terminal
+        finally:
+            fila.put((passo, *resultado))
+
+def _executar_em_paralelo(configs, args):
+    """Distribui as configurações entre workers, um por núcleo dedicado (ver escalonador.py)."""
+    import multiprocessing as mp
+    import queue
+    from escalonador import cpus_dedicados, ler_topologia
+
+    cpus = cpus_dedicados(ler_topologia(), args.sem_smt, args.max_por_numa)[:args.paralelo]
+    if not cpus:
+        print("❌ Nenhum núcleo disponível com as restrições pedidas")
+        return 1
+    print(f"Executando {len(configs)} configurações em {len(cpus)} workers "
+          f"(CPUs {', '.join(map(str, cpus))})")
+    if len(cpus) < args.paralelo:
+        print(f"  Apenas {len(cpus)} núcleos atendem às restrições (pedidos: {args.paralelo})")
+
+    ctx = mp.get_context()
+    fila = ctx.Queue()
+    pendentes = list(enumerate(configs, 1))
+    livres = list(cpus)
+    ativos = {}  # passo -> (processo, cpu)
+    falhas = 0
+
+    while pendentes or ativos:
+        while pendentes and livres:
+            passo, (lang, size, case) = pendentes.pop(0)
+            cpu = livres.pop(0)
+            p = ctx.Process(target=_worker_configuracao,
+                            args=(passo, lang, size, case, args.engine, cpu,
+                                  args.ruido_maximo, args.tentativas, fila))
+            p.start()
+            ativos[passo] = (p, cpu)
+
+        try:
+            passo, ok, ruido, tentativas = fila.get(timeout=1.0)
+        except queue.Empty:
+            # Um worker que morreu sem responder (ex.: sinal) conta como falha
+            mortos = [passo for passo, (p, _) in ativos.items() if not p.is_alive() and p.exitcode]
+            if not mortos:
+                continue
+            passo, ok, ruido, tentativas = mortos[0], False, None, 0
+
+        p, cpu = ativos.pop(passo)
+        p.join()
+        livres.append(cpu)
+        lang, size, case = configs[passo - 1]
+        falhas += not ok
+        print(f"[{passo}/{len(configs)}] {NOMES_LANG[lang]} - {size.capitalize()} - "
+              f"{case.capitalize()} Case (CPU {cpu}): {_descrever(ok, ruido, tentativas)}", flush=True)
+
+    return falhas
+
+def cmd_pareado(args):
+    """C e Python em paralelo nos mesmos puzzles, um par de processos por configuração (ver pareado.py)."""
+    from pareado import executar_pareado
+    falhas = 0
+    for size in args.sizes:
+        for case in args.cases:
+            if not executar_pareado(size, case, inicio=args.inicio, quantidade=args.quantidade,
+                                    cpus=args.cpus, engine=args.engine):
+                falhas += 1
+                print(f"  ✗ Falha em {size} {case}")
+            print()
+    return 1 if falhas else 0
+
+def cmd_coordenador(args):
+    """Distribui cada configuração em fatias para trabalhadores por TCP (ver distribuido.py)."""
+    from distribuido import executar_coordenador
+    falhas = 0
+    for size in args.sizes:
+        for case in args.cases:
+            if not executar_coordenador(size, case, host=args.host, porta=args.porta,
+                                        tamanho_fatia=args.fatia, engine=args.engine,
+                                        locais=args.locais, prazo=args.prazo):
+                falhas += 1
+                print(f"  ✗ Falha em {size} {case}")
+            print()
+    return 1 if falhas else 0
+
+def cmd_trabalhador(args):
+    """Resolve fatias de um coordenador até ele avisar o fim."""
+    from distribuido import executar_trabalhador
+    feitas = executar_trabalhador(args.host, args.porta, args.nome)
+    print(f"{feitas} fatias resolvidas")
+    return 0
+
+def cmd_plot(args):
+    """Gera os gráficos no mesmo processo (importa pandas/matplotlib só aqui)."""
+    sys.path.insert(0, str(PLOT_DIR))
+    try:
+        import plot_results
+        plot_results.main([])
+    except ImportError as e:
+        print(f"❌ Dependência de plotagem ausente: {e.name}")
+        print(f"Instale com: pip install -r {PLOT_DIR / 'requirements.txt'}")
+        return 1
+    return 0
+
+def _medir_inicializacao(codigo, repeticoes):
+    """Mediana, em ms, do tempo de parede de 'python -c codigo' num processo novo."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, '-c', codigo], cwd=SRC_DIR, check=True)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+def cmd_startup(args):
+    """Mede a inicialização do caminho de resolução e compara com o alvo."""
+    interpretador = _medir_inicializacao('pass', args.repeticoes)
+    caminho = _medir_inicializacao('import main; main.carregar_funcao(main.ENGINES["python"])',
+                                   args.repeticoes)
+
+    verificacao = subprocess.run(
+        [sys.executable, '-c',
+         'import sys, main; main.carregar_funcao(main.ENGINES["python"]); '
+         f'print(",".join(m for m in {MODULOS_PESADOS!r} if m in sys.modules))'],
+        cwd=SRC_DIR, capture_output=True, text=True, check=True)
+    carregados = verificacao.stdout.strip()
+
+    print(f"Interpretador vazio:      {interpretador:.1f} ms")
+    print(f"Caminho de resolução:     {caminho:.1f} ms (alvo: {args.alvo_ms:.0f} ms)")
+    print(f"Custo dos imports:        {caminho - interpretador:.1f} ms")
+    if carregados:
+        print(f"✗ Módulos pesados carregados sem necessidade: {carregados}")
+
+    if caminho > args.alvo_ms or carregados:
+        print("✗ Inicialização acima do alvo")
+        return 1
+    print("✓ Inicialização dentro do alvo")
+    return 0
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Driver único para todas as configurações.")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    run = sub.add_parser('run', help="executa as configurações num único processo")
+    run.add_argument('--langs', nargs='+', choices=LANGS, default=list(LANGS))
+    run.add_argument('--sizes', nargs='+', choices=SIZES, default=list(SIZES))
+    run.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES))
+    run.add_argument('--engine', default='python',
+                     help="motor das configurações Python (ver main.py --engine)")
+    run.add_argument('--plot', action='store_true', help="gera os gráficos ao final")
+    run.add_argument('--metricas-porta', type=int, default=None,
+                     help="expõe métricas ao vivo em http://127.0.0.1:PORTA/metrics")
+    run.add_argument('--status-arquivo', default=None,
+                     help="reescreve periodicamente as métricas ao vivo neste arquivo")
+    run.add_argument('--status-intervalo', type=float, default=2.0)
+    run.add_argument('--paralelo', type=int, default=0,
+                     help="executa até N configurações ao mesmo tempo, cada uma fixada num núcleo")
+    run.add_argument('--sem-smt', action='store_true',
+                     help="com --paralelo, usa um só processador lógico por núcleo físico")
+    run.add_argument('--max-por-numa', type=int, default=None,
+                     help="com --paralelo, no máximo M workers por nó NUMA")
+    run.add_argument('--ruido-maximo', type=float, default=0.25,
+                     help="diferença relativa média entre duas medidas do mesmo puzzle "
+                          "acima da qual a configuração é repetida")
+    run.add_argument('--tentativas', type=int, default=3,
+                     help="execuções de uma configuração (a partir de 2 o ruído é medido) "
+                          "antes de aceitar o par menos ruidoso")
+    run.set_defaults(funcao=cmd_run)
+
+    pareado = sub.add_parser('pareado', help="C e Python em paralelo nos mesmos puzzles, "
+                                             "com o mesmo relógio e núcleos fixos")
+    pareado.add_argument('--sizes', nargs='+', choices=SIZES, default=list(SIZES))
+    pareado.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES))
+    pareado.add_argument('--inicio', type=int, default=0, help="primeiro puzzle da fatia (a partir de 0)")
+    pareado.add_argument('--quantidade', type=int, default=30, help="puzzles na fatia")
+    pareado.add_argument('--cpus', nargs='+', type=int, default=None,
+                         help="núcleos do processo C e do Python (padrão: os dois primeiros permitidos)")
+    pareado.add_argument('--engine', default='python',
+                         help="motor do lado Python (ver main.py --engine)")
+    pareado.set_defaults(funcao=cmd_pareado)
+
+    coordenador = sub.add_parser('coordenador', help="divide os puzzles em fatias e as distribui "
+                                                     "para trabalhadores por TCP")
+    coordenador.add_argument('--sizes', nargs='+', choices=SIZES, default=list(SIZES))
+    coordenador.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES))
+    coordenador.add_argument('--host', default='0.0.0.0', help="endereço onde ouvir os trabalhadores")
+    coordenador.add_argument('--porta', type=int, default=9200)
+    coordenador.add_argument('--fatia', type=int, default=5, help="puzzles por fatia")
+    coordenador.add_argument('--engine', default='python',
+                             help="motor usado pelos trabalhadores (ver main.py --engine)")
+    coordenador.add_argument('--locais', type=int, default=0,
+                             help="inicia N trabalhadores em processos locais")
+    coordenador.add_argument('--prazo', type=float, default=600.0,
+                             help="segundos sem resposta até a fatia voltar para a fila")
+    coordenador.set_defaults(funcao=cmd_coordenador)
+
+    trabalhador = sub.add_parser('trabalhador', help="resolve fatias enviadas por um coordenador")
+    trabalhador.add_argument('--host', required=True)
+    trabalhador.add_argument('--porta', type=int, default=9200)
+    trabalhador.add_argument('--nome', default=None, help="nome nos resultados (padrão: host:pid)")
+    trabalhador.set_defaults(funcao=cmd_trabalhador)
+
+    plot = sub.add_parser('plot', help="gera os gráficos a partir dos logs")
+    plot.set_defaults(funcao=cmd_plot)
+
+    startup = sub.add_parser('startup', help="mede a inicialização do caminho de resolução")
+    startup.add_argument('--repeticoes', type=int, default=10)
+    startup.add_argument('--alvo-ms', type=float, default=100.0)
+    startup.set_defaults(funcao=cmd_startup)
+
+    args = parser.parse_args()
+    if args.comando == 'run':
+        if args.paralelo and (args.metricas_porta or args.status_arquivo):
+            parser.error("as métricas ao vivo acompanham uma configuração por vez (sem --paralelo)")
+        if args.paralelo and not hasattr(os, 'sched_setaffinity'):
+            parser.error("--paralelo requer afinidade de CPU (Linux)")
+        if (args.sem_smt or args.max_por_numa) and not args.paralelo:
+            parser.error("--sem-smt e --max-por-numa valem só com --paralelo")
+    return args
+
+def main():
+    args = parse_args()
+    # main.py grava logs e lê puzzles com caminhos relativos a python/src
+    os.chdir(SRC_DIR)
+    sys.exit(args.funcao(args))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Escalonamento de configurações em núcleos dedicados e detecção de execuções ruidosas.
+
+driver.py run --paralelo N executa várias configurações ao mesmo tempo, cada
+uma num processo fixado num núcleo próprio (os.sched_setaffinity; o binário C
+herda a afinidade). A topologia vem de /sys/devices/system/cpu:
+
+- sem_smt: usa só um processador lógico por núcleo físico, para que dois
+  workers não dividam as unidades de execução de um mesmo núcleo (SMT/HT);
+- max_por_numa: limita os workers de cada nó NUMA (cache L3 e banda de
+  memória compartilhadas).
+
+Ruído: os tempos das 30 execuções variam com a dificuldade de cada puzzle,
+então nem o desvio-padrão do log (o de plot_standard_deviation) nem o do
+tempo por iteração separam puzzle difícil de interferência: a estrutura do
+puzzle também muda o custo de cada iteração. ruido_entre_logs() compara duas
+execuções da mesma configuração, puzzle a puzzle; com a mesma busca (mesmas
+iterações), a diferença entre as duas medidas é só ruído. Uma configuração
+acima do limite é executada de novo (ver driver.py).
+"""
+import glob
+import os
+import statistics
+import sys
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+RAIZ_CPU = '/sys/devices/system/cpu'
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent  # analyze_results.py
+
+class Processador(NamedTuple):
+    """Processador lógico: id, núcleo físico (menor id entre os irmãos SMT) e nó NUMA"""
+    cpu: int
+    nucleo: int
+    numa: int
+
+def _parse_lista_cpus(texto: str) -> List[int]:
+    """'0-3,8,10-11' -> [0, 1, 2, 3, 8, 10, 11] (formato de cpulist do Linux)"""
+    cpus = []
+    for parte in texto.strip().split(','):
+        if not parte:
+            continue
+        inicio, _, fim = parte.partition('-')
+        cpus.extend(range(int(inicio), int(fim or inicio) + 1))
+    return cpus
+
+def _ler(caminho: str) -> Optional[str]:
+    try:
+        with open(caminho) as f:
+            return f.read()
+    except OSError:
+        return None
+
+def ler_topologia(raiz: str = RAIZ_CPU) -> List[Processador]:
+    """
+    Processadores que este processo pode usar, com núcleo físico e nó NUMA.
+
+    Sem sysfs (ou sem afinidade de CPU), cada processador vira o próprio
+    núcleo, no nó 0.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        permitidos = sorted(os.sched_getaffinity(0))
+    else:
+        permitidos = list(range(os.cpu_count() or 1))
+
+    topologia = []
+    for cpu in permitidos:
+        irmaos = _ler(f'{raiz}/cpu{cpu}/topology/thread_siblings_list')
+        nucleo = min(_parse_lista_cpus(irmaos)) if irmaos else cpu
+        nos = glob.glob(f'{raiz}/cpu{cpu}/node[0-9]*')
+        numa = int(os.path.basename(nos[0])[4:]) if nos else 0
+        topologia.append(Processador(cpu, nucleo, numa))
+    return topologia
+
+def cpus_dedicados(topologia: List[Processador], sem_smt: bool = False,
+                   max_por_numa: Optional[int] = None) -> List[int]:
+    """Processadores onde os workers podem ser fixados, um worker por processador."""
+    escolhidos = []
+    nucleos_usados = set()
+    por_numa = {}
+    for p in topologia:
+        if sem_smt and p.nucleo in nucleos_usados:
+            continue
+        if max_por_numa is not None and por_numa.get(p.numa, 0) >= max_por_numa:
+            continue
+        escolhidos.append(p.cpu)
+        nucleos_usados.add(p.nucleo)
+        por_numa[p.numa] = por_numa.get(p.numa, 0) + 1
+    return escolhidos
+
+# Tempos abaixo disso ficam presos à resolução do log (6 casas decimais)
+TEMPO_MINIMO = 0.0001
+
+def ruido_entre_logs(conteudo_a: str, conteudo_b: str) -> Optional[float]:
+    """
+    Diferença relativa média entre as duas medidas de cada puzzle em dois logs
+    da mesma configuração; None com menos de dois puzzles comparáveis.
+
+    Só entram execuções resolvidas nos dois logs, com as mesmas iterações e
+    tempos de pelo menos TEMPO_MINIMO.
+    """
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    from analyze_results import parse_runs
+
+    segunda = {r['run']: r for r in parse_runs(conteudo_b)}
+    diferencas = []
+    for a in parse_runs(conteudo_a):
+        b = segunda.get(a['run'])
+        if (b is None or not (a['solved'] and b['solved'])
+                or a['iterations'] != b['iterations']):
+            continue
+        menor = min(a['time'], b['time'])
+        if menor >= TEMPO_MINIMO:
+            diferencas.append(abs(a['time'] - b['time']) / menor)
+    if len(diferencas) < 2:
+        return None
+    return statistics.mean(diferencas)
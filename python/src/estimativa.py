@@ -0,0 +1,216 @@
+"""
+Estimativa do esforço de busca antes de resolver (sondagens de Knuth).
+
+Cada sondagem desce da raiz da árvore de solve_sudoku_iterativo escolhendo a
+célula pela mesma ordenação MRV (ordenação estável das células restantes pelo
+número de valores possíveis, refeita a cada avanço) e um valor possível ao
+acaso. Se as células da descida tiveram d1, d2, ... valores possíveis, a
+sondagem estima a árvore completa em 1 + d1 + d1*d2 + ... nós (estimador
+não enviesado de Knuth, 1975); a estimativa é a média das sondagens feitas
+dentro do orçamento.
+
+O solver para na primeira solução: cada nó custa duas iterações (avançar e,
+depois, recuar ao esgotar a célula seguinte) e, com solução única em posição
+arbitrária, metade da árvore é percorrida em média, então as iterações
+previstas são iguais aos nós estimados. O tempo previsto usa o custo por
+iteração medido num puzzle do mesmo tamanho e número de vazias.
+
+As máscaras de valores usados por linha, coluna e bloco são as mesmas de
+solve_sudoku_trilha, para que uma sondagem custe pouco mais que uma descida
+sem recuos.
+
+Uso:
+    python3 estimativa.py <size> <puzzle_file> [--sondagens 32] [--orcamento-ms 50] [--semente 0]
+"""
+import argparse
+import math
+import random
+import statistics
+import time
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from sudoku import Sudoku, load_puzzles_from_file
+from backtracking import solve_sudoku_iterativo, _find_all_empty_cells
+
+class Estimativa(NamedTuple):
+    """Esforço previsto para resolver um puzzle com solve_sudoku_iterativo"""
+    nos: float              # nós estimados da árvore de busca completa
+    iteracoes: float        # iterações previstas até a primeira solução
+    segundos: float         # tempo previsto (custo por iteração calibrado)
+    sondagens: int          # sondagens feitas dentro do orçamento
+    erro_relativo: float    # erro padrão relativo da média das sondagens
+
+def sondar_arvore(sudoku: Sudoku, aleatorio: random.Random) -> float:
+    """Uma sondagem de Knuth: desce por valores aleatórios e retorna a estimativa de nós."""
+    size = sudoku.size
+    grid = sudoku.grid
+    box_id = sudoku.geometria.box_id
+    completo = ((1 << (size + 1)) - 1) ^ 1
+
+    usados_linha = [0] * size
+    usados_coluna = [0] * size
+    usados_bloco = [0] * size
+    for r in range(size):
+        for c in range(size):
+            num = grid[r][c]
+            if num:
+                bit = 1 << num
+                usados_linha[r] |= bit
+                usados_coluna[c] |= bit
+                usados_bloco[box_id[r][c]] |= bit
+
+    def livres(cell) -> int:
+        r, c = cell
+        return completo & ~(usados_linha[r] | usados_coluna[c] | usados_bloco[box_id[r][c]])
+
+    def contar(cell) -> int:
+        return livres(cell).bit_count()
+
+    ordem = _find_all_empty_cells(sudoku)
+    total_vazias = len(ordem)
+    nos = 1.0
+    peso = 1.0
+
+    for k in range(total_vazias):
+        # Mesma regra do solver: reordena as restantes a cada avanço, exceto na última
+        if k < total_vazias - 1:
+            ordem[k:] = sorted(ordem[k:], key=contar)
+
+        cell = ordem[k]
+        possiveis = livres(cell)
+        ramos = possiveis.bit_count()
+        if ramos == 0:
+            break  # beco sem saída: a sondagem termina aqui
+
+        peso *= ramos
+        nos += peso
+
+        valor = aleatorio.choice([v for v in range(1, size + 1) if possiveis >> v & 1])
+        bit = 1 << valor
+        r, c = cell
+        usados_linha[r] |= bit
+        usados_coluna[c] |= bit
+        usados_bloco[box_id[r][c]] |= bit
+
+    return nos
+
+@lru_cache(maxsize=None)
+def custo_por_iteracao(size: int, vazias: int) -> float:
+    """
+    Segundos por iteração de solve_sudoku_iterativo para o tamanho e as vazias dados.
+
+    Mede um puzzle fácil (grid canônico com 'vazias' células apagadas), que
+    percorre todas as células sem recuar: o custo por iteração depende das
+    células restantes na ordenação MRV, não da dificuldade.
+    """
+    sudoku = Sudoku(size)
+    box_rows, box_cols = sudoku.box_rows, sudoku.box_cols
+    sudoku.grid = [[(box_cols * (r % box_rows) + r // box_rows + c) % size + 1 for c in range(size)]
+                   for r in range(size)]
+    for i in random.Random(0).sample(range(size * size), min(vazias, size * size)):
+        sudoku.grid[i // size][i % size] = 0
+
+    inicio = time.perf_counter()
+    result = solve_sudoku_iterativo(sudoku)
+    return (time.perf_counter() - inicio) / max(result.iterations, 1)
+
+def estimar_esforco(sudoku: Sudoku, sondagens: int = 32, orcamento_segundos: float = 0.05,
+                    semente: Optional[int] = 0) -> Estimativa:
+    """
+    Estima o esforço de resolver 'sudoku' com até 'sondagens' sondagens.
+
+    Para ao atingir o orçamento de tempo (sempre faz ao menos uma sondagem).
+    Com a mesma semente, a estimativa de um puzzle é reprodutível.
+    """
+    aleatorio = random.Random(semente)
+    inicio = time.perf_counter()
+    amostras = []
+    while len(amostras) < sondagens:
+        amostras.append(sondar_arvore(sudoku, aleatorio))
+        if time.perf_counter() - inicio >= orcamento_segundos:
+            break
+
+    nos = statistics.fmean(amostras)
+    erro = statistics.stdev(amostras) / math.sqrt(len(amostras)) / nos if len(amostras) > 1 else math.inf
+    iteracoes = nos
+    segundos = iteracoes * custo_por_iteracao(sudoku.size, sudoku.count_empty_cells())
+    return Estimativa(nos=nos, iteracoes=iteracoes, segundos=segundos,
+                      sondagens=len(amostras), erro_relativo=erro)
+
+def ordem_por_esforco(estimativas: Sequence[Estimativa]) -> List[int]:
+    """Índices do mais caro para o mais barato (LPT: com distribuição dinâmica, equilibra os workers)."""
+    return sorted(range(len(estimativas)), key=lambda i: estimativas[i].iteracoes, reverse=True)
+
+def _postos(valores: Sequence[float]) -> List[float]:
+    ordem = sorted(range(len(valores)), key=lambda i: valores[i])
+    postos = [0.0] * len(valores)
+    i = 0
+    while i < len(ordem):
+        j = i
+        while j + 1 < len(ordem) and valores[ordem[j + 1]] == valores[ordem[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            postos[ordem[k]] = (i + j) / 2 + 1  # posto médio dos empatados
+        i = j + 1
+    return postos
+
+def precisao(estimadas: Sequence[float], reais: Sequence[float]) -> Dict[str, float]:
+    """
+    Compara iterações estimadas com as reais.
+
+    erro_mediano: mediana de |estimada - real| / real; razao_geometrica: média
+    geométrica de estimada / real (1 = sem viés); spearman: correlação de
+    postos, o que importa para ordenar os puzzles.
+    """
+    pares = [(e, r) for e, r in zip(estimadas, reais) if r > 0 and e > 0]
+    if not pares:
+        return {'erro_mediano': math.nan, 'razao_geometrica': math.nan, 'spearman': math.nan}
+
+    erro_mediano = statistics.median(abs(e - r) / r for e, r in pares)
+    razao = math.exp(statistics.fmean(math.log(e / r) for e, r in pares))
+
+    spearman = math.nan
+    if len(pares) > 1:
+        postos_e = _postos([e for e, _ in pares])
+        postos_r = _postos([r for _, r in pares])
+        try:
+            spearman = statistics.correlation(postos_e, postos_r)
+        except statistics.StatisticsError:
+            pass  # postos constantes (todos os puzzles iguais)
+    return {'erro_mediano': erro_mediano, 'razao_geometrica': razao, 'spearman': spearman}
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Estima o esforço de cada puzzle por sondagens e compara com a resolução real.")
+    parser.add_argument('size', type=int, help="4, 9 ou 16")
+    parser.add_argument('puzzle_file')
+    parser.add_argument('--sondagens', type=int, default=32)
+    parser.add_argument('--orcamento-ms', type=float, default=50.0, help="orçamento por puzzle")
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    puzzles = load_puzzles_from_file(args.puzzle_file, args.size)
+    print("{:>4} {:>8} {:>14} {:>12} {:>9} {:>12} {:>12} {:>12}".format(
+        "#", "Vazias", "Iter. previstas", "Iter. reais", "±%", "Prev. (s)", "Real (s)", "Estimar (s)"))
+    print("-" * 92)
+
+    estimadas, reais = [], []
+    for i, sudoku in enumerate(puzzles, 1):
+        inicio = time.perf_counter()
+        estimativa = estimar_esforco(sudoku, args.sondagens, args.orcamento_ms / 1000, args.semente)
+        custo_estimativa = time.perf_counter() - inicio
+        result = solve_sudoku_iterativo(sudoku.copy())
+        estimadas.append(estimativa.iteracoes)
+        reais.append(result.iterations)
+        print("{:>4} {:>8} {:>14.0f} {:>12} {:>8.0f}% {:>12.6f} {:>12.6f} {:>12.6f}".format(
+            i, sudoku.count_empty_cells(), estimativa.iteracoes, result.iterations,
+            estimativa.erro_relativo * 100, estimativa.segundos, result.time_seconds, custo_estimativa))
+
+    p = precisao(estimadas, reais)
+    print(f"\nErro relativo mediano:      {p['erro_mediano'] * 100:.1f}%")
+    print(f"Razão geométrica (est/real): {p['razao_geometrica']:.2f}")
+    print(f"Correlação de postos:        {p['spearman']:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Gerador de puzzles em Python, com a mesma saída de c/bin/puzzle_generator.
+
+Mesmo LCG, mesmo embaralhamento Fisher-Yates, mesmo preenchimento recursivo
+e mesma remoção de células de generator.c: para a mesma seed, o puzzle sai
+idêntico nas duas linguagens. A seed do puzzle i depende só de i (ver
+semente_do_puzzle), então qualquer fatia de uma configuração pode ser gerada
+sem gerar os puzzles anteriores, em qualquer processo ou máquina, e os
+arquivos de puzzle_seeds/ podem ser refeitos sob demanda em vez de guardados.
+
+Uso:
+    python3 generator.py <size> <case> [--total 30] [--primeiro 1] [--ultimo N]
+                         [--semente 0] [--saida arquivo.txt]
+"""
+import argparse
+import sys
+from typing import Iterator, List, Optional, Tuple
+from sudoku import Sudoku
+
+MAX_FILL_ATTEMPTS = 1000000  # limite de chamadas de preenchimento por tentativa
+TENTATIVAS_SEED = 20
+
+class LCG:
+    """LCG de generator.c: (1103515245 * estado + 12345) mod 2^31"""
+
+    def __init__(self, seed: int):
+        self.estado = seed & 0x7fffffff
+
+    def next(self) -> int:
+        self.estado = (1103515245 * self.estado + 12345) & 0x7fffffff
+        return self.estado
+
+def hash_string(texto: str) -> int:
+    """djb2 com aritmética de unsigned int de 32 bits, como em generator.c."""
+    h = 5381
+    for ch in texto.encode():
+        h = (h * 33 + ch) & 0xFFFFFFFF
+    return h
+
+def semente_do_puzzle(size_str: str, case_str: str, indice: int, semente: int = 0) -> int:
+    """Seed do puzzle 'indice' (1..N), igual a puzzle_seed() em C."""
+    seed = (indice * 1000 + hash_string(size_str) + hash_string(case_str)) & 0xFFFFFFFF
+    return seed ^ ((semente * 2654435761) & 0xFFFFFFFF)
+
+def _shuffle(valores: List[int], lcg: LCG) -> None:
+    for i in range(len(valores) - 1, 0, -1):
+        j = lcg.next() % (i + 1)
+        valores[i], valores[j] = valores[j], valores[i]
+
+def _preencher(sudoku: Sudoku, lcg: LCG) -> bool:
+    """
+    fill_sudoku() de generator.c: célula a célula, valores em ordem embaralhada.
+
+    is_valid() vira um teste nas máscaras de valores de cada linha, coluna e
+    bloco; os valores tentados e os números tirados do LCG são os mesmos.
+    """
+    size = sudoku.size
+    grid = sudoku.grid
+    bloco = sudoku.geometria.box_id
+    linhas = [0] * size
+    colunas = [0] * size
+    blocos = [0] * size
+    tentativas = 0
+
+    def preencher(row: int, col: int) -> bool:
+        nonlocal tentativas
+        tentativas += 1
+        if tentativas > MAX_FILL_ATTEMPTS + 1:  # o C testa o contador antes de incrementar
+            return False
+        if row == size:
+            return True
+
+        next_row, next_col = (row + 1, 0) if col == size - 1 else (row, col + 1)
+        b = bloco[row][col]
+        numbers = list(range(1, size + 1))
+        _shuffle(numbers, lcg)
+        for num in numbers:
+            bit = 1 << num
+            if not (linhas[row] | colunas[col] | blocos[b]) & bit:
+                grid[row][col] = num
+                linhas[row] |= bit
+                colunas[col] |= bit
+                blocos[b] |= bit
+                if preencher(next_row, next_col):
+                    return True
+                grid[row][col] = 0
+                linhas[row] &= ~bit
+                colunas[col] &= ~bit
+                blocos[b] &= ~bit
+        return False
+
+    return preencher(0, 0)
+
+def generate_sudoku(size: int, empty_cells: int, seed: int) -> Optional[Sudoku]:
+    """generate_sudoku() de generator.c; None se o preenchimento falhar 20 vezes."""
+    sudoku = Sudoku(size)
+    limite = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limite, size * size + 100))
+    try:
+        current_seed = seed
+        for tentativa in range(TENTATIVAS_SEED):
+            lcg = LCG(current_seed)
+            sudoku.grid = [[0] * size for _ in range(size)]
+            if _preencher(sudoku, lcg):
+                break
+            current_seed = (seed + (tentativa + 1) * 7919) & 0xFFFFFFFF
+        else:
+            return None
+    finally:
+        sys.setrecursionlimit(limite)
+
+    posicoes = list(range(size * size))
+    _shuffle(posicoes, lcg)
+    for pos in posicoes[:min(empty_cells, size * size)]:
+        sudoku.grid[pos // size][pos % size] = 0
+    return sudoku
+
+def gerar_fatia(size_str: str, case_str: str, primeiro: int, ultimo: int,
+                semente: int = 0) -> Iterator[Tuple[int, Optional[Sudoku]]]:
+    """Puzzles primeiro..ultimo de uma configuração (None onde a geração falhou)."""
+    from main import SIZE_MAP
+    size, best_empty, worst_empty = SIZE_MAP[size_str]
+    vazias = best_empty if case_str == 'best' else worst_empty
+    for indice in range(primeiro, ultimo + 1):
+        yield indice, generate_sudoku(size, vazias, semente_do_puzzle(size_str, case_str, indice, semente))
+
+def main():
+    from main import SIZE_MAP
+    parser = argparse.ArgumentParser(description="Gera puzzles idênticos aos de puzzle_generator.")
+    parser.add_argument('size', choices=list(SIZE_MAP))
+    parser.add_argument('case', choices=['best', 'worst'])
+    parser.add_argument('--total', type=int, default=30, help="puzzles da configuração (o N de 'i/N')")
+    parser.add_argument('--primeiro', type=int, default=1)
+    parser.add_argument('--ultimo', type=int, default=None, help="padrão: --total")
+    parser.add_argument('--semente', type=int, default=0,
+                        help="base das seeds (0 = a dos arquivos de puzzle_seeds/)")
+    parser.add_argument('--saida', default=None, help="arquivo de saída (padrão: stdout)")
+    args = parser.parse_args()
+
+    ultimo = args.total if args.ultimo is None else args.ultimo
+    if not 1 <= args.primeiro <= ultimo <= args.total:
+        parser.error(f"fatia inválida: {args.primeiro}-{ultimo} de {args.total}")
+
+    saida = open(args.saida, 'w') if args.saida else sys.stdout
+    try:
+        for indice, sudoku in gerar_fatia(args.size, args.case, args.primeiro, ultimo, args.semente):
+            if sudoku is None:
+                print(f"ERRO: Não foi possível gerar puzzle {indice}/{args.total}", file=sys.stderr)
+                continue
+            saida.write(f"=== Puzzle {indice}/{args.total} ===\n{sudoku.to_string()}\n\n")
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Módulo de geometria do tabuleiro: tabelas de unidades e vizinhos por tamanho
+
+Além do Sudoku clássico, descreve variantes como conjuntos arbitrários de
+células: regiões irregulares no lugar dos blocos (jigsaw), as duas diagonais
+como unidades extras (X-Sudoku) e gaiolas com soma (Killer). Os solvers que
+só usam vizinhos e unidades (solve_sudoku_iterativo, is_valid, o verificador)
+tratam todas da mesma forma.
+
+Os blocos são retângulos box_rows x box_cols (dimensoes_bloco): quadrados
+nos tamanhos quadrados perfeitos (4, 9, 16) e 2x3 no 6x6, 3x4 no 12x12.
+"""
+import math
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+Celula = Tuple[int, int]
+
+class Gaiola(NamedTuple):
+    """Gaiola do Killer Sudoku: células sem valores repetidos cuja soma é 'soma'"""
+    celulas: Tuple[Celula, ...]
+    soma: int
+
+def dimensoes_bloco(size: int) -> Tuple[int, int]:
+    """
+    Linhas e colunas de cada bloco: o maior divisor de size que não passa da
+    raiz quadrada, e o complemento (6 -> 2x3, 12 -> 3x4, 9 -> 3x3).
+    """
+    box_rows = max(d for d in range(1, math.isqrt(size) + 1) if size % d == 0)
+    return box_rows, size // box_rows
+
+class Geometria:
+    """
+    Tabelas pré-computadas de um tabuleiro size x size.
+
+    As do Sudoku clássico são calculadas uma única vez por tamanho e
+    compartilhadas por todas as instâncias de Sudoku desse tamanho (veja
+    obter_geometria). Variantes criam a própria Geometria:
+
+    - regioes: id da região de cada célula (size regiões de size células),
+      no lugar dos blocos retangulares; box_id/box_cells passam a ser as regiões;
+    - diagonais: as duas diagonais principais viram unidades extras;
+    - gaiolas: células que não repetem valores e têm soma fixa. Não são
+      unidades (não contêm todos os valores), mas entram nos vizinhos.
+    """
+
+    def __init__(self, size: int, regioes: Optional[Sequence[Sequence[int]]] = None,
+                 diagonais: bool = False, gaiolas: Sequence[Gaiola] = ()):
+        self.size = size
+        self.box_rows, self.box_cols = dimensoes_bloco(size)
+        self.num_cells = size * size
+        self.diagonais = diagonais
+        self.jigsaw = regioes is not None
+        self.classica = regioes is None and not diagonais and not gaiolas
+
+        # Identificadores de linha, coluna e bloco (ou região) de cada célula
+        self.row_id: List[List[int]] = [[r] * size for r in range(size)]
+        self.col_id: List[List[int]] = [list(range(size)) for _ in range(size)]
+        if regioes is None:
+            self.box_id: List[List[int]] = [
+                [(r // self.box_rows) * (size // self.box_cols) + c // self.box_cols for c in range(size)]
+                for r in range(size)
+            ]
+        else:
+            self.box_id = [list(linha) for linha in regioes]
+
+        # Células de cada unidade
+        self.row_cells: List[Tuple[Celula, ...]] = [
+            tuple((r, c) for c in range(size)) for r in range(size)
+        ]
+        self.col_cells: List[Tuple[Celula, ...]] = [
+            tuple((r, c) for r in range(size)) for c in range(size)
+        ]
+        self.box_cells: List[Tuple[Celula, ...]] = [() for _ in range(size)]
+        for r in range(size):
+            for c in range(size):
+                b = self.box_id[r][c]
+                self.box_cells[b] = self.box_cells[b] + ((r, c),)
+
+        if regioes is not None and sorted(len(cells) for cells in self.box_cells) != [size] * size:
+            raise ValueError(f"regiões devem ser {size} conjuntos de {size} células")
+
+        # Todas as unidades (linhas, depois colunas, depois blocos e, em X-Sudoku, as diagonais)
+        self.units: List[Tuple[Celula, ...]] = self.row_cells + self.col_cells + self.box_cells
+        if diagonais:
+            self.units = self.units + [tuple((i, i) for i in range(size)),
+                                       tuple((i, size - 1 - i) for i in range(size))]
+
+        # Gaiolas (Killer): cada célula pertence a no máximo uma
+        self.gaiolas: Tuple[Gaiola, ...] = tuple(Gaiola(tuple(map(tuple, g.celulas)), g.soma)
+                                                 for g in gaiolas)
+        self.gaiola_de: List[int] = [-1] * self.num_cells  # índice plano -> gaiola (-1: nenhuma)
+        for i, gaiola in enumerate(self.gaiolas):
+            for r, c in gaiola.celulas:
+                if self.gaiola_de[r * size + c] != -1:
+                    raise ValueError(f"célula ({r}, {c}) está em mais de uma gaiola")
+                self.gaiola_de[r * size + c] = i
+        self.gaiola_indices: List[Tuple[int, ...]] = [
+            tuple(r * size + c for r, c in gaiola.celulas) for gaiola in self.gaiolas
+        ]
+
+        # As mesmas unidades como índices num grid plano (linha * size + coluna)
+        self.unit_indices: List[Tuple[int, ...]] = [
+            tuple(r * size + c for r, c in unit) for unit in self.units
+        ]
+
+        # Índices (em self.units) das três unidades de cada célula (linha, coluna, bloco/região)
+        self.cell_units: List[List[Tuple[int, int, int]]] = [
+            [(r, size + c, 2 * size + self.box_id[r][c]) for c in range(size)]
+            for r in range(size)
+        ]
+
+        # Grupos sem repetição de cada célula: unidades e gaiolas, nessa ordem
+        grupos: List[List[Tuple[Celula, ...]]] = [[] for _ in range(self.num_cells)]
+        for grupo in self.units + [gaiola.celulas for gaiola in self.gaiolas]:
+            for r, c in grupo:
+                grupos[r * size + c].append(grupo)
+
+        # Vizinhos (peers): células que compartilham linha, coluna, bloco, diagonal ou gaiola
+        self.peers: List[List[Tuple[Celula, ...]]] = [
+            [self._compute_peers(r, c, grupos[r * size + c]) for c in range(size)] for r in range(size)
+        ]
+
+        # Os mesmos vizinhos como índices num grid plano, indexados pelo índice plano da célula
+        self.peer_indices: List[Tuple[int, ...]] = [
+            tuple(pr * size + pc for pr, pc in self.peers[r][c])
+            for r in range(size) for c in range(size)
+        ]
+
+    @staticmethod
+    def _compute_peers(r: int, c: int, grupos: List[Tuple[Celula, ...]]) -> Tuple[Celula, ...]:
+        vistos = set()
+        peers = []
+        for grupo in grupos:
+            for cell in grupo:
+                if cell != (r, c) and cell not in vistos:
+                    vistos.add(cell)
+                    peers.append(cell)
+        return tuple(peers)
+
+@lru_cache(maxsize=None)
+def obter_geometria(size: int) -> Geometria:
+    """Retorna a geometria compartilhada para o tamanho dado."""
+    return Geometria(size)
@@ -0,0 +1,238 @@
+"""
+Resolução incremental para pistas que chegam uma a uma.
+
+SolverIncremental mantém, entre chamadas, as máscaras de valores usados por
+unidade da geometria (linhas, colunas, blocos ou regiões do jigsaw e as
+diagonais do X-Sudoku; no clássico, as de solve_sudoku_trilha) e a lista de células
+vazias (a de _find_all_empty_cells, com índice de posição para remoção em
+O(1)). place(), remove() e candidates() custam O(1); nenhuma chamada
+reconstrói o estado a partir do grid. Killer fica de fora: as somas das
+gaiolas não cabem em máscaras de valores usados.
+
+is_solvable() e solve() guardam o resultado da última busca e só buscam de
+novo quando uma alteração pode tê-lo invalidado:
+
+- uma solução continua válida enquanto cada pista colocada coincidir com ela,
+  e remover pistas nunca a invalida;
+- um tabuleiro sem solução continua sem solução quando se colocam pistas.
+
+A busca trabalha sobre as próprias máscaras, com as mutações registradas numa
+Trilha e desfeitas ao final, e não altera as pistas do Sudoku.
+"""
+import time
+from typing import Dict, List, Optional
+
+from sudoku import Sudoku
+from backtracking import Coordenada, SolveResult, _find_all_empty_cells
+from trail import Trilha
+
+class SolverIncremental:
+    """Estado de restrições de um Sudoku parcial, atualizado a cada pista."""
+
+    def __init__(self, sudoku: Sudoku):
+        """
+        Usa 'sudoku' como tabuleiro de pistas (o grid é alterado por place/remove).
+
+        ValueError se as pistas iniciais repetirem um valor numa unidade ou se
+        o tabuleiro for Killer.
+        """
+        geometria = sudoku.geometria
+        if geometria.gaiolas:
+            raise ValueError("Killer não é suportado: as somas das gaiolas não cabem nas máscaras")
+        self.sudoku = sudoku
+        size = sudoku.size
+        self._completo = ((1 << (size + 1)) - 1) ^ 1
+
+        # Unidades de cada célula: linha, coluna e bloco (ou região) e, no X-Sudoku, as diagonais
+        self._unidades = [[tuple(units) for units in row] for row in geometria.cell_units]
+        for u in range(3 * size, len(geometria.units)):
+            for r, c in geometria.units[u]:
+                self._unidades[r][c] += (u,)
+        self._usados = [0] * len(geometria.units)
+        for r in range(size):
+            for c in range(size):
+                num = sudoku.grid[r][c]
+                if num:
+                    if not self._livres(r, c) >> num & 1:
+                        raise ValueError(f"pista {num} em ({r}, {c}) repete um valor de uma unidade")
+                    self._marcar(r, c, 1 << num)
+
+        self.vazias: List[Coordenada] = _find_all_empty_cells(sudoku)
+        self._posicao: Dict[Coordenada, int] = {cell: i for i, cell in enumerate(self.vazias)}
+
+        self._solucao: Optional[List[List[int]]] = None
+        self._sem_solucao = False
+
+    # ------------------------------------------------------------------
+    # Estado incremental
+    # ------------------------------------------------------------------
+
+    def _livres(self, r: int, c: int) -> int:
+        usados = 0
+        for u in self._unidades[r][c]:
+            usados |= self._usados[u]
+        return self._completo & ~usados
+
+    def _marcar(self, r: int, c: int, bit: int) -> None:
+        for u in self._unidades[r][c]:
+            self._usados[u] |= bit
+
+    def _desmarcar(self, r: int, c: int, bit: int) -> None:
+        for u in self._unidades[r][c]:
+            self._usados[u] &= ~bit
+
+    def _validar_celula(self, r: int, c: int) -> None:
+        # Índices negativos dariam a volta no grid e nas máscaras
+        size = self.sudoku.size
+        if not (0 <= r < size and 0 <= c < size):
+            raise ValueError(f"célula fora do tabuleiro {size}x{size}: ({r}, {c})")
+
+    def place(self, r: int, c: int, v: int) -> None:
+        """Coloca a pista 'v' em [r][c]; ValueError se a célula estiver ocupada ou 'v' conflitar."""
+        self._validar_celula(r, c)
+        if not 1 <= v <= self.sudoku.size:
+            raise ValueError(f"valor fora do intervalo 1-{self.sudoku.size}: {v}")
+        if self.sudoku.grid[r][c]:
+            raise ValueError(f"célula ({r}, {c}) já tem o valor {self.sudoku.grid[r][c]}")
+        if not self._livres(r, c) >> v & 1:
+            raise ValueError(f"{v} já está numa unidade de ({r}, {c})")
+
+        self.sudoku.grid[r][c] = v
+        self._marcar(r, c, 1 << v)
+
+        # Remoção em O(1): a última célula da lista ocupa a posição liberada
+        cell = Coordenada(r, c)
+        i = self._posicao.pop(cell)
+        ultima = self.vazias.pop()
+        if ultima != cell:
+            self.vazias[i] = ultima
+            self._posicao[ultima] = i
+
+        if self._solucao is not None and self._solucao[r][c] != v:
+            self._solucao = None  # a solução guardada contradiz a nova pista
+
+    def remove(self, r: int, c: int) -> int:
+        """Remove a pista de [r][c] e retorna o valor removido (0 se já estava vazia)."""
+        self._validar_celula(r, c)
+        v = self.sudoku.grid[r][c]
+        if not v:
+            return 0
+
+        self.sudoku.grid[r][c] = 0
+        self._desmarcar(r, c, 1 << v)
+        cell = Coordenada(r, c)
+        self._posicao[cell] = len(self.vazias)
+        self.vazias.append(cell)
+
+        # Menos restrições: a solução guardada continua válida, a falta de solução não
+        self._sem_solucao = False
+        return v
+
+    def candidates(self, r: int, c: int) -> List[int]:
+        """Valores que podem ser colocados em [r][c] (vazio se a célula estiver ocupada)."""
+        self._validar_celula(r, c)
+        if self.sudoku.grid[r][c]:
+            return []
+        livres = self._livres(r, c)
+        return [v for v in range(1, self.sudoku.size + 1) if livres >> v & 1]
+
+    # ------------------------------------------------------------------
+    # Busca
+    # ------------------------------------------------------------------
+
+    def is_solvable(self) -> bool:
+        """True se as pistas atuais têm ao menos uma solução."""
+        if self._solucao is not None:
+            return True
+        if self._sem_solucao:
+            return False
+        return self.solve().solved
+
+    def solve(self) -> SolveResult:
+        """
+        Busca uma solução para as pistas atuais sem alterá-las.
+
+        A solução fica em self.solucao. Sem mudanças que a invalidem, uma nova
+        chamada retorna na hora, com 0 iterações.
+        """
+        start_time = time.thread_time()
+        if self._solucao is None and not self._sem_solucao:
+            iterations, self._solucao = self._buscar()
+            self._sem_solucao = self._solucao is None
+        else:
+            iterations = 0
+        end_time = time.thread_time()
+        return SolveResult(time_seconds=end_time - start_time, iterations=iterations,
+                           solved=self._solucao is not None)
+
+    @property
+    def solucao(self) -> Optional[List[List[int]]]:
+        """Cópia da última solução encontrada que ainda vale para as pistas atuais."""
+        return [row[:] for row in self._solucao] if self._solucao is not None else None
+
+    def _buscar(self):
+        """Backtracking iterativo com MRV sobre as máscaras atuais; retorna (iterações, solução)."""
+        grid = self.sudoku.grid
+        unidades = self._unidades
+        completo = self._completo
+        usados = self._usados
+
+        ordem = self.vazias[:]
+        total_vazias = len(ordem)
+        restantes = [0] * total_vazias  # candidatos ainda não tentados em cada posição
+        valores = [0] * total_vazias    # bit do valor atribuído em cada posição
+        trilha = Trilha()
+        atribuir = trilha.atribuir
+        marcas = [0] * total_vazias
+
+        iterations = 0
+        k = 0
+        avancou = True
+        while -1 < k < total_vazias:
+            iterations += 1
+
+            if avancou:
+                # MRV: traz para a posição k a célula restante com menos candidatos
+                melhor, menor = k, completo.bit_count() + 1
+                for i in range(k, total_vazias):
+                    r, c = ordem[i]
+                    presentes = 0
+                    for u in unidades[r][c]:
+                        presentes |= usados[u]
+                    n = (completo & ~presentes).bit_count()
+                    if n < menor:
+                        melhor, menor = i, n
+                        if n <= 1:
+                            break
+                ordem[k], ordem[melhor] = ordem[melhor], ordem[k]
+                r, c = ordem[k]
+                presentes = 0
+                for u in unidades[r][c]:
+                    presentes |= usados[u]
+                restantes[k] = completo & ~presentes
+            else:
+                trilha.desfazer_ate(marcas[k])
+                r, c = ordem[k]
+
+            candidatos = restantes[k]
+            if candidatos:
+                bit = candidatos & -candidatos  # menor valor ainda não tentado
+                restantes[k] = candidatos ^ bit
+                valores[k] = bit
+                marcas[k] = trilha.marcar()
+                for u in unidades[r][c]:
+                    atribuir(usados, u, usados[u] | bit)
+                k += 1
+                avancou = True
+            else:
+                k -= 1
+                avancou = False
+
+        solucao = None
+        if k == total_vazias:
+            solucao = [row[:] for row in grid]
+            for (r, c), bit in zip(ordem, valores):
+                solucao[r][c] = bit.bit_length() - 1
+
+        trilha.desfazer_ate(0)  # as máscaras voltam a refletir só as pistas
+        return iterations, solucao
@@ -1,35 +1,126 @@
+import argparse
+import importlib
 import sys
 import os
-from sudoku import Sudoku
-from backtracking import solve_sudoku_iterativo
+import time
+from sudoku import load_puzzles_from_file, write_puzzles_to_file
+from verifier import verify_solution
+from metricas import PROGRESSO, iniciar_exportadores
+
+# Motores de resolução selecionáveis com --engine, como "módulo:função".
+# Cada módulo só é importado quando o motor é usado (multiprocessing, ctypes
+# e o solver SAT não pesam na inicialização do caminho padrão).
+ENGINES = {
+    'python': 'backtracking:solve_sudoku_iterativo',
+    'c': 'native:solve_sudoku_nativo',
+    'trilha': 'backtracking:solve_sudoku_trilha',
+    'nogoods': 'nogoods:solve_sudoku_nogoods',
+    'sat': 'sat:solve_sudoku_sat',
+    'tabela': 'tabela:solve_sudoku_tabela',
+}
+
+# Tamanho, células vazias no melhor caso e no pior caso
+# (6x6 e 12x12, com blocos 2x3 e 3x4, são pontos intermediários da curva)
+SIZE_MAP = {
+    'small': (4, 5, 8),        # 4x4: best=5 (31%), worst=8 (50%)
+    '6x6': (6, 11, 18),         # 6x6: best=11 (31%), worst=18 (50%)
+    'medium': (9, 24, 40),      # 9x9: best=24 (30%), worst=40 (49%)
+    '12x12': (12, 43, 72),      # 12x12: best=43 (30%), worst=72 (50%)
+    'large': (16, 77, 128)      # 16x16: best=77 (30%), worst=128 (50%)
+}
+
+def carregar_funcao(caminho):
+    """Importa 'módulo:função' sob demanda."""
+    modulo, funcao = caminho.split(':')
+    return getattr(importlib.import_module(modulo), funcao)
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Executa 30 testes de backtracking iterativo para uma configuração.")
+    parser.add_argument('size', help=", ".join(SIZE_MAP))
+    parser.add_argument('case', help="best, worst")
+    parser.add_argument('puzzle_file', nargs='?', default=None,
+                        help="(opcional) arquivo com puzzles pré-gerados")
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='python',
+                        help="motor de resolução (padrão: python; 'c' usa libsudoku.so)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="processos para dividir a busca de cada puzzle (padrão: 1)")
+    parser.add_argument('--batch', action='store_true',
+                        help="com --engine c, resolve os 30 puzzles numa única chamada ao C "
+                             "(--workers vira o número de threads OpenMP)")
+    parser.add_argument('--solutions-out', default=None,
+                        help="(opcional) arquivo onde gravar as soluções encontradas")
+    parser.add_argument('--memoria', action='store_true',
+                        help="registra o pico de alocações (tracemalloc) de cada execução; "
+                             "os tempos medidos ficam mais lentos")
+    parser.add_argument('--estimar', action='store_true',
+                        help="estima o esforço de cada puzzle antes de resolver (sondagens de Knuth) "
+                             "e registra a precisão; com --batch, resolve do mais caro ao mais barato")
+    parser.add_argument('--metricas-porta', type=int, default=None,
+                        help="expõe métricas ao vivo (formato Prometheus) em http://127.0.0.1:PORTA/metrics")
+    parser.add_argument('--status-arquivo', default=None,
+                        help="reescreve periodicamente as métricas ao vivo neste arquivo")
+    parser.add_argument('--status-intervalo', type=float, default=2.0,
+                        help="segundos entre reescritas de --status-arquivo (padrão: 2)")
+    args = parser.parse_args()
+    if args.batch and args.engine != 'c':
+        parser.error("--batch requer --engine c")
+    if args.workers > 1 and not args.batch and args.engine != 'python':
+        parser.error("--workers divide a busca do motor python (com --engine c, use --batch)")
+    if args.memoria and (args.batch or args.workers > 1):
+        parser.error("--memoria mede apenas o processo atual (sem --batch ou --workers)")
+    return args
+
+def _resolver_medindo_memoria(solve, sudoku):
+    """Resolve com tracemalloc ativo; retorna (resultado, pico de alocações em KB)."""
+    import tracemalloc
+    tracemalloc.start()
+    try:
+        result = solve(sudoku)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak / 1024
 
 def main():
-    if len(sys.argv) != 3 and len(sys.argv) != 4:
-        print(f"Uso: {sys.argv[0]} <size> <case> [puzzle_file]")
-        print("  size: small, medium, large")
-        print("  case: best, worst")
-        print("  puzzle_file: (opcional) arquivo com puzzles pré-gerados")
+    args = parse_args()
+    exportadores = iniciar_exportadores(args.metricas_porta, args.status_arquivo,
+                                        args.status_intervalo)
+    try:
+        ok = executar_configuracao(args.size, args.case, args.puzzle_file, engine=args.engine,
+                                   workers=args.workers, batch=args.batch,
+                                   solutions_out=args.solutions_out, memoria=args.memoria,
+                                   estimar=args.estimar)
+    finally:
+        for exportador in exportadores:
+            exportador.parar()
+    if not ok:
         sys.exit(1)
-    
-    size_str = sys.argv[1]
-    case_str = sys.argv[2]
-    
-    # Define tamanho do Sudoku e células vazias
 
-    size_map = {
-        'small': (4, 5, 8),        # 4x4: best=5 (31%), worst=8 (50%)
-        'medium': (9, 24, 40),      # 9x9: best=24 (30%), worst=40 (49%)
-        'large': (16, 77, 128)      # 16x16: best=77 (30%), worst=128 (50%)
-    }
-    
-    if size_str not in size_map:
-        print("Tamanho inválido. Use: small, medium ou large")
-        sys.exit(1)
+def executar_configuracao(size_str, case_str, puzzle_file=None, engine='python', workers=1,
+                          batch=False, solutions_out=None, memoria=False, estimar=False):
+    """
+    Executa os 30 testes de uma configuração e grava o log.
+
+    Retorna False se a configuração for inválida ou o arquivo de puzzles não existir.
+    Pode ser chamada várias vezes no mesmo processo (ver driver.py).
+    """
+    if size_str not in SIZE_MAP:
+        print(f"Tamanho inválido. Use: {', '.join(SIZE_MAP)}")
+        return False
     
-    size, best_empty, worst_empty = size_map[size_str]
+    size, best_empty, worst_empty = SIZE_MAP[size_str]
     empty_cells = best_empty if case_str == 'best' else worst_empty
     
-    log_filename = f"../../logs/python_{size_str}_{case_str}.log"
+    # Motores alternativos não sobrescrevem os logs do motor padrão
+    engine_suffix = "" if engine == 'python' else f"_{engine}"
+    log_filename = f"../../logs/python_{size_str}_{case_str}{engine_suffix}.log"
+    if batch:
+        solve_batch_nativo = carregar_funcao('native:solve_batch_nativo')
+    elif workers > 1:
+        solve_sudoku_paralelo = carregar_funcao('parallel:solve_sudoku_paralelo')
+    else:
+        solve = carregar_funcao(ENGINES[engine])
     
     os.makedirs('../../logs', exist_ok=True)
     
@@ -38,61 +129,108 @@ def main():
         log_file.write("Linguagem: Python\n")
         log_file.write(f"Tamanho: {size}x{size}\n")
         log_file.write(f"Caso: {case_str}\n")
+        log_file.write(f"Motor: {engine}\n")
         log_file.write(f"Células vazias alvo: {empty_cells}\n")
+        if workers > 1:
+            log_file.write(f"Workers: {workers}\n")
         log_file.write("Número de execuções: 30\n\n")
         
         total_time = 0.0
         total_iterations = 0
         successful_solves = 0
+        total_nogoods = 0
+        total_podas = 0
+        max_memory_kb = 0.0
+        iteracoes_reais = []
         
         print(f"Executando 30 testes para {size_str} {case_str} em Python...")
         
         # Determinar arquivo de puzzles
-        if len(sys.argv) == 4:
-            puzzle_file_path = sys.argv[3]
+        if puzzle_file:
+            puzzle_file_path = puzzle_file
         else:
             puzzle_file_path = f"../../puzzle_seeds/{size_str}_{case_str}.txt"
         
         try:
-            with open(puzzle_file_path, 'r') as f:
-                puzzle_content = f.read()
+            puzzles = load_puzzles_from_file(puzzle_file_path, size)
         except FileNotFoundError:
             print(f"Erro: Arquivo de puzzles não encontrado: {puzzle_file_path}")
             print("Execute primeiro: make build-generator && ./c/bin/puzzle_generator")
-            sys.exit(1)
+            return False
         
         print(f"  Carregando puzzles de: {puzzle_file_path}")
         
-        # Parse puzzles do arquivo
-        puzzles = []
-        puzzle_sections = puzzle_content.split("=== Puzzle")
-        for section in puzzle_sections[1:]:  # Pula o primeiro (vazio)
-            # Extrai o número do puzzle e o conteúdo
-            lines = section.strip().split('\n')
-            if len(lines) > 1:
-                puzzle_str = '\n'.join(lines[1:])  # Remove a linha "=== Puzzle X/30 ==="
-                sudoku = Sudoku.parse_from_string(puzzle_str, size)
-                puzzles.append(sudoku)
-        
         if len(puzzles) < 30:
             print(f"  Aviso: Apenas {len(puzzles)} puzzles encontrados no arquivo")
         
-        for run in range(1, min(31, len(puzzles) + 1)):
+        puzzles = puzzles[:30]
+        empty_counts = [sudoku.count_empty_cells() for sudoku in puzzles]
+        # Pistas originais, para conferir as soluções (os motores resolvem no próprio grid)
+        originals = [sudoku.copy() for sudoku in puzzles]
+        PROGRESSO.iniciar_configuracao('python', size_str, case_str, engine, len(puzzles))
+        
+        estimativas = None
+        if estimar:
+            from estimativa import estimar_esforco, ordem_por_esforco, precisao
+            inicio = time.perf_counter()
+            estimativas = [estimar_esforco(sudoku) for sudoku in puzzles]
+            print(f"  Esforço estimado em {time.perf_counter() - inicio:.3f}s "
+                  f"({sum(e.sondagens for e in estimativas)} sondagens)")
+        
+        if batch:
+            print(f"  Resolvendo {len(puzzles)} puzzles em lote no kernel C...")
+            # Com estimativas, do mais caro ao mais barato: a distribuição dinâmica do
+            # OpenMP vira LPT e os workers terminam mais perto um do outro
+            ordem = ordem_por_esforco(estimativas) if estimativas else list(range(len(puzzles)))
+            resultados_lote = solve_batch_nativo([puzzles[i] for i in ordem], workers)
+            batch_results = [None] * len(puzzles)
+            for posicao, i in enumerate(ordem):
+                batch_results[i] = resultados_lote[posicao]
+        
+        for run in range(1, len(puzzles) + 1):
             sudoku = puzzles[run - 1]
-            actual_empty = sudoku.count_empty_cells()
+            actual_empty = empty_counts[run - 1]
             
             print(f"\n=== Execução {run}/30 ===")
             print("  Resolvendo puzzle... (pode demorar para puzzles grandes)")
+            PROGRESSO.iniciar_execucao(run, actual_empty)
             
-            result = solve_sudoku_iterativo(sudoku)
+            if batch:
+                result = batch_results[run - 1]
+            elif workers > 1:
+                result = solve_sudoku_paralelo(sudoku, workers)
+            elif memoria:
+                result, peak_kb = _resolver_medindo_memoria(solve, sudoku)
+                max_memory_kb = max(max_memory_kb, peak_kb)
+            else:
+                result = solve(sudoku)
+            
+            PROGRESSO.concluir_execucao(result.iterations, result.solved)
+            iteracoes_reais.append(result.iterations)
+            
+            # Não confia apenas em result.solved: confere o grid final contra as pistas
+            verified = result.solved and verify_solution(sudoku.grid, originals[run - 1].grid).valid
+            if result.solved and not verified:
+                print(f"  ✗ Solução inválida na execução {run}!")
             
             log_file.write(f"Execução {run}:\n")
             log_file.write(f"  Células vazias: {actual_empty}\n")
             log_file.write(f"  Tempo: {result.time_seconds:.6f} segundos\n")
             log_file.write(f"  Iterações: {result.iterations}\n")
-            log_file.write(f"  Resolvido: {'Sim' if result.solved else 'Não'}\n\n")
+            log_file.write(f"  Resolvido: {'Sim' if verified else 'Não'}\n")
+            log_file.write(f"  Verificado: {'Sim' if verified else 'Não'}\n")
+            if memoria:
+                log_file.write(f"  Memória de pico (tracemalloc): {peak_kb:.1f} KB\n")
+            if estimativas:
+                log_file.write(f"  Iterações estimadas: {estimativas[run - 1].iteracoes:.0f}\n")
+            if engine == 'nogoods':
+                total_nogoods += result.nogoods_aprendidos
+                total_podas += result.podas_nogood
+                log_file.write(f"  Nogoods aprendidos: {result.nogoods_aprendidos}\n")
+                log_file.write(f"  Podas por nogood: {result.podas_nogood}\n")
+            log_file.write("\n")
             
-            if result.solved:
+            if verified:
                 total_time += result.time_seconds
                 total_iterations += result.iterations
                 successful_solves += 1
@@ -111,12 +249,31 @@ def main():
             log_file.write(f"Tempo total: {total_time:.6f} segundos\n")
             log_file.write(f"Iterações médias: {avg_iterations:.2f}\n")
             log_file.write(f"Iterações totais: {total_iterations}\n")
+            if memoria:
+                log_file.write(f"Memória de pico máxima: {max_memory_kb:.1f} KB\n")
+            if estimativas:
+                # Precisão contra as iterações reais (todas as execuções, resolvidas ou não)
+                p = precisao([e.iteracoes for e in estimativas], iteracoes_reais)
+                log_file.write(f"Estimativa - erro relativo mediano: {p['erro_mediano'] * 100:.1f}%\n")
+                log_file.write(f"Estimativa - razão geométrica (est/real): {p['razao_geometrica']:.2f}\n")
+                log_file.write(f"Estimativa - correlação de postos: {p['spearman']:.2f}\n")
+                print(f"  Estimativa: erro mediano {p['erro_mediano'] * 100:.1f}%, "
+                      f"correlação de postos {p['spearman']:.2f}")
+            if engine == 'nogoods':
+                log_file.write(f"Nogoods aprendidos totais: {total_nogoods}\n")
+                log_file.write(f"Podas por nogood totais: {total_podas}\n")
             
             print(f"\n✓ Análise concluída!")
             print(f"  Tempo médio: {avg_time:.6f} segundos")
             print(f"  Iterações médias: {avg_iterations:.2f}")
     
     print(f"  Log salvo em: {log_filename}")
+    
+    if solutions_out:
+        write_puzzles_to_file(solutions_out, puzzles)
+        print(f"  Soluções salvas em: {solutions_out}")
+    
+    return True
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,240 @@
+"""
+Métricas ao vivo de varreduras longas.
+
+Os solvers chamam amostrar_progresso() a cada INTERVALO_AMOSTRA iterações (um
+teste de máscara no laço, no lugar do antigo 'iterations % 10000000 == 0'),
+e main.py/driver.py registram em PROGRESSO a configuração e a execução
+atuais. As métricas saem no formato texto do Prometheus, por um endpoint HTTP
+local (ServidorMetricas) ou por um arquivo reescrito periodicamente
+(ArquivoStatus, compatível com o textfile collector do node_exporter).
+
+Nada é calculado no laço além de guardar iterações, profundidade e instante
+da amostra; taxas, recuos e ETA são derivados só quando alguém lê as
+métricas. http.server e threading só são importados pelos exportadores.
+"""
+import math
+import os
+import time
+from typing import List, Optional, Tuple
+
+INTERVALO_AMOSTRA = 1024                 # potência de 2: o laço testa uma máscara
+MASCARA_AMOSTRA = INTERVALO_AMOSTRA - 1
+INTERVALO_PRINT = 10000000               # print de progresso no terminal
+
+Metrica = Tuple[str, str, str, float, str]  # nome, ajuda, tipo, valor, rótulos
+
+class Progresso:
+    """Estado da varredura em andamento (escrito pelo solver, lido pelos exportadores)."""
+
+    def __init__(self):
+        self.linguagem = ''
+        self.tamanho = ''
+        self.caso = ''
+        self.motor = ''
+        self.configuracao = 0            # posição na varredura do driver (0 = execução avulsa)
+        self.total_configuracoes = 0
+        self.execucao = 0
+        self.total_execucoes = 0
+        self.celulas_vazias = 0
+        self.iteracoes = 0               # execução atual, até a última amostra
+        self.profundidade = 0            # k: células preenchidas na última amostra
+        self.inicio_execucao = 0.0
+        self.ultima_amostra = 0.0
+        self.execucoes_concluidas = 0
+        self.iteracoes_concluidas = 0
+        self.tempo_concluidas = 0.0
+
+    def definir_varredura(self, configuracao: int, total_configuracoes: int) -> None:
+        self.configuracao = configuracao
+        self.total_configuracoes = total_configuracoes
+
+    def iniciar_configuracao(self, linguagem: str, tamanho: str, caso: str, motor: str,
+                             total_execucoes: int) -> None:
+        self.linguagem = linguagem
+        self.tamanho = tamanho
+        self.caso = caso
+        self.motor = motor
+        self.total_execucoes = total_execucoes
+        self.execucao = 0
+        self.celulas_vazias = 0
+        self.iteracoes = 0
+        self.profundidade = 0
+        self.execucoes_concluidas = 0
+        self.iteracoes_concluidas = 0
+        self.tempo_concluidas = 0.0
+
+    def iniciar_execucao(self, execucao: int, celulas_vazias: int) -> None:
+        self.execucao = execucao
+        self.celulas_vazias = celulas_vazias
+        self.iteracoes = 0
+        self.profundidade = 0
+        self.inicio_execucao = self.ultima_amostra = time.perf_counter()
+
+    def amostrar(self, iteracoes: int, k: int) -> None:
+        self.iteracoes = iteracoes
+        self.profundidade = k
+        self.ultima_amostra = time.perf_counter()
+
+    def concluir_execucao(self, iteracoes: int, resolvido: bool) -> None:
+        agora = time.perf_counter()
+        self.iteracoes = iteracoes
+        self.profundidade = self.celulas_vazias if resolvido else -1
+        self.ultima_amostra = agora
+        self.execucoes_concluidas += 1
+        self.iteracoes_concluidas += iteracoes
+        self.tempo_concluidas += agora - self.inicio_execucao
+
+    def metricas(self, agora: Optional[float] = None) -> List[Metrica]:
+        """Instantâneo das métricas, com as derivadas calculadas agora."""
+        if agora is None:
+            agora = time.perf_counter()
+        execucao_em_andamento = self.execucao > self.execucoes_concluidas
+
+        # Taxa da execução atual (entre o início e a última amostra); sem amostras, a das concluídas
+        duracao_amostrada = self.ultima_amostra - self.inicio_execucao
+        if execucao_em_andamento and self.iteracoes and duracao_amostrada > 0:
+            por_segundo = self.iteracoes / duracao_amostrada
+        elif self.tempo_concluidas > 0:
+            por_segundo = self.iteracoes_concluidas / self.tempo_concluidas
+        else:
+            por_segundo = 0.0
+
+        # Cada iteração avança (k + 1) ou recua (k - 1) uma célula, então os recuos saem de k
+        # (vale para os motores de backtracking cronológico; nogoods salta vários níveis)
+        recuos = max(self.iteracoes - self.profundidade, 0) // 2
+        taxa_recuo = recuos / self.iteracoes if self.iteracoes else 0.0
+
+        # ETA: tempo médio das execuções concluídas vezes as que faltam, menos o já decorrido
+        if self.execucoes_concluidas:
+            media = self.tempo_concluidas / self.execucoes_concluidas
+            restantes = self.total_execucoes - self.execucoes_concluidas
+            decorrido = agora - self.inicio_execucao if execucao_em_andamento else 0.0
+            eta = max(media * restantes - decorrido, 0.0)
+        else:
+            eta = math.nan
+
+        rotulos = (f'linguagem="{self.linguagem}",tamanho="{self.tamanho}",'
+                   f'caso="{self.caso}",motor="{self.motor}"')
+        return [
+            ('sudoku_configuracao_info', "Configuração em execução", 'gauge', 1, rotulos),
+            ('sudoku_configuracao', "Posição da configuração na varredura", 'gauge',
+             self.configuracao, ''),
+            ('sudoku_configuracoes_total', "Configurações na varredura", 'gauge',
+             self.total_configuracoes, ''),
+            ('sudoku_execucao', "Execução atual da configuração", 'gauge', self.execucao, ''),
+            ('sudoku_execucoes_total', "Execuções da configuração", 'gauge', self.total_execucoes, ''),
+            ('sudoku_execucoes_concluidas', "Execuções concluídas na configuração", 'gauge',
+             self.execucoes_concluidas, ''),
+            ('sudoku_celulas_vazias', "Células vazias do puzzle atual", 'gauge',
+             self.celulas_vazias, ''),
+            ('sudoku_iteracoes', "Iterações da execução atual (última amostra)", 'gauge',
+             self.iteracoes, ''),
+            ('sudoku_iteracoes_configuracao_total', "Iterações das execuções concluídas", 'counter',
+             self.iteracoes_concluidas, ''),
+            ('sudoku_iteracoes_por_segundo', "Iterações por segundo da execução atual", 'gauge',
+             por_segundo, ''),
+            ('sudoku_profundidade', "Profundidade k da busca (células preenchidas)", 'gauge',
+             self.profundidade, ''),
+            ('sudoku_recuos', "Recuos (backtracks) da execução atual", 'gauge', recuos, ''),
+            ('sudoku_taxa_recuo', "Fração das iterações que recuaram", 'gauge', taxa_recuo, ''),
+            ('sudoku_eta_segundos', "Tempo estimado até o fim da configuração", 'gauge', eta, ''),
+            ('sudoku_idade_amostra_segundos', "Tempo desde a última amostra do solver", 'gauge',
+             agora - self.ultima_amostra if self.ultima_amostra else 0.0, ''),
+        ]
+
+    def texto_prometheus(self) -> str:
+        """Métricas no formato de exposição em texto do Prometheus."""
+        linhas = []
+        for nome, ajuda, tipo, valor, rotulos in self.metricas():
+            linhas.append(f"# HELP {nome} {ajuda}")
+            linhas.append(f"# TYPE {nome} {tipo}")
+            linhas.append(f"{nome}{{{rotulos}}} {_formatar_valor(valor)}" if rotulos
+                          else f"{nome} {_formatar_valor(valor)}")
+        return "\n".join(linhas) + "\n"
+
+def _formatar_valor(valor: float) -> str:
+    if isinstance(valor, float):
+        return "NaN" if math.isnan(valor) else repr(valor)
+    return str(valor)
+
+PROGRESSO = Progresso()
+
+def amostrar_progresso(iteracoes: int, k: int) -> None:
+    """Chamada pelo laço dos solvers a cada INTERVALO_AMOSTRA iterações."""
+    # Primeira amostra depois de cada múltiplo de INTERVALO_PRINT (para puzzles grandes);
+    # as amostras caem em múltiplos de INTERVALO_AMOSTRA, então o print mostra o múltiplo
+    if iteracoes % INTERVALO_PRINT < INTERVALO_AMOSTRA:
+        print(f"  ... {iteracoes // INTERVALO_PRINT * INTERVALO_PRINT} iterações e contando...")
+    PROGRESSO.amostrar(iteracoes, k)
+
+class ServidorMetricas:
+    """Endpoint HTTP local (/metrics) servido numa thread daemon."""
+
+    def __init__(self, porta: int, host: str = '127.0.0.1', progresso: Progresso = PROGRESSO):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                corpo = progresso.texto_prometheus().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, format, *args):
+                pass  # não mistura o log de acessos com a saída da varredura
+
+        self.servidor = ThreadingHTTPServer((host, porta), Handler)
+        self.servidor.daemon_threads = True
+        self.endereco = f"http://{host}:{self.servidor.server_address[1]}/metrics"
+        self._thread = threading.Thread(target=self.servidor.serve_forever, daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        self.servidor.shutdown()
+        self.servidor.server_close()
+
+class ArquivoStatus:
+    """Reescreve 'path' a cada 'intervalo' segundos (escrita atômica) numa thread daemon."""
+
+    def __init__(self, path: str, intervalo: float = 2.0, progresso: Progresso = PROGRESSO):
+        import threading
+        self.path = path
+        self.intervalo = intervalo
+        self.progresso = progresso
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._laco, daemon=True)
+        self._thread.start()
+
+    def escrever(self) -> None:
+        temporario = self.path + '.tmp'
+        with open(temporario, 'w') as f:
+            f.write(self.progresso.texto_prometheus())
+        os.replace(temporario, self.path)
+
+    def _laco(self) -> None:
+        while not self._parar.wait(self.intervalo):
+            self.escrever()
+
+    def parar(self) -> None:
+        self._parar.set()
+        self._thread.join()
+        self.escrever()  # estado final
+
+def iniciar_exportadores(porta: Optional[int] = None, arquivo: Optional[str] = None,
+                         intervalo: float = 2.0) -> list:
+    """Cria os exportadores pedidos; cada um tem parar()."""
+    exportadores = []
+    if porta is not None:
+        servidor = ServidorMetricas(porta)
+        print(f"  Métricas em {servidor.endereco}")
+        exportadores.append(servidor)
+    if arquivo is not None:
+        exportadores.append(ArquivoStatus(arquivo, intervalo))
+        print(f"  Status em {arquivo} (a cada {intervalo:g}s)")
+    return exportadores
@@ -0,0 +1,112 @@
+"""
+Módulo de acesso ao kernel C (libsudoku.so) via ctypes.
+
+Permite resolver puzzles com a implementação em C dentro do próprio processo
+Python, sem iniciar o binário sudoku_solver e sem interpretar sua saída.
+Compile a biblioteca com: make build-lib
+"""
+import array
+import ctypes
+from pathlib import Path
+from typing import List, Optional
+
+from sudoku import Sudoku
+from backtracking import SolveResult
+
+LIB_PATH = Path(__file__).resolve().parents[2] / 'c' / 'bin' / 'libsudoku.so'
+
+class _CSolveResult(ctypes.Structure):
+    """Espelho da struct SolveResult de c/include/backtracking.h"""
+    _fields_ = [
+        ('time_seconds', ctypes.c_double),
+        ('iterations', ctypes.c_longlong),
+        ('solved', ctypes.c_bool),
+    ]
+
+_lib: Optional[ctypes.CDLL] = None
+
+def _carregar_biblioteca() -> ctypes.CDLL:
+    """Carrega a biblioteca na primeira chamada e declara as assinaturas."""
+    global _lib
+    if _lib is None:
+        if not LIB_PATH.exists():
+            raise OSError(f"Biblioteca nativa não encontrada: {LIB_PATH}\n"
+                          "Execute primeiro: make build-lib")
+        lib = ctypes.CDLL(str(LIB_PATH))
+        lib.sudoku_solve_buffer.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.c_int]
+        lib.sudoku_solve_buffer.restype = _CSolveResult
+        lib.sudoku_solve_batch.argtypes = [ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int),
+                                           ctypes.POINTER(_CSolveResult), ctypes.c_int,
+                                           ctypes.c_int, ctypes.c_int]
+        lib.sudoku_solve_batch.restype = ctypes.c_int
+        _lib = lib
+    return _lib
+
+def native_available() -> bool:
+    """Indica se a biblioteca nativa pode ser carregada."""
+    try:
+        _carregar_biblioteca()
+    except OSError:
+        return False
+    return True
+
+def _to_solve_result(res: _CSolveResult) -> SolveResult:
+    return SolveResult(time_seconds=res.time_seconds, iterations=res.iterations, solved=res.solved)
+
+def solve_buffer_nativo(buffer, size: int) -> SolveResult:
+    """
+    Resolve um grid plano (size*size inteiros, ordem de linhas) no próprio buffer.
+
+    'buffer' deve ser gravável e ter itens do tamanho de um int em C,
+    por exemplo array.array('i'); nenhuma cópia é feita.
+    """
+    lib = _carregar_biblioteca()
+    grid = (ctypes.c_int * (size * size)).from_buffer(buffer)
+    return _to_solve_result(lib.sudoku_solve_buffer(grid, size))
+
+def solve_sudoku_nativo(sudoku: Sudoku) -> SolveResult:
+    """Resolve o Sudoku com o kernel C e copia a solução de volta para sudoku.grid."""
+    lib = _carregar_biblioteca()
+    size = sudoku.size
+    grid = (ctypes.c_int * (size * size))(*[num for row in sudoku.grid for num in row])
+
+    result = _to_solve_result(lib.sudoku_solve_buffer(grid, size))
+
+    sudoku.grid = [grid[i * size:(i + 1) * size] for i in range(size)]
+    return result
+
+def solve_batch_buffer_nativo(puzzles, solutions, count: int, size: int,
+                              num_threads: int = 0) -> List[SolveResult]:
+    """
+    Resolve 'count' puzzles contíguos de 'puzzles' numa única chamada ao C.
+
+    'puzzles' e 'solutions' são buffers de count*size*size ints em C
+    (por exemplo array.array('i')); as soluções são escritas em 'solutions'.
+    num_threads só tem efeito se a biblioteca foi compilada com OPENMP=1.
+    """
+    lib = _carregar_biblioteca()
+    cells = count * size * size
+    entrada = (ctypes.c_int * cells).from_buffer(puzzles)
+    saida = (ctypes.c_int * cells).from_buffer(solutions)
+    resultados = (_CSolveResult * count)()
+
+    lib.sudoku_solve_batch(entrada, saida, resultados, count, size, num_threads)
+
+    return [_to_solve_result(res) for res in resultados]
+
+def solve_batch_nativo(sudokus: List[Sudoku], num_threads: int = 0) -> List[SolveResult]:
+    """Resolve vários Sudokus do mesmo tamanho com uma chamada; soluções vão para cada grid."""
+    if not sudokus:
+        return []
+
+    size = sudokus[0].size
+    cells = size * size
+    puzzles = array.array('i', [num for sudoku in sudokus for row in sudoku.grid for num in row])
+    solutions = array.array('i', bytes(puzzles.itemsize * len(puzzles)))
+
+    results = solve_batch_buffer_nativo(puzzles, solutions, len(sudokus), size, num_threads)
+
+    for i, sudoku in enumerate(sudokus):
+        base = i * cells
+        sudoku.grid = [solutions[base + r * size:base + (r + 1) * size].tolist() for r in range(size)]
+    return results
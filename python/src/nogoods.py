@@ -0,0 +1,243 @@
+"""
+Módulo de aprendizado de nogoods (conflitos) para o backtracking iterativo.
+
+Quando os candidatos de uma célula se esgotam, a análise de conflito monta o
+conjunto de atribuições anteriores que explica a falha: para cada valor
+bloqueado, a atribuição vizinha que o bloqueia; para cada valor tentado, a
+explicação devolvida pela subárvore que falhou. Esse conjunto (nogood) nunca
+pode aparecer inteiro numa solução, então é guardado numa loja de tamanho
+limitado e usado para podar ramos futuros assim que se repetir sob outro
+prefixo. A busca também volta direto (backjump) para a atribuição mais
+profunda do conflito, em vez de recuar uma posição por vez.
+"""
+import time
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from sudoku import Sudoku
+from backtracking import SolveResult, Coordenada, _find_all_empty_cells
+from trail import Trilha
+from metricas import MASCARA_AMOSTRA, amostrar_progresso
+
+# Um literal codifica a atribuição (célula, valor) como célula * (size + 1) + valor
+Literal = int
+
+class LojaNogoods:
+    """
+    Conjunto limitado de nogoods com descarte do menos usado (LRU).
+
+    Cada nogood é indexado por todos os seus literais, para que a atribuição
+    de um literal consulte apenas os nogoods que o contêm.
+    """
+
+    def __init__(self, capacidade: int = 10000, max_tamanho: int = 12):
+        self.capacidade = capacidade
+        self.max_tamanho = max_tamanho
+        self._nogoods: 'OrderedDict[int, FrozenSet[Literal]]' = OrderedDict()
+        self._indice: Dict[Literal, Set[int]] = {}
+        self._proximo_id = 0
+        self.descartados = 0
+
+    def __len__(self) -> int:
+        return len(self._nogoods)
+
+    def registrar(self, nogood: Iterable[Literal]) -> bool:
+        """Guarda um nogood se ele não for grande demais; retorna se foi guardado."""
+        nogood = frozenset(nogood)
+        if not nogood or len(nogood) > self.max_tamanho:
+            return False
+
+        if len(self._nogoods) >= self.capacidade:
+            antigo_id, antigo = self._nogoods.popitem(last=False)
+            for lit in antigo:
+                ids = self._indice[lit]
+                ids.discard(antigo_id)
+                if not ids:
+                    del self._indice[lit]
+            self.descartados += 1
+
+        nogood_id = self._proximo_id
+        self._proximo_id += 1
+        self._nogoods[nogood_id] = nogood
+        for lit in nogood:
+            self._indice.setdefault(lit, set()).add(nogood_id)
+        return True
+
+    def violado(self, lit: Literal, vale) -> Optional[FrozenSet[Literal]]:
+        """
+        Procura um nogood que contém 'lit' e cujos demais literais valem agora.
+
+        'vale(l)' indica se o literal l está atribuído no estado atual.
+        Retorna a explicação (o nogood sem 'lit', possivelmente vazia) ou None.
+        """
+        ids = self._indice.get(lit)
+        if not ids:
+            return None
+        for nogood_id in ids:
+            nogood = self._nogoods[nogood_id]
+            if all(l == lit or vale(l) for l in nogood):
+                self._nogoods.move_to_end(nogood_id)
+                return nogood - {lit}
+        return None
+
+def solve_sudoku_nogoods(sudoku: Sudoku, loja: LojaNogoods = None) -> SolveResult:
+    """
+    Backtracking iterativo com MRV, análise de conflito, backjumping e nogoods.
+
+    Os contadores nogoods_aprendidos e podas_nogood do SolveResult medem o
+    ganho em relação à busca simples de solve_sudoku_iterativo.
+    """
+    start_time = time.thread_time()
+    iterations = 0
+    aprendidos = 0
+    podas = 0
+
+    if loja is None:
+        loja = LojaNogoods()
+
+    lista_vazias = _find_all_empty_cells(sudoku)
+    total_vazias = len(lista_vazias)
+
+    if total_vazias == 0:
+        end_time = time.thread_time()
+        return SolveResult(time_seconds=end_time - start_time, iterations=0, solved=True)
+
+    size = sudoku.size
+    base = size + 1
+    grid = sudoku.grid
+    geometria = sudoku.geometria
+    box_id = geometria.box_id
+    peers = geometria.peers
+    completo = ((1 << base) - 1) ^ 1
+
+    usados_linha = [0] * size
+    usados_coluna = [0] * size
+    usados_bloco = [0] * size
+    for r in range(size):
+        for c in range(size):
+            num = grid[r][c]
+            if num:
+                bit = 1 << num
+                usados_linha[r] |= bit
+                usados_coluna[c] |= bit
+                usados_bloco[box_id[r][c]] |= bit
+
+    # Profundidade da atribuição de cada célula (-1 = pista ou vazia)
+    profundidade = [[-1] * size for _ in range(size)]
+
+    def livres(cell: Coordenada) -> int:
+        r, c = cell
+        return completo & ~(usados_linha[r] | usados_coluna[c] | usados_bloco[box_id[r][c]])
+
+    def contar(cell: Coordenada) -> int:
+        return livres(cell).bit_count()
+
+    def vale(lit: Literal) -> bool:
+        r, c = divmod(lit // base, size)
+        return grid[r][c] == lit % base
+
+    def culpados(r: int, c: int) -> Set[Literal]:
+        """Para cada valor bloqueado por um vizinho, o literal vizinho mais raso que o bloqueia."""
+        bloqueio: Dict[int, int] = {}
+        for pr, pc in peers[r][c]:
+            num = grid[pr][pc]
+            if not num:
+                continue
+            d = profundidade[pr][pc]
+            anterior = bloqueio.get(num)
+            if d < 0:
+                bloqueio[num] = -1  # bloqueado por pista: não depende de nenhuma escolha
+            elif anterior is None or (anterior >= 0 and d < anterior):
+                bloqueio[num] = d
+        explicacao = set()
+        for num, d in bloqueio.items():
+            if d >= 0:
+                cell = lista_vazias[d]
+                explicacao.add((cell.row * size + cell.col) * base + num)
+        return explicacao
+
+    trilha = Trilha()
+    atribuir = trilha.atribuir
+    marcas = [0] * total_vazias
+    conflito: List[Set[Literal]] = [set() for _ in range(total_vazias)]
+
+    lista_vazias.sort(key=contar)
+
+    k = 0
+    last_k = -1
+
+    while -1 < k < total_vazias:
+        iterations += 1
+
+        # Amostra de progresso para as métricas ao vivo (e print a cada 10 milhões de iterações)
+        if iterations & MASCARA_AMOSTRA == 0:
+            amostrar_progresso(iterations, k)
+
+        if k > last_k and k < total_vazias - 1:
+            lista_vazias[k:] = sorted(lista_vazias[k:], key=contar)
+
+        last_k = k
+
+        cell = lista_vazias[k]
+        r, c = cell.row, cell.col
+        celula = r * size + c
+
+        atual = grid[r][c]
+        if atual:
+            trilha.desfazer_ate(marcas[k])
+        else:
+            marcas[k] = trilha.marcar()
+            conflito[k] = set()
+
+        candidatos = livres(cell) & ~((2 << atual) - 1)
+        escolhido = 0
+        while candidatos:
+            bit = candidatos & -candidatos
+            candidatos ^= bit
+            num = bit.bit_length() - 1
+            explicacao = loja.violado(celula * base + num, vale)
+            if explicacao is not None:
+                podas += 1
+                conflito[k] |= explicacao
+                continue
+            escolhido = num
+            break
+
+        if escolhido:
+            b = box_id[r][c]
+            bit = 1 << escolhido
+            atribuir(grid[r], c, escolhido)
+            atribuir(usados_linha, r, usados_linha[r] | bit)
+            atribuir(usados_coluna, c, usados_coluna[c] | bit)
+            atribuir(usados_bloco, b, usados_bloco[b] | bit)
+            profundidade[r][c] = k
+            k += 1
+            continue
+
+        # Falha: explica o esgotamento, aprende o nogood e salta para a causa mais profunda
+        nogood = conflito[k] | culpados(r, c)
+        profundidade[r][c] = -1
+        if loja.registrar(nogood):
+            aprendidos += 1
+
+        alvo = -1
+        for lit in nogood:
+            lr, lc = divmod(lit // base, size)
+            if profundidade[lr][lc] > alvo:
+                alvo = profundidade[lr][lc]
+
+        if alvo >= 0:
+            alvo_cell = lista_vazias[alvo]
+            alvo_lit = (alvo_cell.row * size + alvo_cell.col) * base + grid[alvo_cell.row][alvo_cell.col]
+            conflito[alvo] |= nogood - {alvo_lit}
+            # Abandona as posições entre o alvo e k (o valor do alvo é preservado)
+            for d in range(alvo + 1, k):
+                skipped = lista_vazias[d]
+                profundidade[skipped.row][skipped.col] = -1
+            trilha.desfazer_ate(marcas[alvo + 1])
+        k = alvo
+
+    end_time = time.thread_time()
+    solved = k == total_vazias
+    return SolveResult(time_seconds=end_time - start_time, iterations=iterations, solved=solved,
+                       nogoods_aprendidos=aprendidos, podas_nogood=podas)
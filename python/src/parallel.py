@@ -0,0 +1,410 @@
+"""
+Módulo de busca paralela para resolver um único Sudoku difícil.
+
+O processo principal começa a busca sozinho, no mesmo laço dos workers; só
+quando ela passa de ITERACOES_ANTES_DE_DIVIDIR iterações o que falta da
+árvore é dividido em subproblemas, e os workers passam a redistribuir ramos
+sob demanda sempre que algum fica ocioso. Puzzles resolvidos dentro desse
+limite não pagam a criação de processos. Cada subproblema é apenas a lista de
+atribuições (linha, coluna, valor) feitas sobre o puzzle original, o que o
+torna barato de serializar entre processos.
+
+O laço (_BuscaParalela) é o de solve_sudoku_iterativo: grid plano, ordem das
+células e ordenação MRV por contagem em buffers alocados uma vez por
+subproblema, com os valores presentes em cada unidade guardados em máscaras
+de bits (como em _solve_iterativo_bits, mas para qualquer tamanho e com as
+diagonais do X-Sudoku e as regiões do jigsaw).
+"""
+import multiprocessing as mp
+import os
+import queue
+import time
+from typing import List, Optional, Tuple
+
+from sudoku import Sudoku
+from geometry import Geometria
+from backtracking import SolveResult, solve_sudoku_iterativo
+
+# Uma atribuição é (linha, coluna, valor); um subproblema é uma lista delas
+Atribuicao = Tuple[int, int, int]
+
+# Iterações entre verificações de parada e de pedidos de trabalho
+INTERVALO_VERIFICACAO = 256
+
+# Iterações da busca no processo principal antes de dividir a árvore entre os workers
+ITERACOES_ANTES_DE_DIVIDIR = 2048
+
+# Tempo de espera por uma tarefa antes de reavaliar se a busca terminou
+TIMEOUT_FILA = 0.05
+
+
+def solve_sudoku_paralelo(sudoku: Sudoku, num_workers: Optional[int] = None) -> SolveResult:
+    """
+    Resolve o Sudoku dividindo a árvore de busca entre vários processos.
+
+    Workers ociosos recebem ramos não explorados doados pelos workers
+    ocupados (divisão sob demanda). A busca para assim que qualquer worker
+    encontra uma solução, que é copiada para sudoku.grid.
+    """
+    start_time = time.time()
+
+    if sudoku.geometria.gaiolas:
+        # Killer precisa do filtro de somas de _solve_iterativo_gaiolas
+        result = solve_sudoku_iterativo(sudoku)
+        return result._replace(time_seconds=time.time() - start_time)
+
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+
+    size = sudoku.size
+    base = [num for row in sudoku.grid for num in row]
+    busca = _BuscaParalela(sudoku.geometria, base, [])
+    solved = busca.executar(ITERACOES_ANTES_DE_DIVIDIR)
+    iterations = busca.iterations
+    if solved is not None:
+        if solved:
+            busca.copiar_para(sudoku)
+        return SolveResult(time_seconds=time.time() - start_time, iterations=iterations,
+                           solved=solved)
+
+    tarefas_iniciais = busca.dividir()
+    if not tarefas_iniciais:
+        return SolveResult(time_seconds=time.time() - start_time, iterations=iterations,
+                           solved=False)
+
+    ctx = mp.get_context()
+    tarefas = ctx.Queue()
+    resultados = ctx.Queue()
+    pendentes = ctx.Value('i', len(tarefas_iniciais))  # Tarefas criadas e ainda não concluídas
+    ociosos = ctx.Value('i', 0)                        # Workers aguardando trabalho
+    encontrado = ctx.Event()
+
+    for tarefa in tarefas_iniciais:
+        tarefas.put(tarefa)
+    # Itens restantes na fila após uma solução não devem bloquear o encerramento
+    tarefas.cancel_join_thread()
+
+    processos = [
+        ctx.Process(target=_worker,
+                    args=(sudoku.geometria, base, tarefas, resultados, pendentes, ociosos, encontrado))
+        for _ in range(num_workers)
+    ]
+    for p in processos:
+        p.start()
+
+    solucao = None
+    finalizados = 0
+    while finalizados < num_workers:
+        try:
+            tipo, dados = resultados.get(timeout=1.0)
+        except queue.Empty:
+            if not any(p.is_alive() for p in processos):
+                break
+            continue
+        if tipo == 'solucao':
+            solucao = dados
+        else:
+            iterations += dados
+            finalizados += 1
+
+    for p in processos:
+        p.join()
+
+    if solucao is not None:
+        for r in range(size):
+            sudoku.grid[r][:] = solucao[r * size:(r + 1) * size]
+
+    end_time = time.time()
+    return SolveResult(time_seconds=end_time - start_time, iterations=iterations,
+                       solved=solucao is not None)
+
+
+def _worker(geometria: Geometria, base: List[int], tarefas, resultados,
+            pendentes, ociosos, encontrado) -> None:
+    """Laço de um worker: consome subproblemas até a busca terminar."""
+    iterations = 0
+
+    while not encontrado.is_set():
+        with ociosos.get_lock():
+            ociosos.value += 1
+        tarefa = None
+        while tarefa is None and not encontrado.is_set():
+            try:
+                tarefa = tarefas.get(timeout=TIMEOUT_FILA)
+            except queue.Empty:
+                if pendentes.value == 0:
+                    break
+        with ociosos.get_lock():
+            ociosos.value -= 1
+        if tarefa is None:
+            break
+
+        busca = _BuscaParalela(geometria, base, tarefa)
+        solved = busca.executar(None, tarefas, pendentes, ociosos, encontrado)
+        iterations += busca.iterations
+
+        if solved:
+            encontrado.set()
+            resultados.put(('solucao', busca.celulas))
+
+        with pendentes.get_lock():
+            pendentes.value -= 1
+
+    tarefas.cancel_join_thread()
+    resultados.put(('fim', iterations))
+
+
+class _BuscaParalela:
+    """
+    Backtracking iterativo de um subproblema, retomável e divisível.
+
+    limite[k] é o maior valor que esta busca ainda pode tentar na posição k;
+    valores acima dele já foram doados a outros workers.
+    """
+
+    def __init__(self, geometria: Geometria, base: List[int], tarefa: List[Atribuicao]):
+        size = geometria.size
+        self.size = size
+        self.tarefa = tarefa
+        self.vizinhos = geometria.peer_indices
+        # Unidades de cada célula do grid plano: linha, coluna e bloco (ou região),
+        # e as diagonais do X-Sudoku à parte, vazias nas demais células
+        self.linha = tuple(u for row in geometria.cell_units for u, _, _ in row)
+        self.coluna = tuple(u for row in geometria.cell_units for _, u, _ in row)
+        self.bloco = tuple(u for row in geometria.cell_units for _, _, u in row)
+        extras: List[Tuple[int, ...]] = [()] * (size * size)
+        for u in range(3 * size, len(geometria.unit_indices)):
+            for cel in geometria.unit_indices[u]:
+                extras[cel] += (u,)
+        self.extras = tuple(extras)
+        self.mascaras = [0] * len(geometria.unit_indices)
+
+        self.celulas = list(base)
+        self.iterations = 0
+        self.k = 0
+        self.last_k = -1
+        self.valida = True
+        for i, num in enumerate(self.celulas):
+            if num:
+                self._marcar(i, 1 << num)
+        for r, c, num in tarefa:
+            cel = r * size + c
+            if self.celulas[cel] or self._usados(cel) >> num & 1:
+                self.valida = False
+                break
+            self.celulas[cel] = num
+            self._marcar(cel, 1 << num)
+
+        self.ordem = [i for i, num in enumerate(self.celulas) if num == 0]
+        self.limite = [size] * len(self.ordem)
+
+    def _usados(self, cel: int) -> int:
+        mascaras = self.mascaras
+        usados = mascaras[self.linha[cel]] | mascaras[self.coluna[cel]] | mascaras[self.bloco[cel]]
+        for u in self.extras[cel]:
+            usados |= mascaras[u]
+        return usados
+
+    def _marcar(self, cel: int, bit: int) -> None:
+        mascaras = self.mascaras
+        mascaras[self.linha[cel]] |= bit
+        mascaras[self.coluna[cel]] |= bit
+        mascaras[self.bloco[cel]] |= bit
+        for u in self.extras[cel]:
+            mascaras[u] |= bit
+
+    def executar(self, max_iteracoes: Optional[int], tarefas=None, pendentes=None,
+                 ociosos=None, encontrado=None) -> Optional[bool]:
+        """
+        Continua a busca; True/False quando ela termina, None quando é interrompida.
+
+        A busca é interrompida ao passar de max_iteracoes ou quando outro worker
+        encontra a solução. Com tarefas, doa ramos enquanto houver workers ociosos.
+        """
+        if not self.valida:
+            return False
+
+        size = self.size
+        celulas = self.celulas
+        ordem = self.ordem
+        limite = self.limite
+        mascaras = self.mascaras
+        linha, coluna, bloco, extras = self.linha, self.coluna, self.bloco, self.extras
+        total_vazias = len(ordem)
+
+        todos = ((1 << size) - 1) << 1
+        acima = [todos & ~((2 << v) - 1) for v in range(size + 1)]  # valores maiores que v
+        chaves = [0] * total_vazias
+        auxiliar = [0] * total_vazias
+        baldes = [0] * (size + 1)
+        faixa_baldes = range(size + 1)
+        restantes = [range(k, total_vazias) for k in range(total_vazias)]
+
+        iterations = self.iterations
+        k = self.k
+        last_k = self.last_k
+        interrompida = False
+
+        while -1 < k < total_vazias:
+            if iterations % INTERVALO_VERIFICACAO == 0 and iterations:
+                if max_iteracoes is not None and iterations >= max_iteracoes:
+                    interrompida = True
+                    break
+                if encontrado is not None:
+                    if encontrado.is_set():
+                        interrompida = True
+                        break
+                    if ociosos.value > 0 and tarefas.empty():
+                        self._doar(k, tarefas, pendentes)
+
+            iterations += 1
+
+            if k > last_k:
+                # Posição alcançada avançando: a célula pode ter mudado, limite zera
+                limite[k] = size
+                if k < total_vazias - 1:
+                    faixa = restantes[k]
+                    for v in faixa_baldes:
+                        baldes[v] = 0
+                    for i in faixa:
+                        cel = ordem[i]
+                        usados = mascaras[linha[cel]] | mascaras[coluna[cel]] | mascaras[bloco[cel]]
+                        for u in extras[cel]:
+                            usados |= mascaras[u]
+                        n = size - usados.bit_count()
+                        chaves[i] = n
+                        baldes[n] += 1
+
+                    pos = k
+                    for v in faixa_baldes:
+                        quantidade = baldes[v]
+                        baldes[v] = pos
+                        pos += quantidade
+                    for i in faixa:
+                        n = chaves[i]
+                        auxiliar[baldes[n]] = ordem[i]
+                        baldes[n] += 1
+                    for i in faixa:
+                        ordem[i] = auxiliar[i]
+
+            last_k = k
+
+            cel = ordem[k]
+            r = linha[cel]
+            c = coluna[cel]
+            b = bloco[cel]
+            atual = celulas[cel]
+            if atual:
+                # Retira o valor atual das máscaras antes de procurar o próximo
+                bit = ~(1 << atual)
+                mascaras[r] &= bit
+                mascaras[c] &= bit
+                mascaras[b] &= bit
+                for u in extras[cel]:
+                    mascaras[u] &= bit
+
+            usados = mascaras[r] | mascaras[c] | mascaras[b]
+            for u in extras[cel]:
+                usados |= mascaras[u]
+            livres = acima[atual] & ~usados & ~acima[limite[k]]
+            if livres:
+                num = (livres & -livres).bit_length() - 1
+                celulas[cel] = num
+                bit = 1 << num
+                mascaras[r] |= bit
+                mascaras[c] |= bit
+                mascaras[b] |= bit
+                for u in extras[cel]:
+                    mascaras[u] |= bit
+                k += 1
+            else:
+                celulas[cel] = 0
+                k -= 1
+
+        self.iterations = iterations
+        self.k = k
+        self.last_k = last_k
+        if interrompida:
+            return None
+        return k == total_vazias
+
+    def _candidatos(self, j: int, k: int) -> List[int]:
+        """
+        Valores da posição j acima do atual e até limite[j], com as posições j..k vazias.
+
+        Usa os vizinhos (e não as máscaras), que continuam valendo para o grid esvaziado.
+        """
+        celulas = self.celulas
+        ordem = self.ordem
+        cel = ordem[j]
+        atual = celulas[cel]
+        salvos = [celulas[ordem[i]] for i in range(j, k + 1)]
+        for i in range(j, k + 1):
+            celulas[ordem[i]] = 0
+        usados = 0
+        for p in self.vizinhos[cel]:
+            usados |= 1 << celulas[p]
+        for i, valor in zip(range(j, k + 1), salvos):
+            celulas[ordem[i]] = valor
+        return [num for num in range(atual + 1, self.limite[j] + 1) if not usados >> num & 1]
+
+    def _prefixo(self, j: int) -> List[Atribuicao]:
+        """Atribuições do subproblema mais as das posições 0..j-1."""
+        size = self.size
+        return self.tarefa + [(*divmod(self.ordem[i], size), self.celulas[self.ordem[i]])
+                              for i in range(j)]
+
+    def _doar(self, k: int, tarefas, pendentes) -> int:
+        """
+        Doa os candidatos ainda não tentados da posição mais rasa com trabalho restante.
+
+        Ramos rasos representam as maiores subárvores, então uma única doação
+        costuma manter o worker ocioso ocupado por bastante tempo.
+        """
+        size = self.size
+        for j in range(k):
+            if self.limite[j] < size:
+                continue
+
+            candidatos = self._candidatos(j, k)
+            cel = self.ordem[j]
+            self.limite[j] = self.celulas[cel]
+            if not candidatos:
+                continue
+
+            prefixo = self._prefixo(j)
+            r, c = divmod(cel, size)
+            with pendentes.get_lock():
+                pendentes.value += len(candidatos)
+            for num in candidatos:
+                tarefas.put(prefixo + [(r, c, num)])
+            return len(candidatos)
+
+        return 0
+
+    def dividir(self) -> List[List[Atribuicao]]:
+        """
+        Todo o trabalho restante de uma busca interrompida, como subproblemas.
+
+        Da posição atual para as mais rasas: os candidatos ainda não tentados de
+        cada posição, com as mais profundas vazias. A primeira tarefa é a que a
+        busca sequencial exploraria em seguida.
+        """
+        if self.k < 0:
+            return []
+        if self.k > self.last_k:
+            # Posição recém-alcançada: o limite dela ainda não foi zerado
+            self.limite[self.k] = self.size
+        size = self.size
+        subproblemas = []
+        for j in range(self.k, -1, -1):
+            cel = self.ordem[j]
+            r, c = divmod(cel, size)
+            prefixo = self._prefixo(j)
+            subproblemas.extend(prefixo + [(r, c, num)] for num in self._candidatos(j, self.k))
+        return subproblemas
+
+    def copiar_para(self, sudoku: Sudoku) -> None:
+        size = self.size
+        for r in range(size):
+            sudoku.grid[r][:] = self.celulas[r * size:(r + 1) * size]
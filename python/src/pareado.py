@@ -0,0 +1,185 @@
+"""
+Execução pareada C x Python: as duas linguagens nos mesmos puzzles, ao mesmo tempo.
+
+Cada linguagem roda num processo próprio, fixado num núcleo com
+os.sched_setaffinity, e resolve a mesma fatia do arquivo de puzzles. O lado C
+chama o kernel de libsudoku.so dentro do processo (native.py), sem iniciar o
+binário nem interpretar sua saída. Os dois lados medem o tempo de CPU da
+thread que resolve (time.thread_time no Python, CLOCK_THREAD_CPUTIME_ID no C),
+então os tempos continuam comparáveis mesmo quando os processos dividem um núcleo.
+
+Cada execução é impressa assim que termina e gravada como uma linha JSON em
+logs/pareado_{size}_{case}.jsonl, um único arquivo com as duas linguagens:
+
+    {"linguagem": "c", "tamanho": "medium", "caso": "worst", "puzzle": 3, "vazias": 40,
+     "tempo": 0.000412, "iteracoes": 58, "resolvido": true, "cpu": 1}
+
+analyze_results.py lê esses arquivos e calcula o speedup puzzle a puzzle.
+Compile a biblioteca antes com: make build-lib
+"""
+import json
+import multiprocessing as mp
+import os
+import queue
+import statistics
+from typing import Dict, List, Optional, Sequence, Tuple
+
+def _trabalhador(lang: str, size: int, puzzle_file: str, inicio: int, fim: int,
+                 cpu: Optional[int], engine: str, fila) -> None:
+    """Resolve puzzles[inicio:fim] numa linguagem e envia cada resultado pela fila."""
+    from main import ENGINES, carregar_funcao
+    from sudoku import load_puzzles_from_file
+    from verifier import verify_solution
+
+    try:
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+        solve = carregar_funcao(ENGINES['c' if lang == 'c' else engine])
+        puzzles = load_puzzles_from_file(puzzle_file, size)[inicio:fim]
+        for numero, sudoku in enumerate(puzzles, inicio + 1):
+            original = sudoku.copy()
+            result = solve(sudoku)
+            resolvido = result.solved and verify_solution(sudoku.grid, original.grid).valid
+            fila.put((lang, {'puzzle': numero, 'vazias': original.count_empty_cells(),
+                             'tempo': result.time_seconds, 'iteracoes': result.iterations,
+                             'resolvido': resolvido, 'cpu': cpu}))
+    except Exception as e:  # o processo pai precisa saber que este lado parou
+        fila.put((lang, {'erro': f"{type(e).__name__}: {e}"}))
+    finally:
+        fila.put((lang, None))
+
+def escolher_cpus(cpus: Optional[Sequence[int]] = None) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Núcleos do processo C e do processo Python.
+
+    Sem 'cpus', usa os dois primeiros núcleos permitidos a este processo; com
+    um só núcleo, os dois processos ficam nele. (None, None) onde não há
+    afinidade de CPU (macOS, Windows).
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None, None
+    if not cpus:
+        cpus = sorted(os.sched_getaffinity(0))[:2]
+    return cpus[0], cpus[-1]
+
+def resumo_pareado(registros: List[Dict]) -> Dict[str, float]:
+    """
+    Speedup do C sobre o Python nos puzzles resolvidos pelas duas linguagens.
+
+    'total' é a razão entre os tempos somados; 'mediano' é a mediana das razões
+    de cada puzzle, menos sensível a um puzzle muito mais caro que os outros.
+    """
+    por_puzzle: Dict[int, Dict[str, Dict]] = {}
+    for registro in registros:
+        por_puzzle.setdefault(registro['puzzle'], {})[registro['linguagem']] = registro
+    pares = [(p['c'], p['python']) for p in por_puzzle.values()
+             if len(p) == 2 and p['c']['resolvido'] and p['python']['resolvido']]
+    if not pares:
+        return {'pares': 0}
+
+    tempo_c = sum(c['tempo'] for c, _ in pares)
+    tempo_py = sum(py['tempo'] for _, py in pares)
+    razoes = [py['tempo'] / c['tempo'] for c, py in pares if c['tempo'] > 0]
+    return {
+        'pares': len(pares),
+        'tempo_c': tempo_c,
+        'tempo_python': tempo_py,
+        'total': tempo_py / tempo_c if tempo_c > 0 else 0.0,
+        'mediano': statistics.median(razoes) if razoes else 0.0,
+        'iteracoes_iguais': sum(c['iteracoes'] == py['iteracoes'] for c, py in pares),
+    }
+
+def executar_pareado(size_str: str, case_str: str, puzzle_file: Optional[str] = None,
+                     inicio: int = 0, quantidade: int = 30, cpus: Optional[Sequence[int]] = None,
+                     engine: str = 'python', saida: Optional[str] = None) -> bool:
+    """
+    Resolve a mesma fatia de puzzles em C e em Python, em paralelo.
+
+    Retorna False se a configuração for inválida, a biblioteca ou o arquivo
+    de puzzles não existir, ou um dos lados falhar.
+    """
+    from main import SIZE_MAP
+    from native import native_available
+
+    if size_str not in SIZE_MAP:
+        print(f"Tamanho inválido. Use: {', '.join(SIZE_MAP)}")
+        return False
+    if not native_available():
+        print("Erro: libsudoku.so não encontrada. Execute primeiro: make build-lib")
+        return False
+
+    size = SIZE_MAP[size_str][0]
+    if puzzle_file is None:
+        puzzle_file = f"../../puzzle_seeds/{size_str}_{case_str}.txt"
+    if not os.path.exists(puzzle_file):
+        print(f"Erro: Arquivo de puzzles não encontrado: {puzzle_file}")
+        print("Execute primeiro: make build-generator && ./c/bin/puzzle_generator")
+        return False
+    if saida is None:
+        saida = f"../../logs/pareado_{size_str}_{case_str}.jsonl"
+    os.makedirs(os.path.dirname(saida) or '.', exist_ok=True)
+
+    cpu_c, cpu_py = escolher_cpus(cpus)
+    fim = inicio + quantidade
+    print(f"Pareado {size_str} {case_str}: puzzles {inicio + 1}-{fim} de {puzzle_file}")
+    if cpu_c is None:
+        print("  Afinidade de CPU indisponível nesta plataforma: processos sem núcleo fixo")
+    elif cpu_c == cpu_py:
+        print(f"  Um só núcleo disponível: C e Python dividem a CPU {cpu_c} "
+              "(os tempos são de CPU da thread e continuam comparáveis)")
+    else:
+        print(f"  C na CPU {cpu_c}, Python na CPU {cpu_py}")
+
+    ctx = mp.get_context()
+    fila = ctx.Queue()
+    processos = {
+        lang: ctx.Process(target=_trabalhador,
+                          args=(lang, size, puzzle_file, inicio, fim, cpu, engine, fila))
+        for lang, cpu in (('c', cpu_c), ('python', cpu_py))
+    }
+    for p in processos.values():
+        p.start()
+
+    registros = []
+    erros = []
+    ativos = dict(processos)
+    with open(saida, 'w') as arquivo:
+        while ativos:
+            try:
+                lang, dados = fila.get(timeout=1.0)
+            except queue.Empty:
+                # Um processo morto por sinal (OOM, segfault no kernel C) não envia o None
+                for lang, p in list(ativos.items()):
+                    if not p.is_alive() and p.exitcode:
+                        del ativos[lang]
+                        erros.append(f"{lang}: processo terminou com código {p.exitcode}")
+                        print(f"  ✗ {lang}: processo terminou com código {p.exitcode}", flush=True)
+                continue
+            if dados is None:
+                ativos.pop(lang, None)
+                continue
+            if 'erro' in dados:
+                erros.append(f"{lang}: {dados['erro']}")
+                print(f"  ✗ {lang}: {dados['erro']}")
+                continue
+            registro = {'linguagem': lang, 'tamanho': size_str, 'caso': case_str, **dados}
+            registros.append(registro)
+            arquivo.write(json.dumps(registro) + '\n')
+            arquivo.flush()
+            print(f"  [{lang:<6}] puzzle {dados['puzzle']:>3}: {dados['tempo']:.6f}s "
+                  f"{dados['iteracoes']:>10} iterações  {'✓' if dados['resolvido'] else '✗'}",
+                  flush=True)
+
+    for p in processos.values():
+        p.join()
+
+    resumo = resumo_pareado(registros)
+    if resumo['pares']:
+        print(f"\n  {resumo['pares']} puzzles resolvidos pelas duas linguagens")
+        print(f"  Tempo total: C {resumo['tempo_c']:.6f}s, Python {resumo['tempo_python']:.6f}s")
+        print(f"  Speedup C vs Python: {resumo['total']:.2f}x no total, "
+              f"{resumo['mediano']:.2f}x mediano por puzzle")
+        print(f"  Iterações iguais nas duas linguagens: {resumo['iteracoes_iguais']}/{resumo['pares']}")
+    print(f"  Resultados salvos em: {saida}")
+
+    return not erros
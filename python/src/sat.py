@@ -0,0 +1,373 @@
+"""
+Módulo de codificação SAT e solver CDCL para Sudoku.
+
+Codifica um Sudoku em CNF, escreve no formato DIMACS (para comparar com
+solvers externos) e resolve com um solver CDCL em Python puro: propagação
+com dois literais observados, aprendizado de cláusulas pelo primeiro UIP,
+backjumping não cronológico, heurística VSIDS, salvamento de fase e
+reinícios pela sequência de Luby.
+
+A variável x(r, c, v) é verdadeira quando a célula [r][c] recebe o valor v.
+
+Codificação mínima:
+    - cada célula tem pelo menos um valor
+    - cada valor aparece no máximo uma vez em cada linha, coluna e bloco
+Codificação estendida (adiciona cláusulas redundantes que ajudam a propagação):
+    - cada célula tem no máximo um valor
+    - cada valor aparece pelo menos uma vez em cada linha, coluna e bloco
+
+Uso para exportar DIMACS:
+    python3 sat.py <size> <puzzle_file> <out_dir> [--extended]
+"""
+import argparse
+import heapq
+import os
+import time
+from typing import List, Optional, Tuple
+
+from sudoku import Sudoku, load_puzzles_from_file
+from backtracking import SolveResult
+
+Clausula = List[int]
+
+def variable(size: int, r: int, c: int, num: int) -> int:
+    """Índice DIMACS (a partir de 1) da variável x(r, c, num)."""
+    return (r * size + c) * size + num
+
+def encode_sudoku(sudoku: Sudoku, extended: bool = False) -> Tuple[int, List[Clausula]]:
+    """Retorna (número de variáveis, cláusulas) da codificação do Sudoku."""
+    size = sudoku.size
+    geometria = sudoku.geometria
+    valores = range(1, size + 1)
+    clausulas: List[Clausula] = []
+
+    for r in range(size):
+        for c in range(size):
+            # Pelo menos um valor por célula
+            clausulas.append([variable(size, r, c, num) for num in valores])
+
+            # No máximo uma vez por unidade: pares de vizinhos (cada par uma única vez)
+            indice = r * size + c
+            for pr, pc in geometria.peers[r][c]:
+                if pr * size + pc > indice:
+                    for num in valores:
+                        clausulas.append([-variable(size, r, c, num), -variable(size, pr, pc, num)])
+
+            if extended:
+                # No máximo um valor por célula
+                for a in valores:
+                    for b in range(a + 1, size + 1):
+                        clausulas.append([-variable(size, r, c, a), -variable(size, r, c, b)])
+
+            # Pistas
+            if sudoku.grid[r][c]:
+                clausulas.append([variable(size, r, c, sudoku.grid[r][c])])
+
+    if extended:
+        # Pelo menos uma vez por unidade
+        for unit in geometria.units:
+            for num in valores:
+                clausulas.append([variable(size, r, c, num) for r, c in unit])
+
+    return size * size * size, clausulas
+
+def write_dimacs(path: str, num_vars: int, clausulas: List[Clausula], comentario: str = "") -> None:
+    """Escreve a CNF no formato DIMACS."""
+    with open(path, 'w') as f:
+        for linha in comentario.splitlines():
+            f.write(f"c {linha}\n")
+        f.write(f"p cnf {num_vars} {len(clausulas)}\n")
+        for clausula in clausulas:
+            f.write(" ".join(map(str, clausula)) + " 0\n")
+
+def decode_solution(modelo: List[int], size: int) -> List[List[int]]:
+    """Converte o modelo (valor +1/-1 por variável) de volta para um grid."""
+    grid = [[0] * size for _ in range(size)]
+    for r in range(size):
+        for c in range(size):
+            for num in range(1, size + 1):
+                if modelo[variable(size, r, c, num)] > 0:
+                    grid[r][c] = num
+                    break
+    return grid
+
+def _luby(i: int) -> int:
+    """i-ésimo termo (a partir de 1) da sequência de Luby: 1 1 2 1 1 2 4 ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+class SolverCDCL:
+    """Solver CDCL mínimo sobre cláusulas em formato DIMACS (listas de inteiros)."""
+
+    DECAIMENTO = 0.95
+    REINICIO_BASE = 100  # conflitos por unidade da sequência de Luby
+
+    def __init__(self, num_vars: int, clausulas: List[Clausula]):
+        n = num_vars
+        self.num_vars = n
+        self.valor = [0] * (n + 1)        # +1 verdadeiro, -1 falso, 0 livre
+        self.nivel = [0] * (n + 1)
+        self.razao: List[Optional[int]] = [None] * (n + 1)
+        self.fase = [False] * (n + 1)      # última polaridade atribuída
+        self.atividade = [0.0] * (n + 1)
+        self.incremento = 1.0
+        self.heap = [(0.0, v) for v in range(1, n + 1)]
+
+        self.clausulas: List[Clausula] = []
+        self.watches: List[List[int]] = [[] for _ in range(2 * n + 2)]
+        self.trilha: List[int] = []
+        self.limites_nivel: List[int] = []
+        self.qhead = 0
+
+        self.decisoes = 0
+        self.conflitos = 0
+        self.ok = True
+
+        for clausula in clausulas:
+            self._adicionar_original(clausula)
+
+    @staticmethod
+    def _w(lit: int) -> int:
+        return 2 * lit if lit > 0 else -2 * lit + 1
+
+    def _valor_lit(self, lit: int) -> int:
+        return self.valor[lit] if lit > 0 else -self.valor[-lit]
+
+    def _atribuir(self, lit: int, razao: Optional[int]) -> None:
+        v = abs(lit)
+        self.valor[v] = 1 if lit > 0 else -1
+        self.nivel[v] = len(self.limites_nivel)
+        self.razao[v] = razao
+        self.trilha.append(lit)
+
+    def _adicionar_original(self, clausula: Clausula) -> None:
+        if not self.ok:
+            return
+        lits = []
+        for lit in dict.fromkeys(clausula):
+            if -lit in lits:
+                return  # tautologia
+            val = self._valor_lit(lit)
+            if val > 0:
+                return  # já satisfeita no nível 0
+            if val == 0:
+                lits.append(lit)
+        if not lits:
+            self.ok = False
+        elif len(lits) == 1:
+            self._atribuir(lits[0], None)
+        else:
+            self._anexar(lits)
+
+    def _anexar(self, lits: Clausula) -> int:
+        indice = len(self.clausulas)
+        self.clausulas.append(lits)
+        self.watches[self._w(lits[0])].append(indice)
+        self.watches[self._w(lits[1])].append(indice)
+        return indice
+
+    def _propagar(self) -> Optional[int]:
+        """Propaga as atribuições pendentes; retorna o índice de uma cláusula em conflito."""
+        valor = self.valor
+        clausulas = self.clausulas
+        watches = self.watches
+        trilha = self.trilha
+
+        while self.qhead < len(trilha):
+            lit = trilha[self.qhead]
+            self.qhead += 1
+            falso = -lit
+            lista = watches[self._w(falso)]
+            i = j = 0
+            fim = len(lista)
+            while i < fim:
+                ci = lista[i]
+                i += 1
+                c = clausulas[ci]
+                if c[0] == falso:
+                    c[0], c[1] = c[1], falso
+                primeiro = c[0]
+                val_primeiro = valor[primeiro] if primeiro > 0 else -valor[-primeiro]
+                if val_primeiro > 0:
+                    lista[j] = ci
+                    j += 1
+                    continue
+
+                # Procura outro literal não falso para observar
+                for k in range(2, len(c)):
+                    q = c[k]
+                    if (valor[q] if q > 0 else -valor[-q]) >= 0:
+                        c[1], c[k] = q, falso
+                        watches[2 * q if q > 0 else -2 * q + 1].append(ci)
+                        break
+                else:
+                    lista[j] = ci
+                    j += 1
+                    if val_primeiro < 0:
+                        # Conflito: mantém os observadores restantes e interrompe
+                        while i < fim:
+                            lista[j] = lista[i]
+                            j += 1
+                            i += 1
+                        del lista[j:]
+                        self.qhead = len(trilha)
+                        return ci
+                    self._atribuir(primeiro, ci)
+            del lista[j:]
+        return None
+
+    def _aumentar(self, v: int) -> None:
+        self.atividade[v] += self.incremento
+        if self.atividade[v] > 1e100:
+            # Reescala para evitar overflow e reconstrói o heap com as variáveis livres
+            self.atividade = [a * 1e-100 for a in self.atividade]
+            self.incremento *= 1e-100
+            self.heap = [(-self.atividade[u], u) for u in range(1, self.num_vars + 1) if not self.valor[u]]
+            heapq.heapify(self.heap)
+
+    def _analisar(self, conflito: int) -> Tuple[Clausula, int]:
+        """Análise pelo primeiro UIP: retorna a cláusula aprendida e o nível de retorno."""
+        nivel_atual = len(self.limites_nivel)
+        visto = set()
+        aprendida: Clausula = [0]
+        contador = 0
+        lit = 0
+        indice = len(self.trilha) - 1
+        clausula = self.clausulas[conflito]
+
+        while True:
+            for q in (clausula if lit == 0 else clausula[1:]):
+                v = abs(q)
+                if v not in visto and self.nivel[v] > 0:
+                    visto.add(v)
+                    self._aumentar(v)
+                    if self.nivel[v] >= nivel_atual:
+                        contador += 1
+                    else:
+                        aprendida.append(q)
+            while abs(self.trilha[indice]) not in visto:
+                indice -= 1
+            lit = self.trilha[indice]
+            indice -= 1
+            contador -= 1
+            if contador == 0:
+                break
+            clausula = self.clausulas[self.razao[abs(lit)]]
+
+        aprendida[0] = -lit
+        if len(aprendida) == 1:
+            return aprendida, 0
+
+        # O literal de maior nível (depois do UIP) vai para a posição 1 (observado)
+        maior = max(range(1, len(aprendida)), key=lambda i: self.nivel[abs(aprendida[i])])
+        aprendida[1], aprendida[maior] = aprendida[maior], aprendida[1]
+        return aprendida, self.nivel[abs(aprendida[1])]
+
+    def _retroceder(self, nivel: int) -> None:
+        if len(self.limites_nivel) <= nivel:
+            return
+        inicio = self.limites_nivel[nivel]
+        for lit in self.trilha[inicio:]:
+            v = abs(lit)
+            self.fase[v] = lit > 0
+            self.valor[v] = 0
+            self.razao[v] = None
+            heapq.heappush(self.heap, (-self.atividade[v], v))
+        del self.trilha[inicio:]
+        del self.limites_nivel[nivel:]
+        self.qhead = inicio
+
+    def _decidir(self) -> int:
+        while self.heap:
+            _, v = heapq.heappop(self.heap)
+            if not self.valor[v]:
+                return v if self.fase[v] else -v
+        return 0
+
+    def resolver(self) -> bool:
+        """Retorna True se a fórmula é satisfatível (o modelo fica em self.valor)."""
+        if not self.ok or self._propagar() is not None:
+            return False
+
+        reinicios = 1
+        limite = _luby(reinicios) * self.REINICIO_BASE
+        conflitos_reinicio = 0
+
+        while True:
+            conflito = self._propagar()
+            if conflito is not None:
+                self.conflitos += 1
+                conflitos_reinicio += 1
+                if not self.limites_nivel:
+                    return False
+
+                aprendida, nivel = self._analisar(conflito)
+                self._retroceder(nivel)
+                if len(aprendida) == 1:
+                    self._atribuir(aprendida[0], None)
+                else:
+                    self._atribuir(aprendida[0], self._anexar(aprendida))
+                self.incremento /= self.DECAIMENTO
+
+                if conflitos_reinicio >= limite:
+                    self._retroceder(0)
+                    reinicios += 1
+                    limite = _luby(reinicios) * self.REINICIO_BASE
+                    conflitos_reinicio = 0
+                continue
+
+            lit = self._decidir()
+            if not lit:
+                return True
+            self.decisoes += 1
+            self.limites_nivel.append(len(self.trilha))
+            self._atribuir(lit, None)
+
+def solve_sudoku_sat(sudoku: Sudoku, extended: bool = True) -> SolveResult:
+    """
+    Resolve o Sudoku pela codificação CNF e pelo solver CDCL.
+
+    'iterations' conta as decisões do solver; a solução é decodificada para sudoku.grid.
+    """
+    start_time = time.thread_time()
+
+    num_vars, clausulas = encode_sudoku(sudoku, extended)
+    solver = SolverCDCL(num_vars, clausulas)
+    solved = solver.resolver()
+
+    if solved:
+        sudoku.grid = decode_solution(solver.valor, sudoku.size)
+
+    end_time = time.thread_time()
+    return SolveResult(time_seconds=end_time - start_time, iterations=solver.decisoes, solved=solved)
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta puzzles de Sudoku como CNF (DIMACS).")
+    parser.add_argument('size', type=int, help="4, 9, 16, ...")
+    parser.add_argument('puzzle_file', help="arquivo de puzzles (formato '=== Puzzle i/N ===')")
+    parser.add_argument('out_dir', help="diretório de saída para os arquivos .cnf")
+    parser.add_argument('--extended', action='store_true', help="usa a codificação estendida")
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    puzzles = load_puzzles_from_file(args.puzzle_file, args.size)
+    codificacao = "estendida" if args.extended else "mínima"
+
+    for i, sudoku in enumerate(puzzles, 1):
+        num_vars, clausulas = encode_sudoku(sudoku, args.extended)
+        path = os.path.join(args.out_dir, f"puzzle_{i}.cnf")
+        write_dimacs(path, num_vars, clausulas,
+                     f"Sudoku {args.size}x{args.size} - puzzle {i}/{len(puzzles)} ({codificacao})\n"
+                     f"x(r, c, v) = (r * {args.size} + c) * {args.size} + v")
+
+    print(f"✓ {len(puzzles)} arquivos CNF ({codificacao}) salvos em: {args.out_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,30 @@
-import math
 from typing import List, Optional, Tuple
+from geometry import Geometria, dimensoes_bloco, obter_geometria
 
 class Sudoku:
     
-    def __init__(self, size: int):
+    def __init__(self, size: int, geometria: Optional[Geometria] = None):
 
 # inicializa o sudoku vazio 
 
         self.size = size
-        self.box_size = int(math.sqrt(size))
+        self.box_rows, self.box_cols = dimensoes_bloco(size)  # 3x3 no 9x9, 2x3 no 6x6
         self.grid = [[0 for _ in range(size)] for _ in range(size)]
+        # tabelas de unidades e vizinhos, compartilhadas entre tabuleiros do mesmo tamanho
+        # (variantes como X-Sudoku, jigsaw e Killer passam a própria geometria)
+        self.geometria = geometria if geometria is not None else obter_geometria(size)
     
     def is_valid(self, row: int, col: int, num: int) -> bool:
 
-        # Verifica linha
-        if num in self.grid[row]:
+        grid = self.grid
+        if grid[row][col] == num:
             return False
         
-        # Verifica coluna
-        for i in range(self.size):
-            if self.grid[i][col] == num:
+        # Verifica linha, coluna e bloco de uma vez pelos vizinhos pré-computados
+        for r, c in self.geometria.peers[row][col]:
+            if grid[r][c] == num:
                 return False
         
-        box_start_row = row - row % self.box_size
-        box_start_col = col - col % self.box_size
-        
-        for i in range(self.box_size):
-            for j in range(self.box_size):
-                if self.grid[box_start_row + i][box_start_col + j] == num:
-                    return False
-        
         return True
     
     def find_empty_cell(self) -> Optional[Tuple[int, int]]:
@@ -52,6 +47,27 @@ class Sudoku:
                     count += 1
         return count
     
+    def is_solved(self) -> bool:
+
+# verifica se o tabuleiro está completo e sem repetições em linhas, colunas e blocos
+# (e, nas variantes, diagonais e somas das gaiolas)
+        valores = set(range(1, self.size + 1))
+        grid = self.grid
+        for unit in self.geometria.units:
+            if {grid[r][c] for r, c in unit} != valores:
+                return False
+        for gaiola in self.geometria.gaiolas:
+            numeros = [grid[r][c] for r, c in gaiola.celulas]
+            if sum(numeros) != gaiola.soma or len(set(numeros)) != len(numeros):
+                return False
+        return True
+    
+    def copy(self) -> 'Sudoku':
+        """Retorna uma cópia independente do tabuleiro."""
+        sudoku = Sudoku(self.size, self.geometria)
+        sudoku.grid = [row[:] for row in self.grid]
+        return sudoku
+    
     def _num_to_char(self, num: int) -> str:
         """Converte número interno (1-16) para representação externa (1-9, A-G)."""
         if num == 0:
@@ -68,15 +84,32 @@ class Sudoku:
 # imprime o tabuleiro do sudoku formatado
 
         for i in range(self.size):
-            if i % self.box_size == 0 and i != 0:
-                print("-" * (self.size * 2 + self.box_size - 1))
+            if i % self.box_rows == 0 and i != 0:
+                print("-" * (self.size * 2 + self.size // self.box_cols - 1))
             
             for j in range(self.size):
-                if j % self.box_size == 0 and j != 0:
+                if j % self.box_cols == 0 and j != 0:
                     print("| ", end="")
                 print(f"{self._num_to_char(self.grid[i][j])} ", end="")
             print()
     
+    def to_string(self) -> str:
+        """Converte o Sudoku para texto no mesmo formato de sudoku_to_string() em C."""
+        lines = []
+        for i in range(self.size):
+            if i % self.box_rows == 0 and i != 0:
+                lines.append("-" * (self.size * 2 + self.size // self.box_cols - 1))
+            
+            line = ""
+            for j in range(self.size):
+                if j % self.box_cols == 0 and j != 0:
+                    line += " | "
+                elif j > 0:
+                    line += " "
+                line += self._num_to_char(self.grid[i][j])
+            lines.append(line)
+        return "\n".join(lines) + "\n"
+    
     @staticmethod
     def _char_to_num(char: str) -> int:
         """Converte representação externa (1-9, A-G) para número interno (1-16)."""
@@ -109,3 +142,24 @@ class Sudoku:
             row += 1
         
         return sudoku
+
+def load_puzzles_from_file(path: str, size: int) -> List[Sudoku]:
+    """Lê todos os puzzles de um arquivo no formato '=== Puzzle i/N ==='."""
+    with open(path, 'r') as f:
+        content = f.read()
+    
+    puzzles = []
+    for section in content.split("=== Puzzle")[1:]:  # Pula o primeiro (vazio)
+        lines = section.strip().split('\n')
+        if len(lines) > 1:
+            puzzle_str = '\n'.join(lines[1:])  # Remove a linha "=== Puzzle X/N ==="
+            puzzles.append(Sudoku.parse_from_string(puzzle_str, size))
+    return puzzles
+
+def write_puzzles_to_file(path: str, puzzles: List[Sudoku]) -> None:
+    """Escreve puzzles (ou soluções) no formato '=== Puzzle i/N ==='."""
+    with open(path, 'w') as f:
+        for i, sudoku in enumerate(puzzles, 1):
+            f.write(f"=== Puzzle {i}/{len(puzzles)} ===\n")
+            f.write(sudoku.to_string())
+            f.write("\n\n")
@@ -0,0 +1,72 @@
+"""
+Motor 'tabela': escolhe o resolvedor pelo tamanho do tabuleiro.
+
+- 4x4 clássico: consulta às 288 soluções completas do 4x4, sem busca. Para
+  cada célula e valor há uma máscara (um int de 288 bits) das soluções que
+  têm aquele valor naquela célula; o E das máscaras das pistas deixa só as
+  soluções compatíveis com o puzzle, e a de menor índice é copiada para o grid;
+- demais tamanhos: solve_sudoku_iterativo, que já usa o núcleo de máscaras
+  de bits no 9x9 clássico.
+
+A consulta não tem iterações de busca: o log registra 0, como um puzzle já
+completo. Com várias soluções possíveis (o gerador não garante solução
+única), a escolhida pode ser outra que a do backtracking.
+"""
+import time
+from typing import List, Optional, Tuple
+from backtracking import SolveResult, solve_sudoku_iterativo
+from sudoku import Sudoku
+
+_SOLUCOES: List[Tuple[int, ...]] = []
+_MASCARAS: List[List[int]] = []  # [célula][valor] -> soluções com esse valor na célula
+
+def _enumerar_solucoes(grid: List[int], cel: int) -> None:
+    """Preenche _SOLUCOES com todas as soluções 4x4, em ordem lexicográfica."""
+    if cel == 16:
+        _SOLUCOES.append(tuple(grid))
+        return
+    r, c = divmod(cel, 4)
+    b = (r // 2) * 2 + c // 2
+    for num in range(1, 5):
+        if any(grid[i] == num for i in range(16)
+               if i // 4 == r or i % 4 == c or ((i // 8) * 2 + (i % 4) // 2) == b):
+            continue
+        grid[cel] = num
+        _enumerar_solucoes(grid, cel + 1)
+        grid[cel] = 0
+
+def _montar_tabela() -> None:
+    """Monta a tabela na primeira consulta (288 soluções, 16 x 5 máscaras)."""
+    _enumerar_solucoes([0] * 16, 0)
+    _MASCARAS.extend([0] * 5 for _ in range(16))
+    for indice, solucao in enumerate(_SOLUCOES):
+        bit = 1 << indice
+        for cel, num in enumerate(solucao):
+            _MASCARAS[cel][num] |= bit
+
+def consultar_4x4(celulas: List[int]) -> Optional[Tuple[int, ...]]:
+    """Primeira solução compatível com as pistas (0 = vazia), ou None."""
+    if not _SOLUCOES:
+        _montar_tabela()
+    compativeis = (1 << len(_SOLUCOES)) - 1
+    for cel, num in enumerate(celulas):
+        if num:
+            compativeis &= _MASCARAS[cel][num]
+    if not compativeis:
+        return None
+    return _SOLUCOES[(compativeis & -compativeis).bit_length() - 1]
+
+def solve_sudoku_tabela(sudoku: Sudoku) -> SolveResult:
+    """Resolve por consulta no 4x4 clássico e por backtracking nos demais."""
+    if sudoku.size != 4 or not sudoku.geometria.classica:
+        return solve_sudoku_iterativo(sudoku)
+
+    start_time = time.thread_time()
+    grid = sudoku.grid
+    solucao = consultar_4x4([num for row in grid for num in row])
+    if solucao is not None:
+        for r in range(4):
+            grid[r][:] = solucao[r * 4:(r + 1) * 4]
+    end_time = time.thread_time()
+    return SolveResult(time_seconds=end_time - start_time, iterations=0,
+                       solved=solucao is not None)
@@ -0,0 +1,43 @@
+"""
+Módulo de trilha (undo log) para o backtracking.
+
+Toda mutação de estado feita ao avançar é registrada na trilha com o valor
+antigo; ao recuar, exatamente essas mutações são desfeitas, em ordem
+inversa. Assim estruturas incrementais (máscaras de candidatos, contadores,
+ordenações) nunca precisam ser recalculadas a partir do grid, e cada recuo
+custa O(mudanças) em vez de O(tabuleiro).
+"""
+from typing import Any, List, MutableSequence, Tuple
+
+class Trilha:
+    """Pilha de mutações (container, chave, valor_antigo)."""
+
+    __slots__ = ('_entradas',)
+
+    def __init__(self):
+        self._entradas: List[Tuple[MutableSequence, Any, Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def marcar(self) -> int:
+        """Retorna um ponto de retorno para desfazer_ate()."""
+        return len(self._entradas)
+
+    def atribuir(self, container: MutableSequence, chave: Any, valor: Any) -> None:
+        """Executa container[chave] = valor registrando o valor antigo."""
+        self._entradas.append((container, chave, container[chave]))
+        container[chave] = valor
+
+    def desfazer_ate(self, marca: int) -> int:
+        """Desfaz, em ordem inversa, todas as mutações feitas após 'marca'."""
+        entradas = self._entradas
+        desfeitas = len(entradas) - marca
+        while len(entradas) > marca:
+            container, chave, antigo = entradas.pop()
+            container[chave] = antigo
+        return desfeitas
+
+    def limpar(self) -> None:
+        """Descarta o histórico sem desfazer nada."""
+        self._entradas.clear()
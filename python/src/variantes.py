@@ -0,0 +1,244 @@
+"""
+Variantes de Sudoku: X-Sudoku (diagonais), jigsaw (regiões irregulares) e Killer (gaiolas).
+
+Cada variante é um Sudoku com a própria Geometria (veja geometry.py) e é
+resolvida por solve_sudoku_iterativo: X-Sudoku e jigsaw só mudam os vizinhos,
+Killer acrescenta a soma das gaiolas ao filtro de valores.
+
+Os puzzles ficam em JSON, uma lista de objetos:
+
+    {"tipo": "killer", "tamanho": 9,
+     "grid": ["000000000", ...],              # uma string por linha (0 = vazia, 1-9, A-G)
+     "diagonais": true,                       # X-Sudoku
+     "regioes": [[0, 0, 0, 1, ...], ...],     # jigsaw: id da região de cada célula
+     "gaiolas": [{"soma": 15, "celulas": [[0, 0], [0, 1]]}, ...]}
+
+O gerador parte de uma solução válida da variante e apaga células ao acaso;
+a unicidade da solução não é garantida (os puzzles servem para medir o
+solver, como os de puzzle_generator.py).
+
+Uso:
+    python3 variantes.py resolver <arquivo.json>
+    python3 variantes.py gerar <x|jigsaw|killer> <saida.json> [--size 9] [--quantidade 10]
+                               [--vazias N] [--semente 0]
+"""
+import argparse
+import json
+import random
+import sys
+from typing import Any, Dict, List, Optional
+
+from geometry import Gaiola, Geometria, dimensoes_bloco
+from sudoku import Sudoku
+from backtracking import solve_sudoku_iterativo
+from verifier import verify_solution
+
+TIPOS = ('x', 'jigsaw', 'killer')
+
+# ---------------------------------------------------------------------------
+# Leitura e escrita
+# ---------------------------------------------------------------------------
+
+def tipo_variante(geometria: Geometria) -> str:
+    partes = [nome for nome, ativo in (('x', geometria.diagonais), ('jigsaw', geometria.jigsaw),
+                                       ('killer', bool(geometria.gaiolas))) if ativo]
+    return '+'.join(partes) or 'classico'
+
+def sudoku_de_dict(dados: Dict[str, Any]) -> Sudoku:
+    size = dados['tamanho']
+    gaiolas = [Gaiola(tuple(tuple(cell) for cell in g['celulas']), g['soma'])
+               for g in dados.get('gaiolas', [])]
+    geometria = Geometria(size, regioes=dados.get('regioes'), diagonais=dados.get('diagonais', False),
+                          gaiolas=gaiolas)
+    sudoku = Sudoku(size, geometria)
+    for r, linha in enumerate(dados['grid']):
+        sudoku.grid[r] = [Sudoku._char_to_num(ch.upper()) for ch in linha]
+    return sudoku
+
+def dict_de_sudoku(sudoku: Sudoku) -> Dict[str, Any]:
+    geometria = sudoku.geometria
+    dados: Dict[str, Any] = {
+        'tipo': tipo_variante(geometria),
+        'tamanho': sudoku.size,
+        'grid': [''.join(sudoku._num_to_char(num) for num in row) for row in sudoku.grid],
+    }
+    if geometria.diagonais:
+        dados['diagonais'] = True
+    if geometria.jigsaw:
+        dados['regioes'] = geometria.box_id
+    if geometria.gaiolas:
+        dados['gaiolas'] = [{'soma': g.soma, 'celulas': [list(cell) for cell in g.celulas]}
+                            for g in geometria.gaiolas]
+    return dados
+
+def carregar_variantes(path: str) -> List[Sudoku]:
+    with open(path) as f:
+        return [sudoku_de_dict(dados) for dados in json.load(f)]
+
+def salvar_variantes(path: str, puzzles: List[Sudoku]) -> None:
+    with open(path, 'w') as f:
+        json.dump([dict_de_sudoku(sudoku) for sudoku in puzzles], f)
+        f.write('\n')
+
+# ---------------------------------------------------------------------------
+# Geração
+# ---------------------------------------------------------------------------
+
+def _solucao_classica(size: int, aleatorio: random.Random) -> List[List[int]]:
+    """Grid canônico com faixas, pilhas, linhas, colunas e dígitos embaralhados."""
+    br, bc = dimensoes_bloco(size)
+    faixas, pilhas = size // br, size // bc
+    linhas = [faixa * br + r for faixa in aleatorio.sample(range(faixas), faixas)
+              for r in aleatorio.sample(range(br), br)]
+    colunas = [pilha * bc + c for pilha in aleatorio.sample(range(pilhas), pilhas)
+               for c in aleatorio.sample(range(bc), bc)]
+    digitos = aleatorio.sample(range(1, size + 1), size)
+    return [[digitos[(bc * (r % br) + r // br + c) % size] for c in colunas] for r in linhas]
+
+def _vizinhos_ortogonais(r: int, c: int, size: int):
+    for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        if 0 <= r + dr < size and 0 <= c + dc < size:
+            yield r + dr, c + dc
+
+def _conexa(celulas: set, size: int) -> bool:
+    inicio = next(iter(celulas))
+    vistos = {inicio}
+    pilha = [inicio]
+    while pilha:
+        r, c = pilha.pop()
+        for vizinho in _vizinhos_ortogonais(r, c, size):
+            if vizinho in celulas and vizinho not in vistos:
+                vistos.add(vizinho)
+                pilha.append(vizinho)
+    return len(vistos) == len(celulas)
+
+def _regioes_aleatorias(solucao: List[List[int]], aleatorio: random.Random,
+                        trocas: int = 20000) -> List[List[int]]:
+    """
+    Regiões jigsaw para as quais 'solucao' continua válida.
+
+    Parte dos blocos e troca entre regiões vizinhas duas células com o mesmo
+    valor: cada região continua com todos os valores, e a troca só é mantida
+    se as duas regiões continuarem conexas.
+    """
+    size = len(solucao)
+    regioes = [linha[:] for linha in Geometria(size).box_id]
+    for _ in range(trocas):
+        r, c = aleatorio.randrange(size), aleatorio.randrange(size)
+        a = regioes[r][c]
+        fronteira = [regioes[vr][vc] for vr, vc in _vizinhos_ortogonais(r, c, size) if regioes[vr][vc] != a]
+        if not fronteira:
+            continue
+        b = aleatorio.choice(fronteira)
+        br, bc = next((i, j) for i in range(size) for j in range(size)
+                      if regioes[i][j] == b and solucao[i][j] == solucao[r][c])
+        regioes[r][c], regioes[br][bc] = b, a
+        celulas_a = {(i, j) for i in range(size) for j in range(size) if regioes[i][j] == a}
+        celulas_b = {(i, j) for i in range(size) for j in range(size) if regioes[i][j] == b}
+        if not (_conexa(celulas_a, size) and _conexa(celulas_b, size)):
+            regioes[r][c], regioes[br][bc] = a, b  # desfaz
+    return regioes
+
+def _gaiolas_aleatorias(solucao: List[List[int]], aleatorio: random.Random,
+                        tamanho_maximo: int = 4) -> List[Gaiola]:
+    """Divide a solução em gaiolas conexas de até 'tamanho_maximo' células sem valores repetidos."""
+    size = len(solucao)
+    livre = [[True] * size for _ in range(size)]
+    gaiolas = []
+    celulas = [(r, c) for r in range(size) for c in range(size)]
+    aleatorio.shuffle(celulas)
+    for r, c in celulas:
+        if not livre[r][c]:
+            continue
+        alvo = aleatorio.randint(2, tamanho_maximo)
+        gaiola = [(r, c)]
+        valores = {solucao[r][c]}
+        livre[r][c] = False
+        while len(gaiola) < alvo:
+            opcoes = [(vr, vc) for gr, gc in gaiola for vr, vc in _vizinhos_ortogonais(gr, gc, size)
+                      if livre[vr][vc] and solucao[vr][vc] not in valores]
+            if not opcoes:
+                break  # sem vizinha livre: a gaiola fica menor (até de uma célula)
+            vr, vc = aleatorio.choice(opcoes)
+            gaiola.append((vr, vc))
+            valores.add(solucao[vr][vc])
+            livre[vr][vc] = False
+        gaiolas.append(Gaiola(tuple(sorted(gaiola)), sum(valores)))
+    return gaiolas
+
+def gerar_variante(tipo: str, size: int, aleatorio: random.Random, vazias: Optional[int] = None) -> Sudoku:
+    """
+    Gera um puzzle da variante com 'vazias' células vazias.
+
+    Padrão: 5/7 do tabuleiro em X-Sudoku e jigsaw e 8/9 no Killer, onde as
+    somas das gaiolas também restringem (sem nenhuma pista, a busca leva
+    segundos por puzzle).
+    """
+    if tipo == 'x':
+        # Solução da variante: o solver num tabuleiro vazio, com os dígitos embaralhados
+        geometria = Geometria(size, diagonais=True)
+        vazio = Sudoku(size, geometria)
+        if not solve_sudoku_iterativo(vazio).solved:
+            raise ValueError("X-Sudoku vazio sem solução")
+        digitos = aleatorio.sample(range(1, size + 1), size)
+        solucao = [[digitos[num - 1] for num in row] for row in vazio.grid]
+    else:
+        solucao = _solucao_classica(size, aleatorio)
+        if tipo == 'jigsaw':
+            geometria = Geometria(size, regioes=_regioes_aleatorias(solucao, aleatorio))
+        else:
+            geometria = Geometria(size, gaiolas=_gaiolas_aleatorias(solucao, aleatorio))
+    padrao_vazias = size * size * 8 // 9 if tipo == 'killer' else size * size * 5 // 7
+
+    sudoku = Sudoku(size, geometria)
+    sudoku.grid = [row[:] for row in solucao]
+    for i in aleatorio.sample(range(size * size), padrao_vazias if vazias is None else vazias):
+        sudoku.grid[i // size][i % size] = 0
+    return sudoku
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def cmd_resolver(args) -> int:
+    puzzles = carregar_variantes(args.arquivo)
+    invalidas = 0
+    for i, sudoku in enumerate(puzzles, 1):
+        original = sudoku.copy()
+        result = solve_sudoku_iterativo(sudoku)
+        valida = result.solved and verify_solution(sudoku.grid, original.grid, sudoku.geometria).valid
+        invalidas += not valida
+        print(f"  {i:>3} {tipo_variante(sudoku.geometria):<10} {original.count_empty_cells():>4} vazias  "
+              f"{result.time_seconds:.6f}s  {result.iterations:>8} iterações  {'✓' if valida else '✗'}")
+    print(f"\n{len(puzzles) - invalidas}/{len(puzzles)} resolvidos e verificados")
+    return 1 if invalidas else 0
+
+def cmd_gerar(args) -> int:
+    aleatorio = random.Random(args.semente)
+    puzzles = [gerar_variante(args.tipo, args.size, aleatorio, args.vazias) for _ in range(args.quantidade)]
+    salvar_variantes(args.saida, puzzles)
+    print(f"✓ {len(puzzles)} puzzles {args.tipo} {args.size}x{args.size} salvos em {args.saida}")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Variantes de Sudoku (X, jigsaw, Killer).")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    resolver = sub.add_parser('resolver', help="resolve e verifica os puzzles de um arquivo JSON")
+    resolver.add_argument('arquivo')
+    resolver.set_defaults(funcao=cmd_resolver)
+
+    gerar = sub.add_parser('gerar', help="gera puzzles de uma variante")
+    gerar.add_argument('tipo', choices=TIPOS)
+    gerar.add_argument('saida')
+    gerar.add_argument('--size', type=int, default=9)
+    gerar.add_argument('--quantidade', type=int, default=10)
+    gerar.add_argument('--vazias', type=int, default=None)
+    gerar.add_argument('--semente', type=int, default=0)
+    gerar.set_defaults(funcao=cmd_gerar)
+
+    args = parser.parse_args()
+    sys.exit(args.funcao(args))
+
+if __name__ == "__main__":
+    main()
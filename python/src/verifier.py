@@ -0,0 +1,136 @@
+"""
+Módulo de verificação de soluções de Sudoku.
+
+Confere, para um grid ou para um lote de grids, se todas as linhas, colunas e
+blocos contêm exatamente os valores 1..size e se as pistas do puzzle original
+foram preservadas. Com a geometria de uma variante, confere as unidades dela
+(regiões, diagonais) e as somas das gaiolas. Cada unidade é lida de uma vez
+do grid plano com um itemgetter pré-computado, sem laços Python por célula.
+
+Uso como ferramenta de linha de comando:
+    python3 verifier.py <size> <solution_file> [--puzzles <puzzle_file>]
+"""
+import argparse
+import sys
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from geometry import Geometria, obter_geometria
+from sudoku import Sudoku, load_puzzles_from_file
+
+Grid = List[List[int]]
+
+class Verificacao(NamedTuple):
+    """Resultado da verificação de uma solução"""
+    valid: bool
+    complete: bool          # todas as unidades contêm 1..size
+    clues_preserved: bool   # nenhuma pista do puzzle original foi alterada
+
+@lru_cache(maxsize=None)
+def _unit_getters(size: int) -> Tuple[Tuple[Callable, ...], frozenset]:
+    """itemgetters que extraem cada unidade de um grid plano, e o conjunto esperado."""
+    return _unit_getters_geometria(obter_geometria(size))
+
+@lru_cache(maxsize=32)
+def _unit_getters_geometria(geometria: Geometria) -> Tuple[Tuple[Callable, ...], frozenset]:
+    getters = tuple(itemgetter(*unit) for unit in geometria.unit_indices)
+    return getters, frozenset(range(1, geometria.size + 1))
+
+def _gaiolas_ok(flat: Sequence[int], geometria: Geometria) -> bool:
+    for gaiola, indices in zip(geometria.gaiolas, geometria.gaiola_indices):
+        numeros = [flat[i] for i in indices]
+        if sum(numeros) != gaiola.soma or len(set(numeros)) != len(numeros):
+            return False
+    return True
+
+def _flatten(grid: Grid) -> List[int]:
+    return [num for row in grid for num in row]
+
+def verify_flat(flat: Sequence[int], size: int, original: Optional[Sequence[int]] = None,
+                geometria: Optional[Geometria] = None) -> Verificacao:
+    """Verifica um grid plano (size*size valores em ordem de linhas)."""
+    if geometria is None or geometria.classica:
+        getters, valores = _unit_getters(size)
+    else:
+        getters, valores = _unit_getters_geometria(geometria)
+
+    complete = len(flat) == size * size
+    if complete:
+        for getter in getters:
+            if set(getter(flat)) != valores:
+                complete = False
+                break
+    if complete and geometria is not None and geometria.gaiolas:
+        complete = _gaiolas_ok(flat, geometria)
+
+    clues_preserved = True
+    if original is not None:
+        clues_preserved = all(o == 0 or o == v for o, v in zip(original, flat))
+
+    return Verificacao(valid=complete and clues_preserved, complete=complete,
+                       clues_preserved=clues_preserved)
+
+def verify_solution(solution: Grid, original: Optional[Grid] = None,
+                    geometria: Optional[Geometria] = None) -> Verificacao:
+    """Verifica se 'solution' é um preenchimento válido das pistas de 'original'."""
+    size = len(solution)
+    return verify_flat(_flatten(solution), size,
+                       _flatten(original) if original is not None else None, geometria)
+
+def verify_batch(solutions: Sequence[Grid], originals: Optional[Sequence[Grid]] = None) -> List[Verificacao]:
+    """Verifica um lote de soluções (opcionalmente pareadas com os puzzles originais)."""
+    if originals is None:
+        return [verify_solution(solution) for solution in solutions]
+    return [verify_solution(solution, original) for solution, original in zip(solutions, originals)]
+
+def _parse_size(value: str) -> int:
+    """Aceita o tamanho numérico (4, 6, 9, 12, 16) ou os nomes usados no main (small, 6x6, medium, ...)."""
+    nomes = {'small': 4, '6x6': 6, 'medium': 9, '12x12': 12, 'large': 16}
+    if value in nomes:
+        return nomes[value]
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"tamanho inválido: {value}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Valida em lote arquivos de soluções de Sudoku.")
+    parser.add_argument('size', type=_parse_size, help="4, 6, 9, 12, 16 ou small, 6x6, medium, 12x12, large")
+    parser.add_argument('solution_files', nargs='+', help="arquivos de soluções (formato '=== Puzzle i/N ===')")
+    parser.add_argument('--puzzles', default=None,
+                        help="arquivo com os puzzles originais, para conferir as pistas")
+    args = parser.parse_args()
+
+    originals = None
+    if args.puzzles:
+        originals = [sudoku.grid for sudoku in load_puzzles_from_file(args.puzzles, args.size)]
+
+    total_invalidas = 0
+    for path in args.solution_files:
+        solutions = [sudoku.grid for sudoku in load_puzzles_from_file(path, args.size)]
+        resultados = verify_batch(solutions, originals)
+        invalidas = [i for i, r in enumerate(resultados, 1) if not r.valid]
+
+        # Sem par do outro lado (puzzle sem solução ou solução sem puzzle): inválido
+        total = len(resultados)
+        if originals is not None and len(originals) != len(solutions):
+            total = max(len(originals), len(solutions))
+            motivo_sem_par = ("sem solução no arquivo" if len(originals) > len(solutions)
+                              else "sem puzzle original")
+        total_invalidas += len(invalidas) + total - len(resultados)
+
+        validas = len(resultados) - len(invalidas)
+        status = "✓" if validas == total else "✗"
+        print(f"{status} {path}: {validas}/{total} soluções válidas")
+        for i in invalidas:
+            r = resultados[i - 1]
+            motivo = "pistas alteradas" if r.complete else "unidade com valores repetidos ou ausentes"
+            print(f"    Puzzle {i}: {motivo}")
+        for i in range(len(resultados) + 1, total + 1):
+            print(f"    Puzzle {i}: {motivo_sem_par}")
+
+    sys.exit(1 if total_invalidas else 0)
+
+if __name__ == "__main__":
+    main()